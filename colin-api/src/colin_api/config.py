@@ -71,6 +71,11 @@ class _Config:  # pylint: disable=too-few-public-methods
     ORACLE_HOST = os.getenv('ORACLE_HOST', '')
     ORACLE_PORT = int(os.getenv('ORACLE_PORT', '1521'))
     ORACLE_BNI_DB_LINK = os.getenv('ORACLE_BNI_DB_LINK', '')
+    ORACLE_POOL_MIN = int(os.getenv('ORACLE_POOL_MIN', '1'))
+    ORACLE_POOL_MAX = int(os.getenv('ORACLE_POOL_MAX', '10'))
+    ORACLE_POOL_INCREMENT = int(os.getenv('ORACLE_POOL_INCREMENT', '1'))
+    ORACLE_POOL_WAIT_TIMEOUT = int(os.getenv('ORACLE_POOL_WAIT_TIMEOUT', '1500'))
+    ORACLE_POOL_TIMEOUT = int(os.getenv('ORACLE_POOL_TIMEOUT', '3600'))
 
     TESTING = False
     DEBUG = False
@@ -15,12 +15,14 @@
 
 Currently this only provides API versioning information
 """
+from typing import Dict, List
+
 import pycountry
 from flask import current_app
 
 from colin_api.exceptions import AddressNotFoundException
 from colin_api.resources.db import DB
-from colin_api.utils import stringify_list
+from colin_api.utils import bind_chunks, stringify_list
 
 
 class Address:  # pylint: disable=too-many-instance-attributes; need all these fields
@@ -114,6 +116,40 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
             current_app.logger.error(err.with_traceback(None))
             raise AddressNotFoundException(address_id=address_id)
 
+    @classmethod
+    def get_by_address_ids(cls, cursor, address_ids: List) -> Dict:
+        """Return the addresses with the given addr_ids, keyed by addr_id, fetched in as few queries as possible."""
+        address_ids = list(dict.fromkeys(address_id for address_id in address_ids if address_id))
+        addresses = {}
+        if not address_ids:
+            return addresses
+
+        try:
+            if not cursor:
+                cursor = DB.connection.cursor()
+            for placeholders, binds in bind_chunks(address_ids, prefix='address_id'):
+                cursor.execute(f"""
+                    select ADDR_ID, ADDR_LINE_1, ADDR_LINE_2, ADDR_LINE_3, CITY, PROVINCE, COUNTRY_TYPE.FULL_DESC,
+                    POSTAL_CD, DELIVERY_INSTRUCTIONS
+                    from ADDRESS
+                    join COUNTRY_TYPE on ADDRESS.COUNTRY_TYP_CD = COUNTRY_TYPE.COUNTRY_TYP_CD
+                    where ADDR_ID in ({placeholders})
+                    """,
+                               **binds
+                               )
+                description = cursor.description
+                for address in cursor.fetchall():
+                    address = dict(zip([x[0].lower() for x in description], address))
+                    addresses[address['addr_id']] = cls._build_address_obj(address)
+
+        except Exception as err:
+            current_app.logger.error(err.with_traceback(None))
+            raise AddressNotFoundException(address_id=address_ids)
+
+        if missing_ids := [address_id for address_id in address_ids if address_id not in addresses]:
+            raise AddressNotFoundException(address_id=missing_ids[0])
+        return addresses
+
     @classmethod
     def create_new_address(cls, cursor, address_info: dict = None, corp_num: str = None):
         """Get new address id and insert address into address table."""
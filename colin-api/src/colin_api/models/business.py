@@ -18,14 +18,15 @@ Currently this only provides API versioning information
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from flask import current_app
 
 from colin_api.exceptions import BusinessNotFoundException
 from colin_api.models.corp_name import CorpName
 from colin_api.resources.db import DB
-from colin_api.utils import convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time, stringify_list
+from colin_api.utils import (
+    bind_chunks, convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time, stringify_list,)
 
 
 class Business:  # pylint: disable=too-many-instance-attributes
@@ -117,27 +118,28 @@ class Business:  # pylint: disable=too-many-instance-attributes
     @classmethod
     def _get_bn_15s(cls, cursor, identifiers: List) -> Dict:
         """Return a dict of idenifiers mapping to their bn_15 numbers."""
-        bn_15s = {}
-        if not identifiers:
-            return bn_15s
+        return dict(cls._iter_bn_15s(cursor=cursor, identifiers=identifiers))
 
+    @classmethod
+    def _iter_bn_15s(cls, cursor, identifiers: List) -> Iterator[Tuple[str, str]]:
+        """Yield the (identifier, bn_15) of the corps with a bn_15, querying the identifiers a chunk at a time."""
         try:
-            cursor.execute(
-                f"""
-                SELECT corp_num, bn_15
-                FROM corporation
-                WHERE corp_num in ({stringify_list(identifiers)})
-                """
-            )
-
-            for row in cursor.fetchall():
-                row = dict(zip([x[0].lower() for x in cursor.description], row))
-                if row['bn_15']:
-                    bn_15s[f'BC{row["corp_num"]}'] = row['bn_15']
-            return bn_15s
+            for placeholders, binds in bind_chunks(list(dict.fromkeys(identifiers)), prefix='corp_num'):
+                cursor.execute(
+                    f"""
+                    SELECT corp_num, bn_15
+                    FROM corporation
+                    WHERE corp_num in ({placeholders})
+                    """,
+                    **binds
+                )
+                for row in cursor.fetchall():
+                    row = dict(zip([x[0].lower() for x in cursor.description], row))
+                    if row['bn_15']:
+                        yield f'BC{row["corp_num"]}', row['bn_15']
 
         except Exception as err:
-            current_app.logger.error(f'Error in Business: Failed to collect bn_9s for {identifiers}')
+            current_app.logger.error(f'Error in Business: Failed to collect bn_15s for {len(identifiers)} corps')
             raise err
 
     @classmethod
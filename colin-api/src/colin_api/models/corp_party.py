@@ -94,21 +94,30 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         completing_parties = {}
         party_list = []
         description = cursor.description
+        parties = [dict(zip([x[0].lower() for x in description], row)) for row in parties]
+
+        # fetch the founding date and the addresses once for all the parties
+        founding_date = None
+        if any(not row['appointment_dt'] for row in parties):
+            founding_date = Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+        addresses = Address.get_by_address_ids(
+            cursor, [row[key] for row in parties if not cls._is_bad_director(row)
+                     for key in ('delivery_addr_id', 'mailing_addr_id')])
+
         for row in parties:
             party = Party()
             party.title = ''
-            row = dict(zip([x[0].lower() for x in description], row))
             if not row['appointment_dt']:
-                row['appointment_dt'] = Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+                row['appointment_dt'] = founding_date
             party.officer = cls._get_officer(row)
-            if (row.get('party_typ_cd', None) == cls.role_types['Director']) and not row['delivery_addr_id']:
+            if cls._is_bad_director(row):
                 current_app.logger.error(
                     f"Bad director data for {party.officer.get('firstName')} {party.officer.get('lastName')} {corp_num}"
                 )
             else:
                 if row['delivery_addr_id']:
-                    party.delivery_address = Address.get_by_address_id(cursor, row['delivery_addr_id']).as_dict()
-                party.mailing_address = Address.get_by_address_id(cursor, row['mailing_addr_id']).as_dict() \
+                    party.delivery_address = addresses[row['delivery_addr_id']].as_dict()
+                party.mailing_address = addresses[row['mailing_addr_id']].as_dict() \
                     if row['mailing_addr_id'] else party.delivery_address
                 party.appointment_date =\
                     convert_to_json_date(row.get('appointment_dt', None))
@@ -123,6 +132,11 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
             completing_parties = cls.get_completing_parties(cursor, event_id)
         return cls.group_parties(party_list, completing_parties)
 
+    @classmethod
+    def _is_bad_director(cls, row: dict) -> bool:
+        """Return True if the row is a director without a delivery address."""
+        return (row.get('party_typ_cd', None) == cls.role_types['Director']) and not row['delivery_addr_id']
+
     @classmethod
     def group_parties(cls, parties: List['Party'], completing_parties: dict) -> List:
         """Group parties based on roles for LEAR formatting."""
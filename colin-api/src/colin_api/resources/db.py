@@ -15,33 +15,62 @@
 
 These will get initialized by the application.
 """
+import threading
+
 import cx_Oracle
 from flask import _app_ctx_stack, current_app
 
 
 class OracleDB:
-    """Oracle database connection object for re-use in application."""
+    """Oracle database connection object for re-use in application.
+
+    A single session pool is created per process (per Flask app) and shared by all threads.
+    Each app context acquires at most one session from it, which is released back when the context is torn down.
+    """
+
+    POOL_EXTENSION = 'oracle_pool'
 
     def __init__(self, app=None):
         """initializer, supports setting the app context on instantiation."""
+        self._pool_lock = threading.Lock()
         if app is not None:
             self.init_app(app)
 
     def init_app(self, app):
         """Create setup for the extension.
 
+        The pool is warmed up at startup when possible; if Oracle is unreachable it is created on first use.
+
         :param app: Flask app
         :return: naked
         """
         self.app = app
         app.teardown_appcontext(self.teardown)
 
+        if not app.config.get('TESTING'):
+            with app.app_context():
+                try:
+                    self.get_pool()
+                except cx_Oracle.DatabaseError as err:  # pylint:disable=c-extension-no-member
+                    app.logger.warning(f'Unable to create the oracle session pool at startup: {err}')
+
     @staticmethod
-    def teardown():
-        """Oracle session pool cleans up after itself."""
+    def teardown(exception=None):  # pylint: disable=unused-argument; signature required by flask
+        """Release the connection acquired in this app context back to the session pool."""
         ctx = _app_ctx_stack.top
-        if hasattr(ctx, 'oracle_pool'):
-            ctx.oracle_pool.close()
+        connection = getattr(ctx, '_oracle_connection', None)
+        if connection is None:
+            return
+
+        ctx._oracle_connection = None  # pylint: disable = protected-access; need this attribute
+        pool = current_app.extensions.get(OracleDB.POOL_EXTENSION)
+        try:
+            if pool:
+                pool.release(connection)
+            else:
+                connection.close()
+        except cx_Oracle.Error as err:  # pylint:disable=c-extension-no-member
+            current_app.logger.error(f'Error releasing oracle connection: {err}')
 
     @staticmethod
     def _create_pool():
@@ -63,32 +92,60 @@ class OracleDB:
                                      dsn='{0}:{1}/{2}'.format(current_app.config.get('ORACLE_HOST'),
                                                               current_app.config.get('ORACLE_PORT'),
                                                               current_app.config.get('ORACLE_DB_NAME')),
-                                     min=1,
-                                     max=10,
-                                     increment=1,
+                                     min=current_app.config.get('ORACLE_POOL_MIN', 1),
+                                     max=current_app.config.get('ORACLE_POOL_MAX', 10),
+                                     increment=current_app.config.get('ORACLE_POOL_INCREMENT', 1),
                                      connectiontype=cx_Oracle.Connection,  # pylint:disable=c-extension-no-member
                                      threaded=True,
-                                     getmode=cx_Oracle.SPOOL_ATTRVAL_NOWAIT,  # pylint:disable=c-extension-no-member
-                                     waitTimeout=1500,
-                                     timeout=3600,
+                                     # when every session is busy, wait up to waitTimeout ms for one to be released
+                                     getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,  # pylint:disable=c-extension-no-member
+                                     waitTimeout=current_app.config.get('ORACLE_POOL_WAIT_TIMEOUT', 1500),
+                                     timeout=current_app.config.get('ORACLE_POOL_TIMEOUT', 3600),
                                      sessionCallback=init_session,
                                      encoding='UTF-8',
                                      nencoding='UTF-8')
 
+    def get_pool(self):
+        """Return the process wide session pool, creating it on first use.
+
+        Creation is guarded by a lock so concurrent first requests don't each build a pool.
+        """
+        if not (pool := current_app.extensions.get(self.POOL_EXTENSION)):
+            with self._pool_lock:
+                if not (pool := current_app.extensions.get(self.POOL_EXTENSION)):
+                    pool = self._create_pool()
+                    current_app.extensions[self.POOL_EXTENSION] = pool
+        return pool
+
+    def pool_stats(self) -> dict:
+        """Return the statistics of the session pool, or None if it hasn't been created."""
+        if not (pool := current_app.extensions.get(self.POOL_EXTENSION)):
+            return None
+        return {
+            'busy': pool.busy,
+            'increment': pool.increment,
+            'max': pool.max,
+            'min': pool.min,
+            'opened': pool.opened,
+            'timeout': pool.timeout,
+            'waitTimeout': pool.wait_timeout
+        }
+
     @property
     def connection(self):  # pylint: disable=inconsistent-return-statements
         """Create connection property for the NROService.
 
         If this is running in a Flask context,
-        then either get the existing connection pool or create a new one
-        and then return an acquired session
+        then acquire a session from the process wide pool on first access and reuse it for the rest of the context,
+        it is released back to the pool on teardown of the context
         :return: cx_Oracle.connection type
         """
         ctx = _app_ctx_stack.top
         if ctx is not None:
-            if not hasattr(ctx, '_oracle_pool'):
-                ctx._oracle_pool = self._create_pool()  # pylint: disable = protected-access; need this method
-            return ctx._oracle_pool.acquire()  # pylint: disable = protected-access; need this method
+            # pylint: disable = protected-access; need this attribute
+            if getattr(ctx, '_oracle_connection', None) is None:
+                ctx._oracle_connection = self.get_pool().acquire()
+            return ctx._oracle_connection
 
 
 # export instance of this class
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Event info endpoint for colin db."""
-from flask import current_app, jsonify
+from http import HTTPStatus
+
+from flask import current_app, jsonify, request
 from flask_restx import Resource, cors
 
 from colin_api.resources.business import API
@@ -28,7 +30,11 @@ class EventInfo(Resource):
     @staticmethod
     @cors.crossdomain(origin='*')
     def get(corp_type, event_id):
-        """Return all event_ids of the corp_type that are greater than the given event_id."""
+        """Return all event_ids of the corp_type that are greater than the given event_id.
+
+        The events are in event_id order. With the limit param only the first limit events are returned, and the
+        next page is fetched with the last event_id of this one.
+        """
         querystring = ("""
             select event.event_id, corporation.corp_num, corporation.corp_typ_cd, filing.filing_typ_cd
             from event
@@ -36,19 +42,28 @@ class EventInfo(Resource):
             join corporation on EVENT.corp_num = corporation.corp_num
             where corporation.corp_typ_cd = :corp_type
             """)
+        try:
+            limit = int(request.args.get('limit')) if request.args.get('limit') else None
+        except ValueError:
+            return jsonify({'message': 'limit must be a number.'}), HTTPStatus.BAD_REQUEST
+
         try:
             cursor = DB.connection.cursor()
+            binds = {'corp_type': corp_type}
             if event_id != 'earliest':
                 querystring += 'and event.event_id > :max_event_id '
-                cursor.execute(querystring, max_event_id=event_id, corp_type=corp_type)
+                binds['max_event_id'] = event_id
             else:
-                querystring += "and event_timestmp > TO_DATE('2019-03-08', 'yyyy-mm-dd') order by event.event_id asc"
-                cursor.execute(querystring, corp_type=corp_type)
-            event_info = cursor.fetchall()
-            event_list = []
-            for event in event_info:
-                event = dict(zip([x[0].lower() for x in cursor.description], event))
-                event_list.append(event)
+                querystring += "and event_timestmp > TO_DATE('2019-03-08', 'yyyy-mm-dd') "
+            querystring += 'order by event.event_id asc'
+            if limit:
+                querystring = f'select * from ({querystring}) where rownum <= :limit'
+                binds['limit'] = limit
+                # fetch the page from oracle in as few round trips as possible
+                cursor.arraysize = min(limit, 1000)
+            cursor.execute(querystring, **binds)
+            columns = [x[0].lower() for x in cursor.description]
+            event_list = [dict(zip(columns, event)) for event in cursor]
             return jsonify({'events': event_list})
 
         except Exception as err:  # pylint: disable=broad-except; want to catch all errors
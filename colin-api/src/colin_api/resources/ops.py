@@ -56,3 +56,15 @@ class Readyz(Resource):
     def get():
         """Return a JSON object that identifies if the service is setupAnd ready to work."""
         return {'message': 'api is ready'}, 200
+
+
+@API.route('pool')
+class Pool(Resource):
+    """Reports on the state of the oracle session pool."""
+
+    @staticmethod
+    def get():
+        """Return a JSON object with the session pool statistics."""
+        if not (stats := DB.pool_stats()):
+            return {'message': 'pool not created'}, 200
+        return {'pool': stats}, 200
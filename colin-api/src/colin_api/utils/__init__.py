@@ -79,6 +79,21 @@ def stringify_list(list_orig: list) -> str:
     return list_str
 
 
+def bind_chunks(values: list, prefix: str = 'value', chunk_size: int = 1000):
+    """Yield the placeholders and bind values of each chunk of the values, for an IN (...) list.
+
+    Binding the values keeps them out of the sql text, and a chunk stays within the 1000 expressions Oracle allows
+    in an IN list. The last chunk is padded to the next power of two (at most chunk_size) by repeating its last
+    value, so there are only a few distinct sql texts without binding chunk_size values for a short list.
+    """
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        padded_size = min(chunk_size, 1 << (len(chunk) - 1).bit_length())
+        chunk += [chunk[-1]] * (padded_size - len(chunk))
+        binds = {f'{prefix}{i}': value for i, value in enumerate(chunk)}
+        yield ', '.join(f':{name}' for name in binds), binds
+
+
 def delete_from_table_by_event_ids(cursor, event_ids: list, table: str, column: str = 'start_event_id'):
     """Delete rows with given event ids from given table."""
     try:
@@ -19,6 +19,17 @@ from colin_api import create_app
 from colin_api import jwt as _jwt
 
 
+@pytest.fixture
+def benchmark_report(request):
+    """Return a function that writes a benchmark result to the terminal, under the name of the test."""
+    reporter = request.config.pluginmanager.get_plugin('terminalreporter')
+
+    def report(result: str):
+        reporter.write_line(f'{request.node.name}: {result}')
+
+    return report
+
+
 @pytest.fixture(scope='session')
 def app():
     """Return a session-wide application configured in TEST mode."""
@@ -0,0 +1,161 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the process wide oracle session pool.
+
+The cx_Oracle driver is replaced with a stand-in, so these run without access to Oracle.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from colin_api.resources import db as db_module
+from colin_api.resources.db import OracleDB
+from tests import integration_benchmark
+
+
+class MockConnection:
+    """Stand-in for a cx_Oracle connection and its cursor."""
+
+    def cursor(self):
+        """Return a stand-in cursor."""
+        return self
+
+    def execute(self, *args):  # pylint: disable=unused-argument
+        """Run nothing."""
+        return self
+
+
+class MockSessionPool:  # pylint: disable=too-many-instance-attributes
+    """Stand-in for cx_Oracle.SessionPool."""
+
+    created = 0
+    create_seconds = 0
+
+    def __init__(self, **kwargs):
+        """Record the pool settings, simulating the cost of opening the pool and running the session callback."""
+        time.sleep(self.create_seconds)
+        MockSessionPool.created += 1
+        self.getmode = kwargs.get('getmode')
+        self.min = kwargs.get('min')
+        self.max = kwargs.get('max')
+        self.increment = kwargs.get('increment')
+        self.timeout = kwargs.get('timeout')
+        self.wait_timeout = kwargs.get('waitTimeout')
+        self.opened = self.min
+        self.busy = 0
+
+    def acquire(self):
+        """Return a connection."""
+        self.busy += 1
+        return MockConnection()
+
+    def release(self, connection):  # pylint: disable=unused-argument
+        """Return the connection to the pool."""
+        self.busy -= 1
+
+
+class PerContextOracleDB(OracleDB):
+    """The previous behaviour, a new pool for every app context, used as the benchmark baseline."""
+
+    @property
+    def connection(self):
+        """Create a pool for the context and acquire a session from it."""
+        ctx = db_module._app_ctx_stack.top  # pylint: disable=protected-access
+        if not hasattr(ctx, '_oracle_pool'):
+            ctx._oracle_pool = self._create_pool()  # pylint: disable=protected-access
+        return ctx._oracle_pool.acquire()  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def mock_driver(monkeypatch):
+    """Replace the cx_Oracle session pool with the stand-in."""
+    MockSessionPool.created = 0
+    monkeypatch.setattr(db_module.cx_Oracle, 'SessionPool', MockSessionPool)
+    return MockSessionPool
+
+
+def test_pool_created_once_and_released(app_request, mock_driver):
+    """Assert that the pool is shared across contexts and threads and connections are released."""
+    app_request.config['ORACLE_POOL_MIN'] = 2
+    app_request.config['ORACLE_POOL_MAX'] = 5
+    oracle_db = OracleDB(app_request)
+
+    def simulated_request(_):
+        with app_request.app_context():
+            oracle_db.connection.cursor()
+            oracle_db.connection.cursor()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(simulated_request, range(20)))
+
+    assert mock_driver.created == 1
+    with app_request.app_context():
+        stats = oracle_db.pool_stats()
+        pool = oracle_db.get_pool()
+    assert pool.getmode == db_module.cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT
+    assert stats['busy'] == 0
+    assert stats['min'] == 2
+    assert stats['max'] == 5
+
+
+def test_connection_reused_within_context(app_request, mock_driver):
+    """Assert that a context acquires a single session no matter how often the connection is used."""
+    oracle_db = OracleDB(app_request)
+
+    with app_request.app_context():
+        connection = oracle_db.connection
+        assert oracle_db.connection is connection
+        assert oracle_db.pool_stats()['busy'] == 1
+
+    with app_request.app_context():
+        assert oracle_db.connection is not connection
+        assert oracle_db.pool_stats()['busy'] == 1
+
+    with app_request.app_context():
+        assert oracle_db.pool_stats()['busy'] == 0
+
+
+@integration_benchmark
+def test_pool_request_latency(app_request, mock_driver, monkeypatch, benchmark_report):
+    """Report the per request latency with a pool per context and with the process wide pool."""
+    monkeypatch.setattr(mock_driver, 'create_seconds', 0.05)
+    requests = 10
+
+    def request_latency(oracle_db):
+        start = time.perf_counter()
+        for _ in range(requests):
+            with app_request.app_context():
+                oracle_db.connection.cursor()
+        return (time.perf_counter() - start) / requests
+
+    before = request_latency(PerContextOracleDB(app_request))
+    after = request_latency(OracleDB(app_request))
+
+    benchmark_report(f'per request latency, per context pool: {before * 1000:.2f}ms, '
+                     f'process pool: {after * 1000:.2f}ms')
+
+
+def test_ops_pool_stats(app_request, mock_driver):
+    """Assert that the pool statistics are available on the ops endpoint."""
+    with app_request.test_client() as client:
+        rv = client.get('/ops/pool')
+        assert 200 == rv.status_code
+        assert rv.json == {'message': 'pool not created'}
+
+        client.get('/ops/healthz')
+        rv = client.get('/ops/pool')
+        assert 200 == rv.status_code
+        assert rv.json['pool']['busy'] == 0
+        assert rv.json['pool']['max'] == app_request.config['ORACLE_POOL_MAX']
@@ -0,0 +1,165 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the number of oracle round trips doesn't grow with the number of parties and offices.
+
+The oracle connection is replaced with a stand-in that answers the queries from canned rows and counts them,
+so these run without access to Oracle.
+"""
+import datetime
+
+import pytest
+
+from colin_api.models import Business, Office, Party
+from colin_api.resources.db import OracleDB
+
+
+ADDRESS_COLUMNS = ['ADDR_ID', 'ADDR_LINE_1', 'ADDR_LINE_2', 'ADDR_LINE_3', 'CITY', 'PROVINCE', 'FULL_DESC',
+                   'POSTAL_CD', 'DELIVERY_INSTRUCTIONS']
+PARTY_COLUMNS = ['FIRST_NME', 'MIDDLE_NME', 'LAST_NME', 'DELIVERY_ADDR_ID', 'MAILING_ADDR_ID', 'APPOINTMENT_DT',
+                 'CESSATION_DT', 'START_EVENT_ID', 'END_EVENT_ID', 'BUSINESS_NME', 'PARTY_TYP_CD', 'CORP_PARTY_ID']
+OFFICE_COLUMNS = ['START_EVENT_ID', 'END_EVENT_ID', 'MAILING_ADDR_ID', 'DELIVERY_ADDR_ID', 'OFFICE_TYP_CD']
+FOUNDING_DATE = datetime.datetime(2001, 8, 5)
+
+
+class MockCursor:
+    """Stand-in for a cx_Oracle cursor, answering the corp_party, office, address and corporation queries."""
+
+    def __init__(self, connection):
+        """Initialize the cursor."""
+        self.connection = connection
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, **binds):
+        """Record the query and set up its rows."""
+        self.connection.statements.append(query)
+        query = ' '.join(query.lower().split())
+        if 'from completing_party' in query:
+            columns, rows = ['FIRST_NME', 'MIDDLE_NME', 'LAST_NME', 'RECOGNITION_DTS'], []
+        elif 'from corp_party' in query:
+            columns, rows = PARTY_COLUMNS, self.connection.parties
+        elif 'from office' in query:
+            columns, rows = OFFICE_COLUMNS, self.connection.offices
+        elif 'from address' in query:
+            columns = ADDRESS_COLUMNS
+            rows = [(address_id, f'{address_id} MAIN ST', None, None, 'VICTORIA', 'BC', 'CANADA', 'V8W 1A1', None)
+                    for address_id in dict.fromkeys(binds.values())]
+        elif 'select corp_num, bn_15 from corporation' in query:
+            # only the even corp numbers have a business number
+            columns = ['CORP_NUM', 'BN_15']
+            rows = [(corp_num, f'{corp_num}BC0001' if int(corp_num) % 2 == 0 else None)
+                    for corp_num in dict.fromkeys(binds.values())]
+        elif 'from corporation' in query:
+            columns, rows = ['RECOGNITION_DTS'], [(FOUNDING_DATE,)]
+        else:
+            raise AssertionError(f'unexpected query: {query}')
+        self.description = [(column,) for column in columns]
+        self._rows = rows
+        return self
+
+    def fetchall(self):
+        """Return the rows."""
+        return self._rows
+
+    def fetchone(self):
+        """Return the first row."""
+        return self._rows[0] if self._rows else None
+
+
+class MockConnection:
+    """Stand-in for a cx_Oracle connection to a corp with the given number of directors."""
+
+    def __init__(self, num_of_directors):
+        """Set up the rows of the corp."""
+        self.statements = []
+        # directors appointed before COLIN recorded appointment dates fall back to the founding date
+        self.parties = [(f'FIRST{i}', None, f'LAST{i}', 1000 + i, 2000 + i,
+                         None if i % 2 == 0 else datetime.datetime(2019, 1, 1), None, 1, None, None, 'DIR', i)
+                        for i in range(num_of_directors)]
+        self.offices = [(1, None, 3001, 3000, 'RG'), (1, None, None, 3002, 'RC')]
+
+    def cursor(self):
+        """Return a stand-in cursor."""
+        return MockCursor(self)
+
+
+@pytest.fixture
+def oracle(monkeypatch):
+    """Replace the oracle connection with stand-ins, returning a function to set up a corp."""
+    connection = None
+
+    def corp(num_of_directors):
+        nonlocal connection
+        connection = MockConnection(num_of_directors)
+        return connection
+
+    monkeypatch.setattr(OracleDB, 'connection', property(lambda self: connection))
+    return corp
+
+
+@pytest.mark.parametrize('path', ['parties', 'office'])
+def test_endpoint_query_count(app_request, oracle, path):
+    """Assert that the /parties and /office endpoints query the addresses and founding date once per corp."""
+    counts = {}
+    with app_request.test_client() as client:
+        for num_of_directors in (1, 30):
+            connection = oracle(num_of_directors)
+            rv = client.get(f'/api/v1/businesses/CP/CP0001965/{path}')
+
+            assert 200 == rv.status_code
+            counts[num_of_directors] = len(connection.statements)
+            if path == 'parties':
+                assert len(rv.json['directors']) == num_of_directors
+                assert rv.json['directors'][-1]['deliveryAddress']['streetAddress'] == \
+                    f'{1000 + num_of_directors - 1} MAIN ST'
+            else:
+                assert rv.json['recordsOffice']['mailingAddress'] == rv.json['recordsOffice']['deliveryAddress']
+
+    assert counts[1] == counts[30]
+
+
+def test_filing_components_query_count(app_request, oracle):
+    """Assert that the parties and offices of a filing event are built with a fixed number of queries.
+
+    These are the builders get_filing uses for the directors and offices of a filing.
+    """
+    with app_request.app_context():
+        connection = oracle(30)
+        cursor = connection.cursor()
+        parties = Party.get_by_event(cursor=cursor, corp_num='CP0001965', event_id=1)
+        offices = Office.get_by_event(cursor=cursor, event_id=1)
+
+    assert len(parties) == 30
+    assert all(party.appointment_date for party in parties)
+    assert parties[0].appointment_date == '2001-08-05'
+    assert [office.office_type for office in offices] == ['registeredOffice', 'recordsOffice']
+    # parties, completing parties, founding date, addresses, offices and their addresses
+    assert len(connection.statements) == 6
+
+
+def test_bn_15s_query_count(app_request, oracle):
+    """Assert that the bn_15s are looked up with bound corp numbers, a chunk of up to 1000 at a time."""
+    with app_request.app_context():
+        connection = oracle(0)
+        identifiers = [f'{i:07}' for i in range(1, 2501)]
+        bn_15s = Business._get_bn_15s(  # pylint: disable = protected-access; internal call
+            cursor=connection.cursor(),
+            identifiers=identifiers + identifiers[:10]
+        )
+
+    assert len(bn_15s) == 1250
+    assert bn_15s['BC0002500'] == '0002500BC0001'
+    assert 'BC0002499' not in bn_15s
+    assert len(connection.statements) == 3
+    assert all('0002500' not in statement for statement in connection.statements)
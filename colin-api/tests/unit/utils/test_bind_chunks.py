@@ -0,0 +1,40 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the bind_chunks utility.
+
+Test-Suite to ensure that the IN list placeholders come in a few sizes.
+"""
+
+from colin_api.utils import bind_chunks
+
+
+def test_bind_chunks_pads_last_chunk():
+    """Assert that the last chunk is padded to a power of two by repeating a value of the chunk."""
+    chunks = list(bind_chunks(['1', '2', '3', '4', '5', '6', '7'], prefix='corp_num', chunk_size=4))
+
+    assert len(chunks) == 2
+    assert chunks[0][0] == chunks[1][0] == ':corp_num0, :corp_num1, :corp_num2, :corp_num3'
+    assert chunks[0][1] == {'corp_num0': '1', 'corp_num1': '2', 'corp_num2': '3', 'corp_num3': '4'}
+    assert chunks[1][1] == {'corp_num0': '5', 'corp_num1': '6', 'corp_num2': '7', 'corp_num3': '7'}
+
+
+def test_bind_chunks_bucket_sizes():
+    """Assert that the number of placeholders is the next power of two, capped at chunk_size."""
+    def placeholder_count(count):
+        return len(next(bind_chunks(list(range(count)), chunk_size=1000))[1])
+
+    assert [placeholder_count(count) for count in (1, 2, 3, 5, 60, 600, 1000)] == [1, 2, 4, 8, 64, 1000, 1000]
+    assert len({next(bind_chunks(list(range(count)), chunk_size=10))[0] for count in (5, 6, 7, 8)}) == 1
+    assert not list(bind_chunks([], chunk_size=10))
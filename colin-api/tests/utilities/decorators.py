@@ -27,3 +27,6 @@ oracle_integration = pytest.mark.skipif((os.getenv('ORACLE_INTEGRATION_TESTING',
                                         reason='requires access to a test version of Oracle CTST')
 
 skip_in_pod = pytest.mark.skipif((os.getenv('POD_TESTING', False) is False), reason='Skip test when running in pod')
+
+integration_benchmark = pytest.mark.skipif((os.getenv('RUN_BENCHMARK_TESTS', False) is False),
+                                           reason='Benchmarks run when RUN_BENCHMARK_TESTS is set.')
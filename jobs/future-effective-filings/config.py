@@ -85,6 +85,12 @@ class _Config(object):  # pylint: disable=too-few-public-methods
     PASSWORD = os.getenv('AUTH_PASSWORD', '')
     SENTRY_DSN = os.getenv('SENTRY_DSN', '')
 
+    # number of filings to put on the filer queue at the same time
+    PUBLISH_BATCH_SIZE = int(os.getenv('PUBLISH_BATCH_SIZE', '20'))
+    # json file of the filings put on the queue, so they aren't queued again within REQUEUE_AFTER_SECONDS
+    QUEUED_FILINGS_FILE = os.getenv('QUEUED_FILINGS_FILE', None)
+    REQUEUE_AFTER_SECONDS = int(os.getenv('REQUEUE_AFTER_SECONDS', '3600'))
+
     SECRET_KEY = 'a secret'
 
     TESTING = False
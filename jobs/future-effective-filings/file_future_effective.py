@@ -16,14 +16,14 @@
 This module script is for putting filings with future effective dates on the entity filer queue.
 """
 import asyncio
+import json
 import logging
 import os
 import random
-from datetime import datetime, timezone
+import time
 
 import requests
 import sentry_sdk  # noqa: I001; pylint: disable=ungrouped-imports; conflicts with Flake8
-from dateutil.parser import parse
 from dotenv import find_dotenv, load_dotenv
 from entity_queue_common.service import ServiceWorker
 from flask import Flask
@@ -75,17 +75,45 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
 
 
 def get_filings(app: Flask = None):
-    """Get a filing with filing_id."""
-    response = requests.get(f'{app.config["LEGAL_URL"]}/internal/filings/PAID')
+    """Get the ids of the PAID filings whose effective date has come."""
+    response = requests.get(f'{app.config["LEGAL_URL"]}/internal/filings/due')
     if not response or response.status_code != 200:
         app.logger.error(f'Failed to collect filings from legal-api. \
             {response} {response.json()} {response.status_code}')
         raise Exception
-    return response.json()
+    return response.json()['filingIds']
+
+
+def load_queued_filings(app: Flask) -> dict:
+    """Return the filings put on the queue by earlier runs, mapped to when they were queued."""
+    path = app.config.get('QUEUED_FILINGS_FILE')
+    if not path or not os.path.isfile(path):
+        return {}
+    try:
+        with open(path) as queued_file:
+            return {int(filing_id): queued_at for filing_id, queued_at in json.load(queued_file).items()}
+    except (OSError, ValueError) as err:
+        app.logger.error(f'Ignoring unreadable queued filings file {path}: {err}')
+        return {}
+
+
+def save_queued_filings(app: Flask, queued_filings: dict):
+    """Save the filings put on the queue, for the next run."""
+    path = app.config.get('QUEUED_FILINGS_FILE')
+    if not path:
+        return
+    # write a new file and swap it in, so a crash never leaves a partly written file
+    with open(f'{path}.tmp', 'w') as queued_file:
+        json.dump(queued_filings, queued_file)
+    os.replace(f'{path}.tmp', path)
 
 
 async def run(loop, application: Flask = None):  # pylint: disable=redefined-outer-name
-    """Run the methods for applying future effective filings."""
+    """Run the methods for applying future effective filings.
+
+    The due filings are put on the filer queue PUBLISH_BATCH_SIZE at a time. A filing queued by an earlier run
+    that is still waiting for the filer isn't queued again until REQUEUE_AFTER_SECONDS have passed.
+    """
     if application is None:
         application = create_app()
 
@@ -100,22 +128,35 @@ async def run(loop, application: Flask = None):  # pylint: disable=redefined-out
 
     with application.app_context():
         try:
-            filings = get_filings(app=application)
-            if not filings:
+            filing_ids = list(dict.fromkeys(get_filings(app=application)))
+            if not filing_ids:
                 application.logger.debug('No PAID filings found to apply.')
-            for filing in filings:
-                filing_id = filing['filing']['header']['filingId']
-                effective_date = filing['filing']['header']['effectiveDate']
-                # NB: effective_date and now are both UTC
-                now = datetime.utcnow().replace(tzinfo=timezone.utc)
-                valid = effective_date and parse(effective_date) <= now
-                if valid:
-                    msg = {'filing': {'id': filing_id}}
-                    await queue_service.publish(subject, msg)
-                    application.logger.debug(f'Successfully put filing {filing_id} on the queue.')
+
+            now = time.time()
+            requeue_after = application.config.get('REQUEUE_AFTER_SECONDS', 3600)
+            # the filings no longer due have been filed, so only the due ones are remembered
+            queued_filings = {filing_id: queued_at for filing_id, queued_at in load_queued_filings(application).items()
+                              if filing_id in filing_ids}
+            to_queue = [filing_id for filing_id in filing_ids
+                        if now - queued_filings.get(filing_id, 0) >= requeue_after]
+            if len(to_queue) < len(filing_ids):
+                application.logger.debug(f'{len(filing_ids) - len(to_queue)} due filings are already queued.')
+
+            batch_size = application.config.get('PUBLISH_BATCH_SIZE', 20)
+            try:
+                for start in range(0, len(to_queue), batch_size):
+                    batch = to_queue[start:start + batch_size]
+                    await asyncio.gather(*[queue_service.publish(subject, {'filing': {'id': filing_id}})
+                                           for filing_id in batch])
+                    for filing_id in batch:
+                        queued_filings[filing_id] = now
+                    application.logger.debug(f'Successfully put filings {batch} on the queue.')
+            finally:
+                save_queued_filings(application, queued_filings)
         except Exception as err:  # pylint: disable=broad-except
             application.logger.error(err)
 
+
 if __name__ == '__main__':
     application = create_app()
     try:
@@ -50,6 +50,13 @@ class _Config(object):  # pylint: disable=too-few-public-methods
     LEGAL_URL = os.getenv('LEGAL_URL', '')
     SENTRY_DSN = os.getenv('SENTRY_DSN', '')
 
+    # number of businesses to sync at the same time, the filings of a business are always synced in order
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))
+    # 0 for no limit
+    COLIN_REQUESTS_PER_SECOND = float(os.getenv('COLIN_REQUESTS_PER_SECOND', '5'))
+    # json file of the filings created in colin whose colin ids are yet to be updated in legal
+    CHECKPOINT_FILE = os.getenv('CHECKPOINT_FILE', None)
+
     ACCOUNT_SVC_AUTH_URL = os.getenv('ACCOUNT_SVC_AUTH_URL', None)
     ACCOUNT_SVC_CLIENT_ID = os.getenv('ACCOUNT_SVC_CLIENT_ID', None)
     ACCOUNT_SVC_CLIENT_SECRET = os.getenv('ACCOUNT_SVC_CLIENT_SECRET', None)
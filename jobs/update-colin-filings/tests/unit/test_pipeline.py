@@ -0,0 +1,69 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the rate limiter and checkpoint of the filing sync pipeline."""
+import json
+
+from utils.pipeline import Checkpoint, RateLimiter  # noqa: I001; pylint: disable=import-error
+
+
+def test_rate_limiter_spaces_calls(mocker):
+    """Assert that the calls are spaced out by the interval of the rate, without sleeping before the first."""
+    clock = mocker.patch('utils.pipeline.time')
+    clock.monotonic.return_value = 100.0
+    rate_limiter = RateLimiter(2)
+
+    for _ in range(3):
+        rate_limiter.wait()
+
+    assert rate_limiter.interval == 0.5
+    assert [args[0] for args, _ in clock.sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_rate_limiter_no_limit(mocker):
+    """Assert that a rate of 0 never waits."""
+    clock = mocker.patch('utils.pipeline.time')
+    clock.monotonic.return_value = 100.0
+    rate_limiter = RateLimiter(0)
+
+    for _ in range(3):
+        rate_limiter.wait()
+
+    clock.sleep.assert_not_called()
+
+
+def test_checkpoint_persists(tmp_path):
+    """Assert that the filings created in colin are saved until their colin ids are updated in legal."""
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(path)
+    checkpoint.add(1, [101])
+    checkpoint.add(2, [102, 103])
+    checkpoint.remove(1)
+
+    with open(path) as checkpoint_file:
+        assert json.load(checkpoint_file) == {'2': [102, 103]}
+
+    reloaded = Checkpoint(path)
+    assert len(reloaded) == 1
+    assert reloaded.get(1) is None
+    assert reloaded.get('2') == [102, 103]
+
+
+def test_checkpoint_in_memory():
+    """Assert that a checkpoint without a path works without writing a file."""
+    checkpoint = Checkpoint(None)
+    checkpoint.add(1, [101])
+
+    assert checkpoint.get(1) == [101]
+    checkpoint.remove(1)
+    assert not len(checkpoint)
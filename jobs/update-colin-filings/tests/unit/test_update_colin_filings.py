@@ -0,0 +1,119 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the filings of each business are synced with colin in order."""
+import update_colin_filings
+from update_colin_filings import run, sync_business_filings
+from utils.pipeline import Checkpoint, RateLimiter, StageTimings  # noqa: I001; pylint: disable=import-error
+
+
+def create_filings(identifier, filing_ids):
+    """Return the filings of a business, as returned by the legal api."""
+    return [{'filingId': filing_id,
+             'filing': {'header': {'name': 'annualReport'}, 'business': {'identifier': identifier}}}
+            for filing_id in filing_ids]
+
+
+def create_pipeline(checkpoint=None):
+    """Return a pipeline without a rate limit."""
+    return {
+        'checkpoint': checkpoint or Checkpoint(None),
+        'rate_limiter': RateLimiter(0),
+        'timings': StageTimings()
+    }
+
+
+def test_sync_business_filings(app, mocker):
+    """Assert that the filings are sent to colin and their colin ids updated in legal, in order."""
+    send_filing = mocker.patch.object(update_colin_filings, 'send_filing',
+                                      side_effect=lambda app, filing, filing_id: [filing_id + 1000])
+    update_colin_id = mocker.patch.object(update_colin_filings, 'update_colin_id', return_value=True)
+    pipeline = create_pipeline()
+
+    result = sync_business_filings(app, create_filings('CP1234567', [1, 2, 3]), 'token', pipeline)
+
+    assert result == {'synced': 3, 'failed': 0, 'skipped': 0}
+    assert [kwargs['filing_id'] for _, kwargs in send_filing.call_args_list] == [1, 2, 3]
+    assert [(kwargs['filing_id'], kwargs['colin_ids']) for _, kwargs in update_colin_id.call_args_list] == \
+        [(1, [1001]), (2, [1002]), (3, [1003])]
+    assert not len(pipeline['checkpoint'])
+    assert pipeline['timings'].summary()['send']['count'] == 3
+
+
+def test_sync_business_filings_stops_at_failure(app, mocker):
+    """Assert that the filings after one that fails to be created in colin are skipped."""
+    send_filing = mocker.patch.object(update_colin_filings, 'send_filing',
+                                      side_effect=lambda app, filing, filing_id: None if filing_id == 2 else [1001])
+    update_colin_id = mocker.patch.object(update_colin_filings, 'update_colin_id', return_value=True)
+
+    result = sync_business_filings(app, create_filings('CP1234567', [1, 2, 3, 4]), 'token', create_pipeline())
+
+    assert result == {'synced': 1, 'failed': 1, 'skipped': 2}
+    assert [kwargs['filing_id'] for _, kwargs in send_filing.call_args_list] == [1, 2]
+    assert update_colin_id.call_count == 1
+
+
+def test_sync_business_filings_checkpoint(app, mocker):
+    """Assert that a filing whose colin ids fail to update is kept in the checkpoint and only updated next time."""
+    send_filing = mocker.patch.object(update_colin_filings, 'send_filing', return_value=[1001])
+    update_colin_id = mocker.patch.object(update_colin_filings, 'update_colin_id', return_value=False)
+    checkpoint = Checkpoint(None)
+    filings = create_filings('CP1234567', [1, 2])
+
+    result = sync_business_filings(app, filings, 'token', create_pipeline(checkpoint))
+
+    assert result == {'synced': 0, 'failed': 1, 'skipped': 1}
+    assert checkpoint.get(1) == [1001]
+
+    # the next run updates the colin ids without creating the filing in colin again
+    send_filing.reset_mock()
+    send_filing.return_value = [1002]
+    update_colin_id.reset_mock()
+    update_colin_id.return_value = True
+
+    result = sync_business_filings(app, filings, 'token', create_pipeline(checkpoint))
+
+    assert result == {'synced': 2, 'failed': 0, 'skipped': 0}
+    assert [kwargs['filing_id'] for _, kwargs in send_filing.call_args_list] == [2]
+    assert [(kwargs['filing_id'], kwargs['colin_ids']) for _, kwargs in update_colin_id.call_args_list] == \
+        [(1, [1001]), (2, [1002])]
+    assert not len(checkpoint)
+
+
+def test_run_keeps_order_per_business(app, mocker):
+    """Assert that the businesses are synced concurrently, each one's filings in order and held back on a failure."""
+    filings = []
+    for filing_id in range(1, 31):
+        # interleave the filings of the businesses, as the legal api returns them in filing order
+        filings.extend(create_filings(f'CP000000{filing_id % 3}', [filing_id]))
+    sent = []
+
+    def send_filing(app, filing, filing_id):
+        sent.append((filing['filing']['business']['identifier'], filing_id))
+        return None if filing_id == 14 else [filing_id + 1000]
+
+    mocker.patch.dict(app.config, {'MAX_WORKERS': 3, 'COLIN_REQUESTS_PER_SECOND': 0, 'CHECKPOINT_FILE': None})
+    mocker.patch.object(update_colin_filings, 'create_app', return_value=app)
+    mocker.patch.object(update_colin_filings.AccountService, 'get_bearer_token', return_value='token')
+    mocker.patch.object(update_colin_filings, 'get_filings', return_value=filings)
+    mocker.patch.object(update_colin_filings, 'send_filing', side_effect=send_filing)
+    mocker.patch.object(update_colin_filings, 'update_colin_id', return_value=True)
+
+    run()
+
+    for identifier in ('CP0000000', 'CP0000001', 'CP0000002'):
+        filing_ids = [filing_id for sent_identifier, filing_id in sent if sent_identifier == identifier]
+        assert filing_ids == sorted(filing_ids)
+    # filing 14 of CP0000002 failed, so its later filings were not sent
+    assert [filing_id for identifier, filing_id in sent if identifier == 'CP0000002'] == [2, 5, 8, 11, 14]
+    assert len([identifier for identifier, _ in sent if identifier != 'CP0000002']) == 20
@@ -17,6 +17,7 @@ This module is the API for the Legal Entity system.
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 import sentry_sdk  # noqa: I001; pylint: disable=ungrouped-imports; conflicts with Flake8
@@ -27,6 +28,7 @@ from sentry_sdk.integrations.logging import LoggingIntegration  # noqa: I001
 
 import config  # pylint: disable=import-error; false positive in gha only
 from utils.logging import setup_logging  # noqa: I001; pylint: disable=import-error; false positive in gha only
+from utils.pipeline import Checkpoint, RateLimiter, StageTimings  # noqa: I001; pylint: disable=import-error
 # noqa: 1005
 setup_logging(os.path.join(
     os.path.abspath(os.path.dirname(__file__)), 'logging.conf'))
@@ -116,38 +118,95 @@ def clean_none(dictionary: dict = None):
             dictionary[key] = ''
 
 
+def sync_business_filings(app: Flask, filings: list, token: dict, pipeline: dict) -> dict:
+    # pylint: disable=no-member; false positive
+    """Send the filings of one business to colin in order, stopping at the first one that fails.
+
+    The later filings of a business are held back after a failure so they are never applied out of order in colin.
+    """
+    result = {'synced': 0, 'failed': 0, 'skipped': 0}
+    checkpoint = pipeline['checkpoint']
+    timings = pipeline['timings']
+    for index, filing in enumerate(filings):
+        filing_id = filing['filingId']
+        colin_ids = checkpoint.get(filing_id)
+        if colin_ids:
+            app.logger.debug(f'Filing {filing_id} already created in colin, updating its colin ids.')
+        else:
+            pipeline['rate_limiter'].wait()
+            with timings.time('send'):
+                colin_ids = send_filing(app=app, filing=filing, filing_id=filing_id)
+            if colin_ids:
+                checkpoint.add(filing_id, colin_ids)
+
+        update = None
+        if colin_ids:
+            with timings.time('update'):
+                update = update_colin_id(app=app, filing_id=filing_id, colin_ids=colin_ids, token=token)
+        if update:
+            checkpoint.remove(filing_id)
+            result['synced'] += 1
+            app.logger.debug(f'Successfully updated filing {filing_id}')
+        else:
+            result['failed'] += 1
+            result['skipped'] = len(filings) - index - 1
+            app.logger.error(f'Failed to update filing {filing_id} with colin event id.')
+            if result['skipped']:
+                app.logger.debug(f'Skipping {result["skipped"]} filings for'
+                                 f' {filing["filing"]["business"]["identifier"]}.')
+            break
+    return result
+
+
 def run():
-    """Get filings that haven't been synced with colin and send them to the colin-api."""
+    """Get filings that haven't been synced with colin and send them to the colin-api.
+
+    The businesses are synced concurrently by up to MAX_WORKERS threads, each sending the filings of a business in
+    order, with the calls to colin limited to COLIN_REQUESTS_PER_SECOND.
+    """
     application = create_app()
-    corps_with_failed_filing = []
     with application.app_context():
         try:
             # get updater-job token
             token = AccountService.get_bearer_token()
 
-            filings = get_filings(app=application)
+            pipeline = {
+                'checkpoint': Checkpoint(application.config['CHECKPOINT_FILE']),
+                'rate_limiter': RateLimiter(application.config['COLIN_REQUESTS_PER_SECOND']),
+                'timings': StageTimings()
+            }
+            with pipeline['timings'].time('get_filings'):
+                filings = get_filings(app=application)
             if not filings:
                 # pylint: disable=no-member; false positive
                 application.logger.debug('No completed filings to send to colin.')
+                return
+
+            # keep the order of the filings of each business
+            business_filings = {}
             for filing in filings:
-                filing_id = filing['filingId']
-                identifier = filing['filing']['business']['identifier']
-                if identifier in corps_with_failed_filing:
-                    # pylint: disable=no-member; false positive
-                    application.logger.debug(f'Skipping filing {filing_id} for'
-                                             f' {filing["filing"]["business"]["identifier"]}.')
-                else:
-                    colin_ids = send_filing(app=application, filing=filing, filing_id=filing_id)
-                    update = None
-                    if colin_ids:
-                        update = update_colin_id(app=application, filing_id=filing_id, colin_ids=colin_ids, token=token)
-                    if update:
+                business_filings.setdefault(filing['filing']['business']['identifier'], []).append(filing)
+
+            totals = {'synced': 0, 'failed': 0, 'skipped': 0}
+            with ThreadPoolExecutor(max_workers=application.config['MAX_WORKERS']) as executor:
+                futures = {executor.submit(sync_business_filings, application, corp_filings, token, pipeline):
+                           identifier for identifier, corp_filings in business_filings.items()}
+                for future in as_completed(futures):
+                    try:
+                        for key, value in future.result().items():
+                            totals[key] += value
+                    except Exception as err:  # noqa: B902
                         # pylint: disable=no-member; false positive
-                        application.logger.debug(f'Successfully updated filing {filing_id}')
-                    else:
-                        corps_with_failed_filing.append(filing['filing']['business']['identifier'])
-                        # pylint: disable=no-member; false positive
-                        application.logger.error(f'Failed to update filing {filing_id} with colin event id.')
+                        totals['failed'] += 1
+                        application.logger.error(f'Failed to sync the filings of {futures[future]}: {err}')
+
+            # pylint: disable=no-member; false positive
+            application.logger.info(f'Synced {totals["synced"]} filings of {len(business_filings)} businesses with'
+                                    f' colin, {totals["failed"]} failed and {totals["skipped"]} skipped.'
+                                    f' Stage latencies (seconds): {pipeline["timings"].summary()}')
+            if len(pipeline['checkpoint']):
+                application.logger.error(f'{len(pipeline["checkpoint"])} filings created in colin are waiting to'
+                                         ' have their colin ids updated in legal.')
 
         except Exception as err:  # noqa: B902
             # pylint: disable=no-member; false positive
@@ -0,0 +1,126 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Helpers for running the filing sync as a concurrent pipeline.
+
+RateLimiter spaces out the calls to colin, Checkpoint remembers the filings created in colin whose colin ids
+haven't been saved in legal yet, and StageTimings collects the latency of each stage for the run summary.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class RateLimiter:
+    """Allow up to rate calls per second across all the threads."""
+
+    def __init__(self, rate: float):
+        """Initialize the limiter, a rate of 0 means no limit."""
+        self.interval = 1 / rate if rate else 0
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self.interval
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+class Checkpoint:
+    """The colin ids of the filings created in colin but not yet updated in legal, saved to a json file.
+
+    A filing in the checkpoint is only updated in legal on the next run, rather than created in colin again.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """Load the checkpoint file, no path keeps the checkpoint in memory only."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._colin_ids: Dict[str, List[int]] = {}
+        if path and os.path.isfile(path):
+            with open(path) as checkpoint_file:
+                self._colin_ids = json.load(checkpoint_file)
+
+    def get(self, filing_id) -> Optional[List[int]]:
+        """Return the colin ids of the filing if it was created in colin by an earlier attempt."""
+        with self._lock:
+            return self._colin_ids.get(str(filing_id))
+
+    def add(self, filing_id, colin_ids: List[int]):
+        """Record that the filing was created in colin."""
+        with self._lock:
+            self._colin_ids[str(filing_id)] = colin_ids
+            self._save()
+
+    def remove(self, filing_id):
+        """Record that the colin ids of the filing are in legal."""
+        with self._lock:
+            if self._colin_ids.pop(str(filing_id), None) is not None:
+                self._save()
+
+    def __len__(self):
+        """Return the number of filings waiting to be updated in legal."""
+        return len(self._colin_ids)
+
+    def _save(self):
+        if not self.path:
+            return
+        # write a new file and swap it in, so a crash never leaves a partly written checkpoint
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump(self._colin_ids, checkpoint_file)
+        os.replace(temp_path, self.path)
+
+
+class StageTimings:
+    """The latencies of each stage of the pipeline."""
+
+    def __init__(self):
+        """Initialize with no timings."""
+        self._lock = threading.Lock()
+        self._timings: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def time(self, stage: str):
+        """Time the block as a run of the stage."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self._timings.setdefault(stage, []).append(elapsed)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Return the count, average, median, 95th percentile and max seconds of each stage."""
+        summary = {}
+        with self._lock:
+            for stage, timings in self._timings.items():
+                timings = sorted(timings)
+                summary[stage] = {
+                    'count': len(timings),
+                    'avg': round(sum(timings) / len(timings), 3),
+                    'p50': round(timings[(len(timings) - 1) // 2], 3),
+                    'p95': round(timings[int((len(timings) - 1) * 0.95)], 3),
+                    'max': round(timings[-1], 3)
+                }
+        return summary
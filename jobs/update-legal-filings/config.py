@@ -50,6 +50,11 @@ class _Config(object):  # pylint: disable=too-few-public-methods
     LEGAL_URL = os.getenv('LEGAL_URL', '')
     SENTRY_DSN = os.getenv('SENTRY_DSN', '')
 
+    # number of colin events to check against legal at a time
+    EVENT_PAGE_SIZE = int(os.getenv('EVENT_PAGE_SIZE', '1000'))
+    # number of businesses to look up tax ids for at a time
+    TAX_ID_PAGE_SIZE = int(os.getenv('TAX_ID_PAGE_SIZE', '1000'))
+
     ACCOUNT_SVC_AUTH_URL = os.getenv('ACCOUNT_SVC_AUTH_URL', None)
     ACCOUNT_SVC_CLIENT_ID = os.getenv('ACCOUNT_SVC_CLIENT_ID', None)
     ACCOUNT_SVC_CLIENT_SECRET = os.getenv('ACCOUNT_SVC_CLIENT_SECRET', None)
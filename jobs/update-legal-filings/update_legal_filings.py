@@ -69,16 +69,23 @@ def register_shellcontext(app):
 
 
 def check_for_manual_filings(application: Flask = None, token: dict = None):
-    # pylint: disable=redefined-outer-name, disable=too-many-branches
-    """Check for colin filings in oracle."""
+    # pylint: disable=redefined-outer-name, disable=too-many-branches, too-many-locals
+    """Check for colin filings in oracle.
+
+    The colin events are paged through EVENT_PAGE_SIZE at a time, and each page is checked against legal in one
+    call, so a catch up run costs a few calls per page rather than per event.
+    """
     id_list = []
-    colin_events = None
     legal_url = application.config['LEGAL_URL']
     colin_url = application.config['COLIN_URL']
+    page_size = application.config['EVENT_PAGE_SIZE']
+    headers = {'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
     corp_types = [Business.TypeCodes.COOP.value, Business.TypeCodes.BC_COMP.value,
                   Business.TypeCodes.ULC_COMP.value, Business.TypeCodes.CCC_COMP.value]
     no_corp_num_prefix_in_colin = [Business.TypeCodes.BC_COMP.value, Business.TypeCodes.ULC_COMP.value,
                                    Business.TypeCodes.CCC_COMP.value]
+    # whether each corp is loaded into legal db
+    corps_in_legal = {}
 
     # get max colin event_id from legal
     response = requests.get(f'{legal_url}/internal/filings/colin_id')
@@ -93,53 +100,66 @@ def check_for_manual_filings(application: Flask = None, token: dict = None):
         if last_event_id:
             last_event_id = str(last_event_id)
             # get all event_ids greater than above
-            try:
-                for corp_type in corp_types:
-                    # call colin api for ids + filing types list
-                    response = requests.get(f'{colin_url}/event/{corp_type}/{last_event_id}')
-                    event_info = dict(response.json())
-                    events = event_info.get('events')
+            for corp_type in corp_types:
+                after_event_id = last_event_id
+                while True:
+                    try:
+                        # call colin api for the next page of ids + filing types
+                        response = requests.get(f'{colin_url}/event/{corp_type}/{after_event_id}',
+                                                params={'limit': page_size})
+                        events = dict(response.json()).get('events')
+                    except Exception as err:
+                        application.logger.error('Error getting event_ids from colin')
+                        raise err
+                    if not events:
+                        break
                     if corp_type in no_corp_num_prefix_in_colin:
                         append_corp_num_prefixes(events, 'BC')
-                    if colin_events:
-                        colin_events.get('events').extend(events)
-                    else:
-                        colin_events = event_info
 
-            except Exception as err:
-                application.logger.error('Error getting event_ids from colin')
-                raise err
+                    id_list.extend(get_events_not_in_legal(events, corps_in_legal, headers, application))
+
+                    if len(events) < page_size:
+                        break
+                    after_event_id = str(events[-1]['event_id'])
 
             # for bringing in a specific filing
             # global SET_EVENTS_MANUALLY
             # SET_EVENTS_MANUALLY = True
-            # colin_events = {
-            #     'events': [
-            #           {'corp_num': 'CP0001489', 'event_id': 102127109, 'filing_typ_cd': 'OTCGM'}
-            #           {'corp_num': 'BC0702216', 'event_id': 6580760, 'filing_typ_cd': 'ANNBC'},
-            #       ]
-            # }
-
-            # for each event_id: if not in legal db table then add event_id to list
-            for info in colin_events['events']:
-                # check that event is associated with one of the coops loaded into legal db
-                response = requests.get(
-                    f'{legal_url}/{info["corp_num"]}',
-                    headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
-                )
-                if response.status_code == 200:
-                    # check legal table
-                    response = requests.get(f'{legal_url}/internal/filings/colin_id/{info["event_id"]}')
-                    if response.status_code == 404:
-                        id_list.append(info)
-                    elif response.status_code != 200:
-                        application.logger.error(f'Error checking for colin id {info["event_id"]} in legal')
-                else:
-                    application.logger.error('No ids returned from colin_last_update table in legal db.')
+            # id_list = [
+            #     {'corp_num': 'CP0001489', 'event_id': 102127109, 'filing_typ_cd': 'OTCGM'}
+            #     {'corp_num': 'BC0702216', 'event_id': 6580760, 'filing_typ_cd': 'ANNBC'},
+            # ]
 
     return id_list
 
 
+def get_events_not_in_legal(events: list, corps_in_legal: dict, headers: dict, application: Flask) -> list:
+    # pylint: disable=redefined-outer-name
+    """Return the events of corps loaded into legal db that aren't in the legal db yet."""
+    legal_url = application.config['LEGAL_URL']
+
+    # check that event is associated with one of the corps loaded into legal db
+    for corp_num in sorted({info['corp_num'] for info in events} - corps_in_legal.keys()):
+        response = requests.get(f'{legal_url}/{corp_num}', headers=headers)
+        corps_in_legal[corp_num] = response.status_code == 200
+    events = [info for info in events if corps_in_legal[info['corp_num']]]
+    if not events:
+        return []
+
+    # check legal table
+    response = requests.post(
+        f'{legal_url}/internal/filings/colin_id/known',
+        json={'colinIds': [info['event_id'] for info in events]},
+        headers=headers
+    )
+    if response.status_code != 200:
+        application.logger.error(f'Error checking for colin ids {events[0]["event_id"]}-{events[-1]["event_id"]} '
+                                 'in legal')
+        return []
+    known_colin_ids = set(response.json()['colinIds'])
+    return [info for info in events if info['event_id'] not in known_colin_ids]
+
+
 def append_corp_num_prefixes(events, corp_num_prefix):
     """Append corp num prefix to Colin corp num to make Lear compatible."""
     for event in events:
@@ -267,29 +287,41 @@ async def send_emails(tax_ids: dict, application: Flask):  # pylint: disable=red
 
 
 async def update_business_nos(application):  # pylint: disable=redefined-outer-name
-    """Update the tax_ids for corps with new bn_15s."""
+    """Update the tax_ids for corps with new bn_15s.
+
+    The businesses with outstanding tax_ids are paged through in identifier order, so each page is a bounded
+    lookup in colin.
+    """
     try:
         # get updater-job token
         token = AccountService.get_bearer_token()
+        headers = {'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
+        page_size = application.config['TAX_ID_PAGE_SIZE']
+        after = None
+        updated = 0
+
+        while True:
+            # get identifiers with outstanding tax_ids
+            application.logger.debug(f'Getting businesses with outstanding tax ids after {after} from legal api...')
+            response = requests.get(
+                application.config['LEGAL_URL'] + '/internal/tax_ids',
+                params={'limit': page_size, 'after': after} if after else {'limit': page_size},
+                headers=headers
+            )
+            if response.status_code != 200:
+                application.logger.error('legal-updater failed to get identifiers from legal-api.')
+                raise Exception
+            identifiers = response.json()
+            if not identifiers['identifiers']:
+                break
 
-        # get identifiers with outstanding tax_ids
-        application.logger.debug('Getting businesses with outstanding tax ids from legal api...')
-        response = requests.get(
-            application.config['LEGAL_URL'] + '/internal/tax_ids',
-            headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
-        )
-        if response.status_code != 200:
-            application.logger.error('legal-updater failed to get identifiers from legal-api.')
-            raise Exception
-        identifiers = response.json()
-
-        if identifiers['identifiers']:
             # get tax ids that exist for above entities
-            application.logger.debug(f'Getting tax ids for {identifiers["identifiers"]} from colin api...')
+            application.logger.debug(f'Getting tax ids for {len(identifiers["identifiers"])} businesses '
+                                     'from colin api...')
             response = requests.get(
                 application.config['COLIN_URL'] + '/internal/tax_ids',
                 json=identifiers,
-                headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
+                headers=headers
             )
             if response.status_code != 200:
                 application.logger.error('legal-updater failed to get tax_ids from colin-api.')
@@ -301,19 +333,20 @@ async def update_business_nos(application):  # pylint: disable=redefined-outer-n
                 response = requests.post(
                     application.config['LEGAL_URL'] + '/internal/tax_ids',
                     json=tax_ids,
-                    headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
+                    headers=headers
                 )
                 if response.status_code != 201:
                     application.logger.error('legal-updater failed to update tax_ids in lear.')
                     raise Exception
 
                 await send_emails(tax_ids, application)
+                updated += len(tax_ids)
 
-                application.logger.debug('Successfully updated tax ids in lear.')
-            else:
-                application.logger.debug('No tax ids in colin to update in lear.')
-        else:
-            application.logger.debug('No businesses in lear with outstanding tax ids.')
+            if len(identifiers['identifiers']) < page_size:
+                break
+            after = identifiers['identifiers'][-1]
+
+        application.logger.debug(f'Successfully updated {updated} tax ids in lear.')
 
     except Exception as err:
         application.logger.error(err)
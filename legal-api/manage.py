@@ -50,6 +50,41 @@ def list_routes():
         print(line)
 
 
+@MANAGER.option('-b', '--batch-size', dest='batch_size', type=int, default=100)
+def backfill_revision_snapshots(batch_size=100):
+    """Store the business revision snapshot of every completed filing that doesn't have one."""
+    from legal_api.models import BusinessRevisionSnapshot, Filing
+    from legal_api.services import VersionedBusinessDetailsService
+
+    last_id = 0
+    saved = 0
+    while True:
+        filing_ids = [filing_id for filing_id, in db.session.query(Filing.id).
+                      outerjoin(BusinessRevisionSnapshot, BusinessRevisionSnapshot.filing_id == Filing.id).
+                      filter(Filing.id > last_id).
+                      filter(Filing._status == Filing.Status.COMPLETED.value).  # pylint: disable=protected-access
+                      filter(Filing._filing_type.in_(  # pylint: disable=protected-access
+                          VersionedBusinessDetailsService.SNAPSHOT_FILING_TYPES)).
+                      filter(Filing.transaction_id.isnot(None)).
+                      filter(BusinessRevisionSnapshot.id.is_(None)).
+                      order_by(Filing.id).
+                      limit(batch_size).
+                      all()]
+        if not filing_ids:
+            break
+
+        for filing_id in filing_ids:
+            try:
+                if VersionedBusinessDetailsService.save_revision_snapshot(filing_id):
+                    db.session.commit()
+                    saved += 1
+            except Exception as err:  # pylint: disable=broad-except; skip the filing, it falls back to live
+                db.session.rollback()
+                logging.log(logging.ERROR, f'Unable to snapshot filing {filing_id}: {err}')
+        last_id = filing_ids[-1]
+        print(f'saved {saved} revision snapshots, up to filing {last_id}')
+
+
 if __name__ == '__main__':
     logging.log(logging.INFO, 'Running the Manager')
     MANAGER.run()
@@ -0,0 +1,26 @@
+"""request_tracker_next_retry
+
+Revision ID: 7c3d4e5f6a81
+Revises: 6b2d3c4e5f70
+Create Date: 2022-06-13 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3d4e5f6a81'
+down_revision = '6b2d3c4e5f70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('request_tracker', sa.Column('next_retry_date', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_request_tracker_next_retry_date'), 'request_tracker', ['next_retry_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_request_tracker_next_retry_date'), table_name='request_tracker')
+    op.drop_column('request_tracker', 'next_retry_date')
@@ -0,0 +1,41 @@
+"""party_normalized_name
+
+Revision ID: 8d4e5f6a7b92
+Revises: 7c3d4e5f6a81
+Create Date: 2022-06-20 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4e5f6a7b92'
+down_revision = '7c3d4e5f6a81'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('parties', sa.Column('normalized_name', sa.String(length=150), nullable=True))
+    op.add_column('parties_version', sa.Column('normalized_name', sa.String(length=150), nullable=True))
+
+    # same as Party.name
+    op.execute("""
+        UPDATE parties
+        SET normalized_name = CASE
+            WHEN party_type = 'person'
+                THEN upper(trim(concat_ws(' ', first_name, nullif(middle_initial, ''), last_name)))
+            ELSE upper(trim(organization_name))
+        END
+    """)
+
+    op.create_index(op.f('ix_parties_normalized_name'), 'parties', ['normalized_name'], unique=False)
+    op.create_index(op.f('ix_party_roles_business_id'), 'party_roles', ['business_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_party_roles_business_id'), table_name='party_roles')
+    op.drop_index(op.f('ix_parties_normalized_name'), table_name='parties')
+    op.drop_column('parties_version', 'normalized_name')
+    op.drop_column('parties', 'normalized_name')
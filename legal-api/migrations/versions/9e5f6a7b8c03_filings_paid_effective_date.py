@@ -0,0 +1,25 @@
+"""filings_paid_effective_date
+
+Revision ID: 9e5f6a7b8c03
+Revises: 8d4e5f6a7b92
+Create Date: 2022-06-27 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e5f6a7b8c03'
+down_revision = '8d4e5f6a7b92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_filings_paid_effective_date', 'filings', ['status', 'effective_date'], unique=False,
+                    postgresql_where=sa.text("status = 'PAID'"))
+
+
+def downgrade():
+    op.drop_index('ix_filings_paid_effective_date', table_name='filings')
@@ -25,9 +25,11 @@ from registry_schemas.flask import SchemaServices  # noqa: I001
 
 from legal_api import config, models
 from legal_api.models import db
+from legal_api.reports import warm_up_templates
 from legal_api.resources import endpoints
 from legal_api.schemas import rsbc_schemas
 from legal_api.services import flags, queue
+from legal_api.services.http_client import http_client
 from legal_api.translations import babel
 from legal_api.utils.auth import jwt
 from legal_api.utils.logging import setup_logging
@@ -56,9 +58,13 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     rsbc_schemas.init_app(app)
     flags.init_app(app)
     queue.init_app(app)
+    http_client.init_app(app)
     babel.init_app(app)
     endpoints.init_app(app)
 
+    if app.config.get('REPORT_TEMPLATE_WARM_UP'):
+        warm_up_templates(app)
+
     setup_jwt_manager(app, jwt)
 
     register_shellcontext(app)
@@ -63,10 +63,31 @@ class _Config():  # pylint: disable=too-few-public-methods
     LEGAL_API_BASE_URL = os.getenv('LEGAL_API_BASE_URL', 'https://LEGAL_API_BASE_URL/api/v1/businesses')
     PAYMENT_SVC_URL = os.getenv('PAYMENT_SVC_URL', 'http://PAYMENT_BASE/api/v1/payment-request')
     AUTH_SVC_URL = os.getenv('AUTH_SVC_URL', 'http://')
+    # roles looked up from the auth service are kept briefly, denials for less time; 0 turns the cache off
+    AUTHZ_CACHE_TTL = int(os.getenv('AUTHZ_CACHE_TTL', '30'))
+    AUTHZ_CACHE_DENIED_TTL = int(os.getenv('AUTHZ_CACHE_DENIED_TTL', '5'))
+    AUTHZ_CACHE_MAXSIZE = int(os.getenv('AUTHZ_CACHE_MAXSIZE', '1000'))
     REPORT_SVC_URL = os.getenv('REPORT_SVC_URL', 'http://')
+    # pay-api lookups for the task list run concurrently; with partial failure on, a failed lookup doesn't fail the list
+    TASK_LIST_PAY_MAX_WORKERS = int(os.getenv('TASK_LIST_PAY_MAX_WORKERS', '5'))
+    TASK_LIST_PAY_PARTIAL_FAILURE = os.getenv('TASK_LIST_PAY_PARTIAL_FAILURE', 'False').lower() == 'true'
     REPORT_TEMPLATE_PATH = os.getenv('REPORT_PATH', 'report-templates')
+    # assemble the report templates at app start, and reload them when their files change (dev only)
+    REPORT_TEMPLATE_WARM_UP = os.getenv('REPORT_TEMPLATE_WARM_UP', 'True').lower() == 'true'
+    REPORT_TEMPLATE_CHECK_MTIME = os.getenv('REPORT_TEMPLATE_CHECK_MTIME', 'False').lower() == 'true'
+    # cache the rendered outputs of completed filings in 'minio' or on 'disk', off if not set
+    REPORT_CACHE_STORE = os.getenv('REPORT_CACHE_STORE', '')
+    REPORT_CACHE_DISK_PATH = os.getenv('REPORT_CACHE_DISK_PATH', '/tmp/legal-api-report-cache')
     FONTS_PATH = os.getenv('FONTS_PATH', 'fonts')
 
+    # outbound calls to the other services share pooled keep-alive connections
+    HTTP_CLIENT_POOL_CONNECTIONS = int(os.getenv('HTTP_CLIENT_POOL_CONNECTIONS', '10'))
+    HTTP_CLIENT_POOL_MAXSIZE = int(os.getenv('HTTP_CLIENT_POOL_MAXSIZE', '20'))
+    HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv('HTTP_CLIENT_CONNECT_TIMEOUT', '5'))
+    HTTP_CLIENT_READ_TIMEOUT = float(os.getenv('HTTP_CLIENT_READ_TIMEOUT', '20'))
+    HTTP_CLIENT_RETRIES = int(os.getenv('HTTP_CLIENT_RETRIES', '3'))
+    HTTP_CLIENT_BACKOFF_FACTOR = float(os.getenv('HTTP_CLIENT_BACKOFF_FACTOR', '0.1'))
+
     GO_LIVE_DATE = os.getenv('GO_LIVE_DATE')
 
     SENTRY_DSN = os.getenv('SENTRY_DSN', None)
@@ -142,6 +163,8 @@ class _Config():  # pylint: disable=too-few-public-methods
     NAICS_YEAR = int(os.getenv('NAICS_YEAR', '2022'))
     # determines which version of NAICS data will be used to drive NAICS search
     NAICS_VERSION = int(os.getenv('NAICS_VERSION', '1'))
+    # search the NAICS data with the in memory index rather than with ILIKE queries
+    NAICS_SEARCH_INDEX_ENABLED = os.getenv('NAICS_SEARCH_INDEX_ENABLED', 'True').lower() == 'true'
 
     NAICS_API_URL = os.getenv('NAICS_API_URL', 'https://NAICS_API_URL/api/v2/naics')
 
@@ -154,6 +177,7 @@ class DevConfig(_Config):  # pylint: disable=too-few-public-methods
 
     TESTING = False
     DEBUG = True
+    REPORT_TEMPLATE_CHECK_MTIME = os.getenv('REPORT_TEMPLATE_CHECK_MTIME', 'True').lower() == 'true'
 
 
 class TestConfig(_Config):  # pylint: disable=too-few-public-methods
@@ -164,6 +188,9 @@ class TestConfig(_Config):  # pylint: disable=too-few-public-methods
 
     DEBUG = True
     TESTING = True
+    REPORT_TEMPLATE_WARM_UP = False
+    AUTHZ_CACHE_TTL = 0
+    AUTHZ_CACHE_DENIED_TTL = 0
     # POSTGRESQL
     DB_USER = os.getenv('DATABASE_TEST_USERNAME', '')
     DB_PASSWORD = os.getenv('DATABASE_TEST_PASSWORD', '')
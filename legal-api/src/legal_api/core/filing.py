@@ -24,6 +24,7 @@ from typing import Dict, List, Optional
 from flask import current_app, url_for
 from flask_jwt_oidc import JwtManager
 from sqlalchemy import desc
+from sqlalchemy.orm import joinedload, selectinload
 
 from legal_api.core.meta import FilingMeta
 from legal_api.core.utils import diff_dict, diff_list
@@ -348,19 +349,27 @@ class Filing:
 
         business = Business.find_by_internal_id(business_id)
 
-        query = FilingStorage.query.filter(FilingStorage.business_id == business_id)
+        # load the related rows up front, so the number of queries doesn't grow with the size of the ledger
+        query = FilingStorage.query.filter(FilingStorage.business_id == business_id). \
+            options(joinedload(FilingStorage.filing_submitter),
+                    joinedload(FilingStorage.parent_filing),
+                    selectinload(FilingStorage.children))
         if statuses and isinstance(statuses, List):
             query = query.filter(FilingStorage._status.in_(statuses))  # pylint: disable=protected-access;required by SA
 
+        query = query.order_by(desc(FilingStorage.filing_date))
+
         if start:
             query = query.offset(start)
         if size:
             query = query.limit(size)
 
-        query = query.order_by(desc(FilingStorage.filing_date))
+        filings = query.all()
+        comments_counts = FilingStorage.get_comments_counts([filing.id for filing in filings])
+        business_revisions = VersionedBusinessDetailsService.get_business_revisions(business)
 
         ledger = []
-        for filing in query.all():
+        for filing in filings:
 
             submitter_displayname = REDACTED_STAFF_SUBMITTER
             if (submitter := filing.filing_submitter) \
@@ -371,7 +380,7 @@ class Filing:
             ledger_filing = {
                 'availableOnPaperOnly': filing.paper_only,
                 'businessIdentifier': business.identifier,
-                'displayName': FilingMeta.display_name(business, filing=filing),
+                'displayName': FilingMeta.display_name(business, filing=filing, business_revisions=business_revisions),
                 'effectiveDate': filing.effective_date,
                 'filingId': filing.id,
                 'name': filing.filing_type,
@@ -380,7 +389,7 @@ class Filing:
                 'submitter': submitter_displayname,
                 'submittedDate': filing._filing_date,  # pylint: disable=protected-access
 
-                **Filing.common_ledger_items(business.identifier, filing),
+                **Filing.common_ledger_items(business.identifier, filing, comments_counts.get(filing.id, 0)),
             }
             # correction
             if filing.parent_filing:
@@ -401,14 +410,19 @@ class Filing:
         return ledger
 
     @staticmethod
-    def common_ledger_items(business_identifier: str, filing_storage: FilingStorage) -> dict:
-        """Return attributes and links that also get included in T-business filings."""
+    def common_ledger_items(business_identifier: str,
+                            filing_storage: FilingStorage,
+                            comments_count: Optional[int] = None) -> dict:
+        """Return attributes and links that also get included in T-business filings.
+
+        comments_count can be supplied when it has already been fetched in bulk.
+        """
         no_output_filing_types = ['Involuntary Dissolution', 'conversion']
         base_url = current_app.config.get('LEGAL_API_BASE_URL')
         filing = Filing()
         filing._storage = filing_storage  # pylint: disable=protected-access
         return {
-            'commentsCount': filing_storage.comments_count,
+            'commentsCount': filing_storage.comments_count if comments_count is None else comments_count,
             'commentsLink': f'{base_url}/{business_identifier}/filings/{filing_storage.id}/comments',
             'documentsLink': f'{base_url}/{business_identifier}/filings/{filing_storage.id}/documents' if
             filing_storage.filing_type not in no_output_filing_types else None,
@@ -258,8 +258,15 @@ class FilingMeta:  # pylint: disable=too-few-public-methods
     """Create all the information about a filing."""
 
     @staticmethod
-    def display_name(business: Business, filing: FilingStorage, full_name: bool = True) -> Optional[str]:
-        """Return the name of the filing to display on outputs."""
+    def display_name(business: Business,
+                     filing: FilingStorage,
+                     full_name: bool = True,
+                     business_revisions: Optional[list] = None) -> Optional[str]:
+        """Return the name of the filing to display on outputs.
+
+        business_revisions, if supplied, is the preloaded list from VersionService.get_business_revisions
+        and is used instead of querying the business revision for the filing.
+        """
         # if there is no lookup
         if not (names := FILINGS.get(filing.filing_type, {}).get('displayName')):
             return ' '.join(word.capitalize()
@@ -268,9 +275,13 @@ class FilingMeta:  # pylint: disable=too-few-public-methods
 
         business_revision = business
         # retrieve business revision at time of filing so legal type is correct when returned for display name
-        if filing.transaction_id and \
-                (bus_rev_temp := VersionService.get_business_revision_obj(filing.transaction_id, business)):
-            business_revision = bus_rev_temp
+        if filing.transaction_id:
+            if business_revisions is not None:
+                bus_rev_temp = VersionService.find_business_revision(business_revisions, filing.transaction_id)
+            else:
+                bus_rev_temp = VersionService.get_business_revision_obj(filing.transaction_id, business)
+            if bus_rev_temp:
+                business_revision = bus_rev_temp
 
         if isinstance(names, MutableMapping):
             name = names.get(business_revision.legal_type)
@@ -282,7 +293,9 @@ class FilingMeta:  # pylint: disable=too-few-public-methods
 
         elif filing.filing_type in ('correction') and filing.meta_data:
             with suppress(Exception):
-                name = f'{name} - {FilingMeta.display_name(business_revision, filing.children[0], False)}'
+                corrected_name = FilingMeta.display_name(business_revision, filing.children[0], False,
+                                                         business_revisions)
+                name = f'{name} - {corrected_name}'
 
         if full_name and filing.parent_filing_id and filing.status == FilingStorage.Status.CORRECTED:
             name = f'{name} - Corrected'
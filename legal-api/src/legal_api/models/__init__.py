@@ -17,6 +17,7 @@ from .db import db  # noqa: I001
 from .address import Address
 from .alias import Alias
 from .business import Business  # noqa: I001
+from .business_revision_snapshot import BusinessRevisionSnapshot
 from .colin_update import ColinLastUpdate
 from .comment import Comment
 from .corp_type import CorpType
@@ -25,6 +26,7 @@ from .filing import Filing
 from .naics_element import NaicsElement
 from .naics_structure import NaicsStructure
 from .office import Office, OfficeType
+from .outbox_message import OutboxMessage
 from .party_role import Party, PartyRole
 from .registration_bootstrap import RegistrationBootstrap
 from .request_tracker import RequestTracker
@@ -35,6 +37,7 @@ from .user import User, UserRoles
 
 
 __all__ = ('db',
-           'Address', 'Alias', 'Business', 'ColinLastUpdate', 'Comment', 'CorpType', 'Document',
-           'Filing', 'Office', 'OfficeType', 'Party', 'RegistrationBootstrap', 'RequestTracker', 'Resolution',
-           'PartyRole', 'ShareClass', 'ShareSeries', 'User', 'UserRoles', 'NaicsStructure', 'NaicsElement')
+           'Address', 'Alias', 'Business', 'BusinessRevisionSnapshot', 'ColinLastUpdate', 'Comment', 'CorpType',
+           'Document', 'Filing', 'Office', 'OfficeType', 'OutboxMessage', 'Party', 'RegistrationBootstrap',
+           'RequestTracker', 'Resolution', 'PartyRole', 'ShareClass', 'ShareSeries', 'User', 'UserRoles',
+           'NaicsStructure', 'NaicsElement')
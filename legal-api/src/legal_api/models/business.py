@@ -405,13 +405,21 @@ class Business(db.Model):  # pylint: disable=too-many-instance-attributes
         return business
 
     @classmethod
-    def get_all_by_no_tax_id(cls):
-        """Return all businesses with no tax_id."""
+    def get_all_by_no_tax_id(cls, after_identifier: str = None, limit: int = None):
+        """Return the businesses with no tax_id, in identifier order.
+
+        Pass the last identifier of a page as after_identifier to get the next page of up to limit businesses.
+        """
         no_tax_id_types = Business.LegalTypes.COOP.value
         tax_id_types = [x.value for x in Business.LegalTypes]
         tax_id_types.remove(no_tax_id_types)
-        businesses = cls.query.filter(Business.legal_type.in_(tax_id_types)).filter_by(tax_id=None).all()
-        return businesses
+        query = cls.query.filter(Business.legal_type.in_(tax_id_types)).filter_by(tax_id=None)
+        if after_identifier:
+            query = query.filter(Business._identifier > after_identifier)
+        query = query.order_by(Business._identifier)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
     @classmethod
     def get_filing_by_id(cls, business_identifier: int, filing_id: str):
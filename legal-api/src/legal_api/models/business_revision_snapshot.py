@@ -0,0 +1,63 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This model holds the business-as-of-transaction snapshot of a completed filing.
+
+The snapshot is the versioned filing json (without the header) that VersionedBusinessDetailsService
+would otherwise rebuild from the version tables on every request.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import JSONB
+
+from .db import db
+
+
+class BusinessRevisionSnapshot(db.Model):
+    """This class manages the immutable revision snapshots of completed filings.
+
+    This class does NOT have a continuum shadow, snapshots are only ever created or invalidated.
+    """
+
+    __tablename__ = 'business_revision_snapshots'
+    __table_args__ = (db.UniqueConstraint('filing_id', 'transaction_id', name='business_revision_snapshots_uk'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    transaction_id = db.Column('transaction_id', db.BigInteger, nullable=False)
+    revision_json = db.Column('revision_json', JSONB, nullable=False)
+    creation_date = db.Column('creation_date', db.DateTime(timezone=True), default=datetime.utcnow)
+
+    # parent keys
+    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), index=True)
+    filing_id = db.Column('filing_id', db.Integer, db.ForeignKey('filings.id'), nullable=False, index=True)
+
+    def save(self):
+        """Save the object to the database immediately."""
+        db.session.add(self)
+        db.session.commit()
+
+    def save_to_session(self):
+        """Save toThe session, do not commit immediately."""
+        db.session.add(self)
+
+    @classmethod
+    def find_by_filing(cls, filing_id: int, transaction_id: int) -> BusinessRevisionSnapshot:
+        """Return the snapshot of the filing at the transaction."""
+        return cls.query.filter_by(filing_id=filing_id, transaction_id=transaction_id).one_or_none()
+
+    @classmethod
+    def delete_by_filing(cls, filing_id: int) -> int:
+        """Delete all the snapshots of the filing, in the session, and return the number removed."""
+        return cls.query.filter_by(filing_id=filing_id).delete(synchronize_session=False)
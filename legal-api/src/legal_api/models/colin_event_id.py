@@ -15,6 +15,7 @@
 
 The ColinEventId class and Schema are held in this module.
 """
+from typing import List
 
 from .db import db
 
@@ -47,3 +48,13 @@ class ColinEventId(db.Model):  # pylint: disable=too-few-public-methods
         colin_event_id_obj =\
             db.session.query(ColinEventId).filter(ColinEventId.colin_event_id == colin_id).one_or_none()
         return colin_event_id_obj
+
+    @staticmethod
+    def get_known_colin_ids(colin_ids: List[int]) -> List[int]:
+        """Return the ones of the given colin ids that are linked to a filing."""
+        if not colin_ids:
+            return []
+        rows = db.session.query(ColinEventId.colin_event_id). \
+            filter(ColinEventId.colin_event_id.in_(colin_ids)). \
+            all()
+        return [row.colin_event_id for row in rows]
@@ -24,7 +24,7 @@ from sqlalchemy.orm import backref
 from legal_api.exceptions import BusinessException
 
 from .db import db
-from .user import User
+from .user import User  # noqa: I001,F401 pylint: disable=unused-import; needed by SQLAlchemy relationship
 
 
 class Comment(db.Model):
@@ -52,11 +52,10 @@ class Comment(db.Model):
     @property
     def json(self):
         """Return the json repressentation of a comment."""
-        user = User.find_by_id(self.staff_id)
         return {
             'comment': {
                 'id': self.id,
-                'submitterDisplayName': user.display_name if user else None,
+                'submitterDisplayName': self.staff.display_name if self.staff else None,
                 'comment': self.comment,
                 'filingId': self.filing_id,
                 'businessId': self.business_id,
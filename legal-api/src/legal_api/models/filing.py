@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 """Filings are legal documents that alter the state of a business."""
+from __future__ import annotations
+
 import copy
 from datetime import date, datetime
 from enum import Enum
 from http import HTTPStatus
-from typing import List
+from typing import Iterable, List, Optional
 
-from sqlalchemy import desc, event, func, inspect, or_, select
+from sqlalchemy import desc, event, func, inspect, or_, select, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import backref
+from sqlalchemy.orm import backref, joinedload
 
 from legal_api.exceptions import BusinessException
 from legal_api.models.colin_event_id import ColinEventId
@@ -29,6 +31,7 @@ from legal_api.schemas import rsbc_schemas
 
 from .db import db  # noqa: I001
 from .comment import Comment  # noqa: I001,F401,I003 pylint: disable=unused-import; needed by SQLAlchemy relationship
+from .user import User  # noqa: I001,I003
 
 
 class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -223,6 +226,11 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
             'transaction_id'
         ]
     }
+    __table_args__ = (
+        # the PAID filings waiting for their effective date, see get_due_filing_ids
+        db.Index('ix_filings_paid_effective_date', 'status', 'effective_date',
+                 postgresql_where=text("status = 'PAID'")),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     _completion_date = db.Column('completion_date', db.DateTime(timezone=True))
@@ -438,21 +446,20 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @property
     def is_corrected(self):
         """Has this filing been corrected."""
-        if (
-                self.parent_filing and
-                self.parent_filing.filing_type == Filing.FILINGS['correction'].get('name') and
-                self.parent_filing.status == Filing.Status.COMPLETED.value
-        ):
-            return True
-        return False
+        return Filing._is_correction_in_status(self.parent_filing, Filing.Status.COMPLETED.value)
 
     @property
     def is_correction_pending(self):
         """Is there a pending correction for this filing."""
+        return Filing._is_correction_in_status(self.parent_filing, Filing.Status.PENDING_CORRECTION.value)
+
+    @staticmethod
+    def _is_correction_in_status(filing: Optional[Filing], status: str) -> bool:
+        """Return True if the filing is a correction with the given status."""
         if (
-                self.parent_filing and
-                self.parent_filing.filing_type == Filing.FILINGS['correction'].get('name') and
-                self.parent_filing.status == Filing.Status.PENDING_CORRECTION.value
+                filing and
+                filing.filing_type == Filing.FILINGS['correction'].get('name') and
+                filing.status == status
         ):
             return True
         return False
@@ -469,48 +476,134 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
                 label('comments_count')
                 )
 
+    @staticmethod
+    def get_comments_counts(filing_ids: List[int]) -> dict:
+        """Return a dict of filing id to comment count for all the filing ids, using a single grouped query."""
+        if not filing_ids:
+            return {}
+        counts = db.session.query(Comment.filing_id, func.count(Comment.id)). \
+            filter(Comment.filing_id.in_(filing_ids)). \
+            group_by(Comment.filing_id). \
+            all()
+        return dict(counts)
+
     # json serializer
     @property
     def json(self):
         """Return a json representation of this object."""
         try:
             json_submission = copy.deepcopy(self.filing_json)
-            json_submission['filing']['header']['date'] = self._filing_date.isoformat()
-            json_submission['filing']['header']['filingId'] = self.id
-            json_submission['filing']['header']['name'] = self.filing_type
-            json_submission['filing']['header']['status'] = self.status
-            json_submission['filing']['header']['availableOnPaperOnly'] = self.paper_only
-            json_submission['filing']['header']['inColinOnly'] = self.colin_only
-            json_submission['filing']['header']['deletionLocked'] = self.deletion_locked
-
-            if self.effective_date:  # pylint: disable=using-constant-test
-                json_submission['filing']['header']['effectiveDate'] = self.effective_date.isoformat()  # noqa: E501 pylint: disable=no-member, line-too-long
-            if self._payment_status_code:
-                json_submission['filing']['header']['paymentStatusCode'] = self.payment_status_code
-            if self._payment_token:
-                json_submission['filing']['header']['paymentToken'] = self.payment_token
-            if self.submitter_id:
-                json_submission['filing']['header']['submitter'] = self.filing_submitter.username
-            if self.payment_account:
-                json_submission['filing']['header']['paymentAccount'] = self.payment_account
-
-            # add colin_event_ids
-            json_submission['filing']['header']['colinIds'] = ColinEventId.get_by_filing_id(self.id)
-
-            # add comments
-            json_submission['filing']['header']['comments'] = [comment.json for comment in self.comments]
-
-            # add affected filings list
-            json_submission['filing']['header']['affectedFilings'] = [filing.id for filing in self.children]
-
-            # add corrected flags
-            json_submission['filing']['header']['isCorrected'] = self.is_corrected
-            json_submission['filing']['header']['isCorrectionPending'] = self.is_correction_pending
-
+            json_submission['filing']['header'].update(
+                self._header_json(colin_ids=ColinEventId.get_by_filing_id(self.id),
+                                  comments=self.comments,
+                                  affected_filings=[filing.id for filing in self.children],
+                                  submitter=self.filing_submitter if self.submitter_id else None,
+                                  parent_filing=self.parent_filing))
             return json_submission
         except Exception as err:  # noqa: B901, E722
             raise KeyError from err
 
+    def _header_json(self,  # pylint: disable=too-many-arguments; the related rows are fetched by the caller
+                     colin_ids: List[int],
+                     comments: Iterable[Comment],
+                     affected_filings: List[int],
+                     submitter: Optional[User],
+                     parent_filing: Optional[Filing]) -> dict:
+        """Return the header fields that come from the columns of this filing and its related rows."""
+        header = {
+            'date': self._filing_date.isoformat(),
+            'filingId': self.id,
+            'name': self.filing_type,
+            'status': self.status,
+            'availableOnPaperOnly': self.paper_only,
+            'inColinOnly': self.colin_only,
+            'deletionLocked': self.deletion_locked
+        }
+
+        if self.effective_date:  # pylint: disable=using-constant-test
+            header['effectiveDate'] = self.effective_date.isoformat()  # pylint: disable=no-member
+        if self._payment_status_code:
+            header['paymentStatusCode'] = self.payment_status_code
+        if self._payment_token:
+            header['paymentToken'] = self.payment_token
+        if self.submitter_id:
+            header['submitter'] = submitter.username
+        if self.payment_account:
+            header['paymentAccount'] = self.payment_account
+
+        # add colin_event_ids
+        header['colinIds'] = colin_ids
+
+        # add comments
+        header['comments'] = [comment.json for comment in comments]
+
+        # add affected filings list
+        header['affectedFilings'] = affected_filings
+
+        # add corrected flags
+        header['isCorrected'] = Filing._is_correction_in_status(parent_filing, Filing.Status.COMPLETED.value)
+        header['isCorrectionPending'] = \
+            Filing._is_correction_in_status(parent_filing, Filing.Status.PENDING_CORRECTION.value)
+
+        return header
+
+    @staticmethod
+    def get_json_projections(filings: List[Filing]) -> List[dict]:
+        """Return the json representation of the filings, fetching the related rows of their headers in bulk.
+
+        Rather than a deep copy of filing_json, the json of a filing overlays its header: only the outer dicts and
+        the header are new, the other sections are shared with filing_json and must not be changed.
+        """
+        filing_ids = [filing.id for filing in filings]
+        if not filing_ids:
+            return []
+
+        colin_ids = {}
+        for filing_id, colin_event_id in db.session.query(ColinEventId.filing_id, ColinEventId.colin_event_id). \
+                filter(ColinEventId.filing_id.in_(filing_ids)):
+            colin_ids.setdefault(filing_id, []).append(colin_event_id)
+
+        comments = {}
+        for comment in db.session.query(Comment). \
+                options(joinedload(Comment.staff)). \
+                filter(Comment.filing_id.in_(filing_ids)). \
+                order_by(Comment.id):
+            comments.setdefault(comment.filing_id, []).append(comment)
+
+        affected_filings = {}
+        for child_id, parent_filing_id in db.session.query(Filing.id, Filing.parent_filing_id). \
+                filter(Filing.parent_filing_id.in_(filing_ids)). \
+                order_by(Filing.id):
+            affected_filings.setdefault(parent_filing_id, []).append(child_id)
+
+        submitters = {}
+        if submitter_ids := {filing.submitter_id for filing in filings if filing.submitter_id}:
+            submitters = {user.id: user for user in db.session.query(User).filter(User.id.in_(submitter_ids))}
+
+        parent_filings = {}
+        if parent_filing_ids := {filing.parent_filing_id for filing in filings if filing.parent_filing_id}:
+            parent_filings = {parent.id: parent for parent in
+                              db.session.query(Filing).filter(Filing.id.in_(parent_filing_ids))}
+
+        projections = []
+        for filing in filings:
+            try:
+                filing_json = filing.filing_json
+                header = {
+                    **filing_json['filing']['header'],
+                    **filing._header_json(  # pylint: disable=protected-access
+                        colin_ids=colin_ids.get(filing.id, []),
+                        comments=comments.get(filing.id, []),
+                        affected_filings=affected_filings.get(filing.id, []),
+                        submitter=submitters.get(filing.submitter_id),
+                        parent_filing=parent_filings.get(filing.parent_filing_id))
+                }
+                projections.append({**filing_json, 'filing': {**filing_json['filing'], 'header': header}})
+            except Exception as err:  # noqa: B901, E722
+                raise KeyError from err
+
+        return projections
+
     @classmethod
     def find_by_id(cls, filing_id: str = None):
         """Return a Filing by the id."""
@@ -634,6 +727,16 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
             filter(Filing._status == status).all()  # pylint: disable=singleton-comparison # noqa: E711;
         return filings
 
+    @staticmethod
+    def get_due_filing_ids() -> List[int]:
+        """Return the ids of the PAID filings whose effective date has come, in effective date order."""
+        rows = db.session.query(Filing.id). \
+            filter(Filing._status == Filing.Status.PAID.value). \
+            filter(Filing.effective_date <= func.now()). \
+            order_by(Filing.effective_date, Filing.id). \
+            all()
+        return [row.id for row in rows]
+
     @staticmethod
     def get_previous_completed_filing(filing):
         """Return the previous completed filing."""
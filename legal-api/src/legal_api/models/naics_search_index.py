@@ -0,0 +1,99 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In memory search index over the NAICS class titles and example descriptions of a NAICS year and version.
+
+The NAICS data is small and never changes for a year and version, so rather than scanning it with
+ILIKE '%term%' on every search, it is indexed once by the trigrams of the lower cased text. A search term
+narrows the candidates down to the texts holding all of its trigrams, which are then checked for the term,
+giving the same case insensitive substring matches as ILIKE.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class NaicsSearchIndex:
+    """Trigram index of the level 5 NAICS structures and their example elements."""
+
+    GRAM_SIZE = 3
+
+    def __init__(self,
+                 structures: Iterable[Tuple[int, str]],
+                 elements: Iterable[Tuple[int, int, str]]):
+        """Index the (id, class_title) structures and (id, naics_structure_id, element_description) elements."""
+        self._titles: Dict[int, str] = {}
+        self._title_grams: Dict[str, Set[int]] = {}
+        self._descriptions: Dict[int, str] = {}
+        self._description_grams: Dict[str, Set[int]] = {}
+        self._element_structure: Dict[int, int] = {}
+        self._structure_elements: Dict[int, List[int]] = {}
+
+        for structure_id, class_title in structures:
+            self._add(self._titles, self._title_grams, structure_id, class_title)
+            self._structure_elements[structure_id] = []
+
+        for element_id, structure_id, element_description in elements:
+            if structure_id not in self._structure_elements:
+                continue
+            self._add(self._descriptions, self._description_grams, element_id, element_description)
+            self._element_structure[element_id] = structure_id
+            self._structure_elements[structure_id].append(element_id)
+
+    def _add(self, texts: Dict[int, str], grams: Dict[str, Set[int]], key: int, text: str):
+        texts[key] = text.lower()
+        for gram in self._grams(texts[key]):
+            grams.setdefault(gram, set()).add(key)
+
+    @classmethod
+    def _grams(cls, text: str) -> Set[str]:
+        return {text[i:i + cls.GRAM_SIZE] for i in range(len(text) - cls.GRAM_SIZE + 1)}
+
+    def _match(self, texts: Dict[int, str], grams: Dict[str, Set[int]], term: str) -> Set[int]:
+        """Return the keys of the texts containing the term."""
+        if len(term) < self.GRAM_SIZE:
+            # too short to have a trigram, the texts are few enough to scan
+            return {key for key, text in texts.items() if term in text}
+
+        candidates = None
+        for gram in self._grams(term):
+            candidates = grams.get(gram, set()) if candidates is None else candidates & grams.get(gram, set())
+            if not candidates:
+                return set()
+        return {key for key in candidates if term in texts[key]}
+
+    def search(self, search_term: str) -> Dict[int, Set[int]]:
+        """Return the ids of the structures matching the search term, with the ids of their elements to return.
+
+        This follows NaicsStructure.get_exact_match_query when the term is in a class title, and
+        NaicsStructure.get_non_exact_match_query otherwise.
+        """
+        search_term = search_term.lower()
+        title_matches = self._match(self._titles, self._title_grams, search_term)
+        results: Dict[int, Set[int]] = {}
+
+        if title_matches:
+            # all the examples of a class title match, only the matching ones of the other structures
+            for structure_id in title_matches:
+                results[structure_id] = set(self._structure_elements[structure_id])
+            for element_id in self._match(self._descriptions, self._description_grams, search_term):
+                structure_id = self._element_structure[element_id]
+                if structure_id not in title_matches:
+                    results.setdefault(structure_id, set()).add(element_id)
+        else:
+            # the examples matching any of the words
+            for word in search_term.split(' '):
+                for element_id in self._match(self._descriptions, self._description_grams, word):
+                    results.setdefault(self._element_structure[element_id], set()).add(element_id)
+
+        return results
@@ -25,8 +25,9 @@ The 6th number = national industry (a zero indicates no national industry is nee
 """
 from __future__ import annotations
 
+import threading
 import uuid
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from flask import current_app
 from sqlalchemy import and_, or_
@@ -35,6 +36,7 @@ from sqlalchemy.orm import contains_eager
 
 from .db import db  # noqa: I001
 from .naics_element import NaicsElement
+from .naics_search_index import NaicsSearchIndex
 
 
 class NaicsStructure(db.Model):
@@ -59,6 +61,10 @@ class NaicsStructure(db.Model):
     # relationships
     naics_elements = db.relationship('NaicsElement')
 
+    # the search indexes by (year, version), built on first use as the data never changes
+    _search_indexes: Dict[Tuple[int, int], NaicsSearchIndex] = {}
+    _search_indexes_lock = threading.Lock()
+
     # json serializer
     @property
     def json(self) -> dict:
@@ -83,6 +89,64 @@ class NaicsStructure(db.Model):
     def find_by_search_term(cls, search_term: str) -> list[NaicsStructure]:
         """Return matching NAICS Structures matching search term.
 
+        The search index picks the matching structures and elements, which are then loaded by id. The results are
+        the same as find_by_search_term_in_db, which is used when NAICS_SEARCH_INDEX_ENABLED is off.
+        """
+        if not current_app.config.get('NAICS_SEARCH_INDEX_ENABLED'):
+            return cls.find_by_search_term_in_db(search_term)
+
+        matches = cls.get_search_index().search(search_term)
+        if not matches:
+            return []
+
+        element_ids = set().union(*matches.values())
+        query = \
+            db.session.query(NaicsStructure) \
+            .outerjoin(NaicsElement,
+                       and_(
+                           NaicsElement.naics_structure_id == NaicsStructure.id,
+                           NaicsElement.id.in_(element_ids)
+                       )) \
+            .options(contains_eager(NaicsStructure.naics_elements)) \
+            .filter(NaicsStructure.id.in_(matches.keys()))
+
+        results = query.all()
+        return results
+
+    @classmethod
+    def get_search_index(cls) -> NaicsSearchIndex:
+        """Return the search index of the configured NAICS year and version, building it on first use."""
+        naics_config = cls.get_naics_config()
+        if naics_config not in cls._search_indexes:
+            with cls._search_indexes_lock:
+                if naics_config not in cls._search_indexes:
+                    cls._search_indexes[naics_config] = cls.build_search_index(*naics_config)
+        return cls._search_indexes[naics_config]
+
+    @classmethod
+    def build_search_index(cls, naics_year: int, naics_version: int, level=5) -> NaicsSearchIndex:
+        """Build the search index of the class titles and example descriptions for the NAICS year and version."""
+        structures = \
+            db.session.query(NaicsStructure.id, NaicsStructure.class_title) \
+            .filter(NaicsStructure.level == level) \
+            .filter(NaicsStructure.year == naics_year) \
+            .filter(NaicsStructure.version == naics_version)
+
+        elements = \
+            db.session.query(NaicsElement.id, NaicsElement.naics_structure_id, NaicsElement.element_description) \
+            .join(NaicsStructure, NaicsElement.naics_structure_id == NaicsStructure.id) \
+            .filter(NaicsStructure.level == level) \
+            .filter(NaicsStructure.year == naics_year) \
+            .filter(NaicsStructure.version == naics_version) \
+            .filter(NaicsElement.element_type.in_([NaicsElement.ElementType.ALL_EXAMPLES,
+                                                   NaicsElement.ElementType.ILLUSTRATIVE_EXAMPLES]))
+
+        return NaicsSearchIndex(structures.all(), elements.all())
+
+    @classmethod
+    def find_by_search_term_in_db(cls, search_term: str) -> list[NaicsStructure]:
+        """Return matching NAICS Structures matching search term, searching the database.
+
         There are two main queries which can be used to return search results.  The determining factor of which query
         will be used depends on whether the search term has at least one exact match in NaicsStructure.class_title.
         """
@@ -0,0 +1,111 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This model holds the side effects of a filing that still have to be carried out.
+
+The messages are written in the same transaction as the filing, so a side effect (an email, an event,
+consuming the NR, ...) is never lost, and are carried out afterwards by a dispatcher.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import List
+
+from sqlalchemy import and_, exists
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import aliased
+
+from .db import db
+
+
+class OutboxMessage(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class manages the outbox of filing side effects.
+
+    The messages of a filing are carried out in the order they were written.
+    """
+
+    class Status(str, Enum):
+        """Render an Enum of the message status."""
+
+        PENDING = 'PENDING'
+        PROCESSED = 'PROCESSED'
+        FAILED = 'FAILED'
+
+    __tablename__ = 'outbox_messages'
+
+    id = db.Column(db.Integer, primary_key=True)
+    action = db.Column('action', db.String(50), nullable=False)
+    payload = db.Column('payload', JSONB)
+    status = db.Column('status', db.String(10), default=Status.PENDING.value, nullable=False)
+    attempts = db.Column('attempts', db.Integer, default=0, nullable=False)
+    last_error = db.Column('last_error', db.Text)
+    next_attempt_at = db.Column('next_attempt_at', db.DateTime(timezone=True), default=datetime.utcnow, index=True)
+    creation_date = db.Column('creation_date', db.DateTime(timezone=True), default=datetime.utcnow)
+    processed_date = db.Column('processed_date', db.DateTime(timezone=True))
+
+    # parent keys
+    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), index=True)
+    filing_id = db.Column('filing_id', db.Integer, db.ForeignKey('filings.id'), nullable=False, index=True)
+
+    def save_to_session(self):
+        """Save to the session, do not commit immediately."""
+        db.session.add(self)
+
+    @classmethod
+    def claim_due(cls, limit: int, lease: timedelta) -> List[OutboxMessage]:
+        """Claim the next message of up to limit filings, in the session.
+
+        Only the oldest pending message of a filing is due, so the messages of a filing are carried out in order.
+        A claimed message isn't due again until the lease is over, so the other dispatchers skip it; commit to
+        hand the claim over to them.
+        """
+        now = datetime.utcnow()
+        earlier = aliased(cls)
+        messages = cls.query. \
+            filter(cls.status == cls.Status.PENDING.value). \
+            filter(cls.next_attempt_at <= now). \
+            filter(~exists().where(and_(earlier.filing_id == cls.filing_id,
+                                        earlier.status == cls.Status.PENDING.value,
+                                        earlier.id < cls.id))). \
+            order_by(cls.id). \
+            limit(limit). \
+            with_for_update(skip_locked=True). \
+            all()
+        for message in messages:
+            message.next_attempt_at = now + lease
+        return messages
+
+    def mark_processed(self):
+        """Record that the side effect has been carried out, in the session."""
+        self.status = OutboxMessage.Status.PROCESSED.value
+        self.attempts = (self.attempts or 0) + 1
+        self.processed_date = datetime.utcnow()
+        self.last_error = None
+
+    def mark_failed(self, error: str, max_attempts: int, backoff: timedelta):
+        """Record a failed attempt, in the session, retrying after the backoff doubled per attempt.
+
+        Once max_attempts have failed the message is FAILED, and no longer holds back the next ones.
+        """
+        self.attempts = (self.attempts or 0) + 1
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.status = OutboxMessage.Status.FAILED.value
+        else:
+            self.next_attempt_at = datetime.utcnow() + backoff * (2 ** (self.attempts - 1))
+
+    @classmethod
+    def find_by_filing(cls, filing_id: int) -> List[OutboxMessage]:
+        """Return the messages of the filing, in order."""
+        return cls.query.filter_by(filing_id=filing_id).order_by(cls.id).all()
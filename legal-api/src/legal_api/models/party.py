@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from enum import Enum
 from http import HTTPStatus
+from typing import Optional
 
 from sqlalchemy import event
 
@@ -52,6 +53,8 @@ class Party(db.Model):  # pylint: disable=too-many-instance-attributes
     # CRA Business Number of organization
     tax_id = db.Column('tax_id', db.String(15))
     email = db.Column(db.String(254))
+    # the upper cased full name, kept in sync with the name columns to look up parties by name
+    normalized_name = db.Column('normalized_name', db.String(150), index=True)
 
     # parent keys
     delivery_address_id = db.Column('delivery_address_id', db.Integer, db.ForeignKey('addresses.id'))
@@ -115,10 +118,19 @@ class Party(db.Model):  # pylint: disable=too-many-instance-attributes
     def name(self) -> str:
         """Return the full name of the party for comparison."""
         if self.party_type == Party.PartyTypes.PERSON.value:
-            if self.middle_initial:
-                return ' '.join((self.first_name, self.middle_initial, self.last_name)).strip().upper()
-            return ' '.join((self.first_name, self.last_name)).strip().upper()
-        return self.organization_name.strip().upper()
+            return Party.normalize_person_name(self.first_name, self.middle_initial, self.last_name)
+        return Party.normalize_organization_name(self.organization_name)
+
+    @staticmethod
+    def normalize_person_name(first_name: str, middle_initial: str, last_name: str) -> str:
+        """Return the full name of a person for comparison."""
+        names = (first_name, middle_initial, last_name) if middle_initial else (first_name, last_name)
+        return ' '.join(name for name in names if name is not None).strip().upper()
+
+    @staticmethod
+    def normalize_organization_name(organization_name: str) -> Optional[str]:
+        """Return the name of an organization for comparison."""
+        return organization_name.strip().upper() if organization_name is not None else None
 
     @property
     def valid_party_type_data(self) -> bool:
@@ -152,3 +164,5 @@ def receive_before_change(mapper, connection, target):  # pylint: disable=unused
             error=f'Attempt to change/add {party.party_type} had invalid data.',
             status_code=HTTPStatus.BAD_REQUEST
         )
+
+    party.normalized_name = party.name
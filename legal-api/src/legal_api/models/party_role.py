@@ -16,8 +16,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from typing import Dict, List
 
 from sqlalchemy import Date, cast, or_
+from sqlalchemy.orm import joinedload
 
 from .db import db  # noqa: I001
 from .party import Party  # noqa: I001,F401,I003 pylint: disable=unused-import; needed by the SQLAlchemy rel
@@ -45,7 +47,7 @@ class PartyRole(db.Model):
     appointment_date = db.Column('appointment_date', db.DateTime(timezone=True))
     cessation_date = db.Column('cessation_date', db.DateTime(timezone=True))
 
-    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'))
+    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), index=True)
     filing_id = db.Column('filing_id', db.Integer, db.ForeignKey('filings.id'))
     party_id = db.Column('party_id', db.Integer, db.ForeignKey('parties.id'))
 
@@ -62,13 +64,20 @@ class PartyRole(db.Model):
         """Return the party member as a json object."""
         party = {
             **self.party.json,
+            **self.role_json
+        }
+
+        return party
+
+    @property
+    def role_json(self) -> dict:
+        """Return the role, without the party member, as a json object."""
+        return {
             'appointmentDate': datetime.date(self.appointment_date).isoformat(),
             'cessationDate': datetime.date(self.cessation_date).isoformat() if self.cessation_date else None,
             'role': self.role
         }
 
-        return party
-
     @classmethod
     def find_by_internal_id(cls, internal_id: int) -> PartyRole:
         """Return a party role by the internal id."""
@@ -77,29 +86,60 @@ class PartyRole(db.Model):
             party_role = cls.query.filter_by(id=internal_id).one_or_none()
         return party_role
 
-    @classmethod
-    def find_party_by_name(cls, business_id: int, first_name: str,  # pylint: disable=too-many-arguments; one too many
-                           last_name: str, middle_initial: str, org_name: str) -> Party:
-        """Return a Party connected to the given business_id by the given name."""
-        party_roles = cls.query.filter_by(business_id=business_id).all()
-        party = None
-        # the given name to find
-        search_name = ''
+    @staticmethod
+    def get_party_name(first_name: str, last_name: str, middle_initial: str, org_name: str) -> str:
+        """Return the given name as it is compared with the name of a party."""
         if org_name:
             search_name = org_name
         elif middle_initial:
             search_name = ' '.join((first_name.strip(), middle_initial.strip(), last_name.strip()))
         else:
             search_name = ' '.join((first_name.strip(), last_name.strip()))
+        return search_name.strip().upper()
 
-        for role in party_roles:
-            # the name of the party for each role
-            name = role.party.name
-            if name and name.strip().upper() == search_name.strip().upper():
-                party = role.party
-                break
+    @classmethod
+    def find_party_by_name(cls, business_id: int, first_name: str,  # pylint: disable=too-many-arguments; one too many
+                           last_name: str, middle_initial: str, org_name: str) -> Party:
+        """Return a Party connected to the given business_id by the given name."""
+        search_name = cls.get_party_name(first_name, last_name, middle_initial, org_name)
+        return cls.find_parties_by_name(business_id, [search_name]).get(search_name)
 
-        return party
+    @classmethod
+    def find_parties_by_name(cls, business_id: int, names: List[str]) -> Dict[str, Party]:
+        """Return the Parties connected to the given business_id by any of the given names, keyed by name.
+
+        The names are compared with the normalized name of the parties, as returned by get_party_name.
+        When several parties have the same name, the one with the first role is returned.
+        """
+        names = set(names)
+        if not names:
+            return {}
+
+        parties = db.session.query(Party). \
+            join(PartyRole, PartyRole.party_id == Party.id). \
+            filter(PartyRole.business_id == business_id). \
+            filter(Party.normalized_name.in_(names)). \
+            order_by(PartyRole.id). \
+            all()
+
+        parties_by_name = {}
+        for party in parties:
+            parties_by_name.setdefault(party.normalized_name, party)
+        return parties_by_name
+
+    @staticmethod
+    def with_party_and_addresses(query):
+        """Load the party and both of its addresses with the roles, in the same round trip."""
+        return query.options(joinedload(PartyRole.party).joinedload(Party.delivery_address),
+                             joinedload(PartyRole.party).joinedload(Party.mailing_address))
+
+    @staticmethod
+    def group_by_party(party_roles: List[PartyRole]) -> Dict[int, List[PartyRole]]:
+        """Return the roles grouped by party id, in the order each party was first seen."""
+        party_roles_by_party = {}
+        for party_role in party_roles:
+            party_roles_by_party.setdefault(party_role.party_id, []).append(party_role)
+        return party_roles_by_party
 
     @staticmethod
     def get_parties_by_role(business_id: int, role: str) -> list:
@@ -113,7 +153,7 @@ class PartyRole(db.Model):
     @staticmethod
     def get_active_directors(business_id: int, end_date: datetime) -> list:
         """Return the active directors as of given date."""
-        directors = db.session.query(PartyRole). \
+        directors = PartyRole.with_party_and_addresses(db.session.query(PartyRole)). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.role == PartyRole.RoleTypes.DIRECTOR.value). \
             filter(cast(PartyRole.appointment_date, Date) <= end_date). \
@@ -124,7 +164,7 @@ class PartyRole(db.Model):
     @staticmethod
     def get_party_roles(business_id: int, end_date: datetime, role: str = None) -> list:
         """Return the parties that match the filter conditions."""
-        party_roles = db.session.query(PartyRole). \
+        party_roles = PartyRole.with_party_and_addresses(db.session.query(PartyRole)). \
             filter(PartyRole.business_id == business_id). \
             filter(cast(PartyRole.appointment_date, Date) <= end_date). \
             filter(or_(PartyRole.cessation_date.is_(None), cast(PartyRole.cessation_date, Date) > end_date))
@@ -138,7 +178,7 @@ class PartyRole(db.Model):
     @staticmethod
     def get_party_roles_by_party_id(business_id: int, party_id: int) -> list:
         """Return the parties that match the filter conditions."""
-        party_roles = db.session.query(PartyRole). \
+        party_roles = PartyRole.with_party_and_addresses(db.session.query(PartyRole)). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.party_id == party_id). \
             all()
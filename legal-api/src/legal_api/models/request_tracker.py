@@ -14,8 +14,9 @@
 """This module holds data for request tracker."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import auto
+from typing import List
 
 from legal_api.utils.base import BaseEnum
 
@@ -52,6 +53,7 @@ class RequestTracker(db.Model):  # pylint: disable=too-many-instance-attributes
     service_name = db.Column('service_name', db.Enum(ServiceName), nullable=False)
     creation_date = db.Column('creation_date', db.DateTime(timezone=True), default=datetime.utcnow)
     last_modified = db.Column('last_modified', db.DateTime(timezone=True), default=datetime.utcnow)
+    next_retry_date = db.Column('next_retry_date', db.DateTime(timezone=True), index=True)
 
     # parent keys
     business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), index=True)
@@ -89,3 +91,25 @@ class RequestTracker(db.Model):  # pylint: disable=too-many-instance-attributes
 
         request_trackers = query.all()
         return request_trackers
+
+    @classmethod
+    def claim_due_retries(cls, service_name: ServiceName, max_retry: int, limit: int,
+                          lease: timedelta) -> List[RequestTracker]:
+        """Claim the failed requests whose next retry is due, the longest waiting first, in the session.
+
+        The rows locked by another retry scheduler are skipped, and a claimed request isn't due again until the
+        lease is over; commit to hand the claim over to the other schedulers.
+        """
+        now = datetime.utcnow()
+        request_trackers = db.session.query(RequestTracker). \
+            filter(RequestTracker.service_name == service_name). \
+            filter(RequestTracker.is_processed.is_(False)). \
+            filter(RequestTracker.retry_number < max_retry). \
+            filter(RequestTracker.next_retry_date <= now). \
+            order_by(RequestTracker.next_retry_date). \
+            limit(limit). \
+            with_for_update(skip_locked=True). \
+            all()
+        for request_tracker in request_trackers:
+            request_tracker.next_retry_date = now + lease
+        return request_trackers
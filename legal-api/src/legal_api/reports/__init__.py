@@ -15,6 +15,7 @@ from flask import jsonify
 from flask_babel import _
 
 from .report import Report
+from .template_registry import template_registry
 
 
 def get_pdf(filing, report_type=None):
@@ -24,3 +25,13 @@ def get_pdf(filing, report_type=None):
     except FileNotFoundError:
         # We don't have a template for it, so it must only be available on paper.
         return jsonify({'message': _('Available on paper only.')}), HTTPStatus.NOT_FOUND
+
+
+def warm_up_templates(app):
+    """Assemble all the report templates at app start, so the first requests don't pay for it."""
+    # imported here, business_document imports the resources which import this package
+    from .business_document import BusinessDocument  # pylint: disable=import-outside-toplevel
+
+    with app.app_context():
+        template_registry.warm_up(Report.get_all_templates() +
+                                  [(BusinessDocument.TEMPLATE_NAME, BusinessDocument.TEMPLATE_PARTS)])
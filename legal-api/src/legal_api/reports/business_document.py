@@ -9,19 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
-import base64
 import json
 import os
 from http import HTTPStatus
-from pathlib import Path
 
 import pycountry
-import requests
 from flask import current_app, jsonify
 
 from legal_api.models import Alias, Business, CorpType, Filing
 from legal_api.reports.registrar_meta import RegistrarInfo
+from legal_api.reports.template_registry import CompiledTemplate, template_registry
 from legal_api.resources.v2.business import get_addresses, get_directors
+from legal_api.services.http_client import http_client
 from legal_api.utils.auth import jwt
 from legal_api.utils.legislation_datetime import LegislationDatetime
 
@@ -30,6 +29,26 @@ class BusinessDocument:  # pylint: disable=too-few-public-methods
     # TODO review pylint warning and alter as required
     """Service to create business summary output."""
 
+    TEMPLATE_NAME = 'businessSummary.html'
+    # template parts are substituted in this order, see TemplateRegistry
+    TEMPLATE_PARTS = [
+        'business-summary/alterations',
+        'business-summary/amalgamations',
+        'business-summary/businessDetails',
+        'business-summary/liquidation',
+        'business-summary/nameChanges',
+        'business-summary/stateTransition',
+        'business-summary/recordKeeper',
+        'common/addresses',
+        'common/businessDetails',
+        'common/nameTranslation',
+        'common/style',
+        'footer',
+        'logo',
+        'macros',
+        'notice-of-articles/directors'
+    ]
+
     def __init__(self, business, document_key):
         """Create the Report instance."""
         self._business = business
@@ -45,10 +64,12 @@ class BusinessDocument:  # pylint: disable=too-few-public-methods
         }
         data = {
             'reportName': self._get_report_filename(),
-            'template': "'" + base64.b64encode(bytes(self._get_template(), 'utf-8')).decode() + "'",
+            'template': "'" + self._get_compiled_template().encoded + "'",
             'templateVars': self._get_template_data()
         }
-        response = requests.post(url=current_app.config.get('REPORT_SVC_URL'), headers=headers, data=json.dumps(data))
+        response = http_client.post(url=current_app.config.get('REPORT_SVC_URL'),
+                                    headers=headers,
+                                    data=json.dumps(data))
         if response.status_code != HTTPStatus.OK:
             return jsonify(message=str(response.content)), response.status_code
         return response.content, response.status_code
@@ -58,41 +79,16 @@ class BusinessDocument:  # pylint: disable=too-few-public-methods
         return '{}_{}_{}.pdf'.format(self._business.identifier, report_date, 'Summary').replace(' ', '_')
 
     def _get_template(self):
+        return self._get_compiled_template().code
+
+    @staticmethod
+    def _get_compiled_template() -> CompiledTemplate:
+        """Return the assembled template from the process wide registry."""
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-            template_code = Path(f'{template_path}/businessSummary.html').read_text()
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            return template_registry.get(BusinessDocument.TEMPLATE_NAME, BusinessDocument.TEMPLATE_PARTS)
         except Exception as err:
             current_app.logger.error(err)
             raise err
-        return template_code
-
-    @staticmethod
-    def _substitute_template_parts(template_code):
-        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'business-summary/alterations',
-            'business-summary/amalgamations',
-            'business-summary/businessDetails',
-            'business-summary/liquidation',
-            'business-summary/nameChanges',
-            'business-summary/stateTransition',
-            'business-summary/recordKeeper',
-            'common/addresses',
-            'common/businessDetails',
-            'common/nameTranslation',
-            'common/style',
-            'footer',
-            'logo',
-            'macros',
-            'notice-of-articles/directors'
-        ]
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-        return template_code
 
     def _get_template_data(self):
         business_json = {}
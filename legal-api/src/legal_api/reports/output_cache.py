@@ -0,0 +1,108 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+"""Content addressed cache of the rendered PDF outputs of completed filings.
+
+The outputs of a completed filing don't change, so once rendered they are stored and served from the cache.
+The key is a hash of the filing, the report type, the template version and the correction state of the filing,
+so a new template or a correction filed against the filing produces a new key and the old output is never served.
+
+REPORT_CACHE_STORE selects the tier, 'minio' or 'disk', and the cache is off when it isn't set.
+"""
+import hashlib
+import io
+from pathlib import Path
+from typing import Optional
+
+from flask import current_app
+from minio.error import S3Error
+
+from legal_api.models import Filing
+from legal_api.services import MinioService
+
+from .report import Report
+
+
+class ReportOutputCache:
+    """Store and fetch rendered PDF outputs by their content key."""
+
+    CACHEABLE_STATUSES = [Filing.Status.COMPLETED.value, Filing.Status.CORRECTED.value]
+    KEY_PREFIX = 'filing-outputs'
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Return True if a cache store is configured."""
+        return current_app.config.get('REPORT_CACHE_STORE') in ('minio', 'disk')
+
+    @staticmethod
+    def get_key(filing: Filing, report_type: str) -> Optional[str]:
+        """Return the cache key of the output, or None if the output can't be cached."""
+        if not ReportOutputCache.is_enabled() or filing.status not in ReportOutputCache.CACHEABLE_STATUSES:
+            return None
+
+        try:
+            if not (template_version := Report(filing).get_template_version(report_type)):
+                return None
+        except FileNotFoundError:
+            # no template, so the output is only available on paper
+            return None
+
+        parent_filing = filing.parent_filing
+        correction_state = f'{parent_filing.id}:{parent_filing.status}' if parent_filing else ''
+        content_hash = hashlib.sha256(
+            f'{filing.id}|{report_type}|{template_version}|{correction_state}'.encode()
+        ).hexdigest()
+        return f'{ReportOutputCache.KEY_PREFIX}/{filing.id}/{report_type}-{content_hash}.pdf'
+
+    @staticmethod
+    def get_etag(key: str) -> str:
+        """Return the ETag for the cached output, the content hash in the key."""
+        return key.rsplit('-', 1)[-1][:-len('.pdf')]
+
+    @staticmethod
+    def get(key: str) -> Optional[bytes]:
+        """Return the cached output, or None on a miss."""
+        try:
+            if current_app.config.get('REPORT_CACHE_STORE') == 'disk':
+                file_path = ReportOutputCache._disk_path(key)
+                return file_path.read_bytes() if file_path.exists() else None
+
+            response = MinioService.get_file(key)
+            try:
+                return response.data
+            finally:
+                response.close()
+                response.release_conn()
+        except S3Error as err:
+            if err.code != 'NoSuchKey':
+                current_app.logger.error(f'Error reading the cached output {key}: {err}')
+        except OSError as err:
+            current_app.logger.error(f'Error reading the cached output {key}: {err}')
+        return None
+
+    @staticmethod
+    def put(key: str, content: bytes):
+        """Store the output, a failure to store is logged and doesn't fail the request."""
+        try:
+            if current_app.config.get('REPORT_CACHE_STORE') == 'disk':
+                file_path = ReportOutputCache._disk_path(key)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                # write then rename, so a concurrent reader never sees a partial file
+                tmp_path = file_path.with_suffix('.tmp')
+                tmp_path.write_bytes(content)
+                tmp_path.replace(file_path)
+            else:
+                MinioService.put_file(key, io.BytesIO(content), len(content))
+        except (S3Error, OSError) as err:
+            current_app.logger.error(f'Error storing the cached output {key}: {err}')
+
+    @staticmethod
+    def _disk_path(key: str) -> Path:
+        return Path(current_app.config.get('REPORT_CACHE_DISK_PATH')) / key
@@ -9,7 +9,6 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
-import base64
 import copy
 import json
 import os
@@ -17,17 +16,17 @@ import re
 from contextlib import suppress
 from datetime import datetime
 from http import HTTPStatus
-from pathlib import Path
 
 import pycountry
-import requests
 from flask import current_app, jsonify
 
 from legal_api.core.meta.filing import FILINGS
 from legal_api.models import Business, CorpType, Document, Filing, PartyRole
 from legal_api.models.business import ASSOCIATION_TYPE_DESC
 from legal_api.reports.registrar_meta import RegistrarInfo
+from legal_api.reports.template_registry import CompiledTemplate, template_registry
 from legal_api.services import MinioService, VersionedBusinessDetailsService
+from legal_api.services.http_client import http_client
 from legal_api.utils.auth import jwt
 from legal_api.utils.legislation_datetime import LegislationDatetime
 
@@ -36,6 +35,66 @@ class Report:  # pylint: disable=too-few-public-methods
     # TODO review pylint warning and alter as required
     """Service to create report outputs."""
 
+    # template parts are substituted in this order, see TemplateRegistry
+    TEMPLATE_PARTS = [
+        'bc-annual-report/legalObligations',
+        'bc-address-change/addresses',
+        'bc-director-change/directors',
+        'certificate-of-name-change/style',
+        'common/certificateLogo',
+        'common/certificateRegistrarSignature',
+        'common/certificateSeal',
+        'common/certificateStyle',
+        'common/addresses',
+        'common/shareStructure',
+        'common/correctedOnCertificate',
+        'common/style',
+        'common/businessDetails',
+        'common/directors',
+        'change-of-registration/legal-name',
+        'change-of-registration/nature-of-business',
+        'change-of-registration/addresses',
+        'change-of-registration/proprietor',
+        'change-of-registration/completingParty',
+        'change-of-registration/partner',
+        'incorporation-application/benefitCompanyStmt',
+        'incorporation-application/completingParty',
+        'incorporation-application/effectiveDate',
+        'incorporation-application/incorporator',
+        'incorporation-application/nameRequest',
+        'incorporation-application/cooperativeAssociationType',
+        'registration/nameRequest',
+        'registration/addresses',
+        'registration/completingParty',
+        'registration/party',
+        'registration-statement/party',
+        'registration-statement/business-info',
+        'registration-statement/completingParty',
+        'common/statement',
+        'common/benefitCompanyStmt',
+        'dissolution/custodianOfRecords',
+        'dissolution/dissolutionStatement',
+        'notice-of-articles/directors',
+        'notice-of-articles/restrictions',
+        'common/resolutionDates',
+        'alteration-notice/businessTypeChange',
+        'alteration-notice/legalNameChange',
+        'alteration-notice/statement',
+        'common/effectiveDate',
+        'common/nameTranslation',
+        'alteration-notice/companyProvisions',
+        'special-resolution/resolution',
+        'addresses',
+        'certification',
+        'directors',
+        'dissolution',
+        'footer',
+        'legalNameChange',
+        'logo',
+        'macros',
+        'style'
+    ]
+
     def __init__(self, filing):
         """Create the Report instance."""
         self._filing = filing
@@ -55,13 +114,25 @@ class Report:  # pylint: disable=too-few-public-methods
         response = MinioService.get_file(document.file_key)
         return response.data, response.status
 
-    def _get_report(self):
+    def get_template_version(self, report_type=None):
+        """Return the content hash of the template the report is rendered with, or None for static reports."""
+        self._report_key = report_type if report_type else self._filing.filing_type
+        if self._report_key in ReportMeta.static_reports:
+            return None
+        self._set_report_key_and_business()
+        return self._get_compiled_template().version
+
+    def _set_report_key_and_business(self):
         if self._report_key == 'correction':
             self._report_key = self._filing.filing_json['filing']['correction']['correctedFilingType']
         elif self._report_key == 'alteration':
             self._report_key = 'alterationNotice'
         if self._filing.business_id:
             self._business = Business.find_by_internal_id(self._filing.business_id)
+
+    def _get_report(self):
+        self._set_report_key_and_business()
+        if self._business:
             Report._populate_business_info_to_filing(self._filing, self._business)
         headers = {
             'Authorization': 'Bearer {}'.format(jwt.get_token_auth_header()),
@@ -69,10 +140,12 @@ class Report:  # pylint: disable=too-few-public-methods
         }
         data = {
             'reportName': self._get_report_filename(),
-            'template': "'" + base64.b64encode(bytes(self._get_template(), 'utf-8')).decode() + "'",
+            'template': "'" + self._get_compiled_template().encoded + "'",
             'templateVars': self._get_template_data()
         }
-        response = requests.post(url=current_app.config.get('REPORT_SVC_URL'), headers=headers, data=json.dumps(data))
+        response = http_client.post(url=current_app.config.get('REPORT_SVC_URL'),
+                                    headers=headers,
+                                    data=json.dumps(data))
 
         if response.status_code != HTTPStatus.OK:
             return jsonify(message=str(response.content)), response.status_code
@@ -86,96 +159,27 @@ class Report:  # pylint: disable=too-few-public-methods
         return '{}_{}_{}.pdf'.format(legal_entity_number, filing_date, description).replace(' ', '_')
 
     def _get_template(self):
+        return self._get_compiled_template().code
+
+    def _get_compiled_template(self) -> CompiledTemplate:
+        """Return the assembled template from the process wide registry."""
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-            template_code = Path(f'{template_path}/{self._get_template_filename()}').read_text()
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            return template_registry.get(self._get_template_filename(), Report.TEMPLATE_PARTS)
         except Exception as err:
             current_app.logger.error(err)
             raise err
-        return template_code
 
     @staticmethod
-    def _substitute_template_parts(template_code):
-        """Substitute template parts in main template.
-
-        Template parts are marked by [[partname.html]] in templates.
-
-        This functionality is restricted by:
-        - markup must be exactly [[partname.html]] and have no extra spaces around file name
-        - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
-        parts. There is no recursive search and replace.
-
-        :param template_code: string
-        :return: template_code string, modified.
-        """
-        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'bc-annual-report/legalObligations',
-            'bc-address-change/addresses',
-            'bc-director-change/directors',
-            'certificate-of-name-change/style',
-            'common/certificateLogo',
-            'common/certificateRegistrarSignature',
-            'common/certificateSeal',
-            'common/certificateStyle',
-            'common/addresses',
-            'common/shareStructure',
-            'common/correctedOnCertificate',
-            'common/style',
-            'common/businessDetails',
-            'common/directors',
-            'change-of-registration/legal-name',
-            'change-of-registration/nature-of-business',
-            'change-of-registration/addresses',
-            'change-of-registration/proprietor',
-            'change-of-registration/completingParty',
-            'change-of-registration/partner',
-            'incorporation-application/benefitCompanyStmt',
-            'incorporation-application/completingParty',
-            'incorporation-application/effectiveDate',
-            'incorporation-application/incorporator',
-            'incorporation-application/nameRequest',
-            'incorporation-application/cooperativeAssociationType',
-            'registration/nameRequest',
-            'registration/addresses',
-            'registration/completingParty',
-            'registration/party',
-            'registration-statement/party',
-            'registration-statement/business-info',
-            'registration-statement/completingParty',
-            'common/statement',
-            'common/benefitCompanyStmt',
-            'dissolution/custodianOfRecords',
-            'dissolution/dissolutionStatement',
-            'notice-of-articles/directors',
-            'notice-of-articles/restrictions',
-            'common/resolutionDates',
-            'alteration-notice/businessTypeChange',
-            'alteration-notice/legalNameChange',
-            'alteration-notice/statement',
-            'common/effectiveDate',
-            'common/nameTranslation',
-            'alteration-notice/companyProvisions',
-            'special-resolution/resolution',
-            'addresses',
-            'certification',
-            'directors',
-            'dissolution',
-            'footer',
-            'legalNameChange',
-            'logo',
-            'macros',
-            'style'
-        ]
-
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-
-        return template_code
+    def get_all_templates() -> list:
+        """Return the (template file name, template parts) of every report, used to warm up the registry."""
+        file_names = set()
+        for report in ReportMeta.reports.values():
+            if report.get('hasDifferentTemplates', False):
+                file_names.update(template['fileName'] for template in report.values()
+                                  if isinstance(template, dict) and template.get('fileName'))
+            elif report.get('fileName'):
+                file_names.add(report['fileName'])
+        return [(f'{file_name}.html', Report.TEMPLATE_PARTS) for file_name in sorted(file_names)]
 
     def _get_template_filename(self):
         if ReportMeta.reports[self._report_key].get('hasDifferentTemplates', False):
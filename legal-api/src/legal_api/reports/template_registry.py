@@ -0,0 +1,103 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+"""Process wide registry of the assembled report templates.
+
+A report template is the main template file with its template parts substituted in.
+The templates only change on a deploy, so each one is assembled and base64 encoded once per process.
+Set REPORT_TEMPLATE_CHECK_MTIME to reload a template when any of its files change, which is handy in dev.
+"""
+import base64
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from flask import current_app
+
+
+class CompiledTemplate(NamedTuple):
+    """An assembled template, its base64 encoding, a content hash and the mtimes of the files it was built from."""
+
+    code: str
+    encoded: str
+    version: str
+    mtimes: Dict[str, float]
+
+
+class TemplateRegistry:
+    """Cache of the assembled report templates, keyed by the main template and its template parts."""
+
+    def __init__(self):
+        """Create the empty registry."""
+        self._lock = threading.Lock()
+        self._templates: Dict[Tuple[str, str, Tuple[str, ...]], CompiledTemplate] = {}
+
+    def get(self, template_name: str, template_parts: List[str]) -> CompiledTemplate:
+        """Return the assembled template, building it on first use.
+
+        :param template_name: the file name of the main template, relative to REPORT_TEMPLATE_PATH
+        :param template_parts: the template parts to substitute, in order
+        """
+        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
+        key = (template_path, template_name, tuple(template_parts))
+
+        template = self._templates.get(key)
+        if template and current_app.config.get('REPORT_TEMPLATE_CHECK_MTIME') and self._is_stale(template):
+            template = None
+
+        if not template:
+            template = self._compile(template_path, template_name, template_parts)
+            with self._lock:
+                self._templates[key] = template
+        return template
+
+    def warm_up(self, templates: Iterable[Tuple[str, List[str]]]):
+        """Assemble the templates ahead of the first request, skipping any that can't be built."""
+        for template_name, template_parts in templates:
+            try:
+                self.get(template_name, template_parts)
+            except FileNotFoundError as err:
+                current_app.logger.warning(f'Unable to warm up report template {template_name}: {err}')
+
+    def clear(self):
+        """Remove all the assembled templates."""
+        with self._lock:
+            self._templates.clear()
+
+    @staticmethod
+    def _compile(template_path: str, template_name: str, template_parts: List[str]) -> CompiledTemplate:
+        """Assemble the template, substituting the parts marked up by [[filename]].
+
+        The markup must be exactly [[partname.html]], and parts are only substituted one level deep.
+        """
+        main_file = Path(f'{template_path}/{template_name}')
+        mtimes = {str(main_file): main_file.stat().st_mtime}
+        template_code = main_file.read_text()
+
+        for template_part in template_parts:
+            part_file = Path(f'{template_path}/template-parts/{template_part}.html')
+            mtimes[str(part_file)] = part_file.stat().st_mtime
+            template_code = template_code.replace('[[{}.html]]'.format(template_part), part_file.read_text())
+
+        encoded = base64.b64encode(bytes(template_code, 'utf-8')).decode()
+        version = hashlib.sha256(encoded.encode()).hexdigest()[:16]
+        return CompiledTemplate(code=template_code, encoded=encoded, version=version, mtimes=mtimes)
+
+    @staticmethod
+    def _is_stale(template: CompiledTemplate) -> bool:
+        """Return True if any of the files the template was built from has changed."""
+        try:
+            return any(Path(file_name).stat().st_mtime != mtime for file_name, mtime in template.mtimes.items())
+        except FileNotFoundError:
+            return True
+
+
+template_registry = TemplateRegistry()  # pylint: disable=invalid-name
@@ -18,7 +18,6 @@ Provides all the search and retrieval from the business entity datastore.
 from http import HTTPStatus
 from typing import Tuple, Union
 
-import requests  # noqa: I001; grouping out of order to make both pylint & isort happy
 from requests import exceptions  # noqa: I001; grouping out of order to make both pylint & isort happy
 from flask import current_app, g, jsonify, request
 from flask_babel import _
@@ -45,6 +44,7 @@ from legal_api.services import (
     queue,
 )
 from legal_api.services.filings import validate
+from legal_api.services.http_client import http_client
 from legal_api.services.utils import get_str
 from legal_api.utils import datetime
 from legal_api.utils.auth import jwt
@@ -90,7 +90,7 @@ class ListFilingResource(Resource):
                         'Content-Type': 'application/json'
                     }
                     payment_svc_url = current_app.config.get('PAYMENT_SVC_URL')
-                    pay_response = requests.get(
+                    pay_response = http_client.get(
                         url=f'{payment_svc_url}/{filing_json["filing"]["header"]["paymentToken"]}',
                         headers=headers
                     )
@@ -323,7 +323,7 @@ class ListFilingResource(Resource):
             payment_svc_url = '{}/{}'.format(current_app.config.get('PAYMENT_SVC_URL'), filing.payment_token)
             token = jwt.get_token_auth_header()
             headers = {'Authorization': 'Bearer ' + token}
-            rv = requests.delete(url=payment_svc_url, headers=headers, timeout=20.0)
+            rv = http_client.delete(url=payment_svc_url, headers=headers, timeout=20.0)
             if rv.status_code in (HTTPStatus.OK, HTTPStatus.ACCEPTED):
                 filing.reset_filing_to_draft()
 
@@ -761,10 +761,10 @@ class ListFilingResource(Resource):
             token = user_jwt.get_token_auth_header()
             headers = {'Authorization': 'Bearer ' + token,
                        'Content-Type': 'application/json'}
-            rv = requests.post(url=payment_svc_url,
-                               json=payload,
-                               headers=headers,
-                               timeout=20.0)
+            rv = http_client.post(url=payment_svc_url,
+                                  json=payload,
+                                  headers=headers,
+                                  timeout=20.0)
         except (exceptions.ConnectionError, exceptions.Timeout) as err:
             current_app.logger.error(f'Payment connection failure for {business.identifier}: filing:{filing.id}', err)
             return {'message': 'unable to create invoice for payment.'}, HTTPStatus.PAYMENT_REQUIRED
@@ -818,6 +818,18 @@ class ListFilingResource(Resource):
         return is_future_effective
 
 
+@cors_preflight('GET')
+@API.route('/internal/filings/due', methods=['GET', 'OPTIONS'])
+class InternalDueFilings(Resource):
+    """Internal service for the future effective filings job."""
+
+    @staticmethod
+    @cors.crossdomain(origin='*')
+    def get():
+        """Get the ids of the PAID filings whose effective date has come."""
+        return jsonify({'filingIds': Filing.get_due_filing_ids()}), HTTPStatus.OK
+
+
 @cors_preflight('GET, POST, PUT, PATCH, DELETE')
 @API.route('/internal/filings', methods=['GET', 'OPTIONS'])
 @API.route('/internal/filings/<string:status>', methods=['GET', 'OPTIONS'])
@@ -854,8 +866,7 @@ class InternalFilings(Resource):
             return jsonify(filings), HTTPStatus.OK
 
         pending_filings = Filing.get_all_filings_by_status(status)
-        for filing in pending_filings:
-            filings.append(filing.json)
+        filings.extend(Filing.get_json_projections(pending_filings))
         return jsonify(filings), HTTPStatus.OK
 
     @staticmethod
@@ -893,6 +904,30 @@ class InternalFilings(Resource):
             raise err
 
 
+@cors_preflight('POST')
+@API.route('/internal/filings/colin_id/known', methods=['POST', 'OPTIONS'])
+class ColinKnownIds(Resource):
+    """Endpoint to check which colin event ids are already in legal."""
+
+    @staticmethod
+    @cors.crossdomain(origin='*')
+    @jwt.requires_auth
+    def post():
+        """Return the colin ids of the colinIds in the body that are linked to a filing in legal."""
+        if not jwt.validate_roles([COLIN_SVC_ROLE]):
+            return jsonify({'message': 'You are not authorized to check colin ids'}), HTTPStatus.UNAUTHORIZED
+
+        json_input = request.get_json()
+        if not json_input or not isinstance(json_input.get('colinIds'), list):
+            return jsonify({'message': 'No colinIds in body of post.'}), HTTPStatus.BAD_REQUEST
+        try:
+            colin_ids = [int(colin_id) for colin_id in json_input['colinIds']]
+        except (TypeError, ValueError):
+            return jsonify({'message': 'colinIds must be numbers.'}), HTTPStatus.BAD_REQUEST
+
+        return jsonify({'colinIds': ColinEventId.get_known_colin_ids(colin_ids)}), HTTPStatus.OK
+
+
 @cors_preflight('GET, POST, PUT, PATCH, DELETE')
 @API.route('/internal/filings/colin_id', methods=['GET', 'OPTIONS'])
 @API.route('/internal/filings/colin_id/<int:colin_id>', methods=['GET', 'POST', 'OPTIONS'])
@@ -19,13 +19,13 @@ Provides all the search and retrieval from the business filings datastore.
 from datetime import datetime
 from http import HTTPStatus
 
-import requests
 from requests import exceptions  # noqa I001
 from flask import current_app, jsonify
 from flask_restx import Resource, cors
 
 from legal_api.models import Business, Filing
 from legal_api.services import namex
+from legal_api.services.http_client import http_client
 from legal_api.utils.auth import jwt
 from legal_api.utils.util import cors_preflight
 
@@ -106,8 +106,7 @@ class TaskListResource(Resource):
                                                                      Filing.Status.PENDING_CORRECTION.value,
                                                                      Filing.Status.ERROR.value])
         # Create a todo item for each pending filing
-        for filing in pending_filings:
-            filing_json = filing.json
+        for filing, filing_json in zip(pending_filings, Filing.get_json_projections(pending_filings)):
             if filing.payment_status_code == 'CREATED' and filing.payment_token:
                 # get current pay details from pay-api
                 try:
@@ -115,7 +114,7 @@ class TaskListResource(Resource):
                         'Authorization': f'Bearer {jwt.get_token_auth_header()}',
                         'Content-Type': 'application/json'
                     }
-                    pay_response = requests.get(
+                    pay_response = http_client.get(
                         url=f'{current_app.config.get("PAYMENT_SVC_URL")}/{filing.payment_token}',
                         headers=headers
                     )
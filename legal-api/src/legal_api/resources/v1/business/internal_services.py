@@ -40,12 +40,19 @@ class InternalBusinessResource(Resource):
         """Return all identifiers with no tax_id set that are supposed to have a tax_id.
 
         Excludes COOPS because they do not ge a tax id/business number.
+        The identifiers are paged with the limit and after (the last identifier of the previous page) params.
         """
         if not jwt.validate_roles([COLIN_SVC_ROLE]):
             return jsonify({'message': 'You are not authorized to update the colin id'}), HTTPStatus.UNAUTHORIZED
 
+        try:
+            limit = int(request.args.get('limit')) if request.args.get('limit') else None
+        except ValueError:
+            return jsonify({'message': 'limit must be a number.'}), HTTPStatus.BAD_REQUEST
+
         identifiers = []
-        bussinesses_no_taxid = Business.get_all_by_no_tax_id()
+        bussinesses_no_taxid = Business.get_all_by_no_tax_id(after_identifier=request.args.get('after', None),
+                                                             limit=limit)
         for business in bussinesses_no_taxid:
             identifiers.append(business.identifier)
         return jsonify({'identifiers': identifiers}), HTTPStatus.OK
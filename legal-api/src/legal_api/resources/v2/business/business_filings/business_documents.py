@@ -18,15 +18,17 @@ Provides all the search and retrieval from the business entity documents.
 from http import HTTPStatus
 from typing import Final
 
-import requests
 from flask import current_app, jsonify, request
 from flask_cors import cross_origin
+from werkzeug.http import quote_etag
 
 from legal_api.core import Filing
 from legal_api.exceptions import ErrorCode, get_error_message
 from legal_api.models import Business, Filing as FilingModel  # noqa: I001
 from legal_api.reports import get_pdf
+from legal_api.reports.output_cache import ReportOutputCache
 from legal_api.services import authorized
+from legal_api.services.http_client import http_client
 from legal_api.utils.auth import jwt
 from legal_api.utils.legislation_datetime import LegislationDatetime
 from legal_api.utils.util import cors_preflight
@@ -77,11 +79,33 @@ def get_documents(identifier: str, filing_id: int, legal_filing_name: str = None
         if legal_filing_name.lower().startswith('receipt'):
             return _get_receipt(business, filing, jwt.get_token_auth_header())
 
-        return get_pdf(filing.storage, legal_filing_name)
+        return _get_pdf(filing, legal_filing_name)
 
     return {}, HTTPStatus.NOT_FOUND
 
 
+def _get_pdf(filing: Filing, legal_filing_name: str):
+    """Get the pdf output, from the output cache for completed filings."""
+    if not (cache_key := ReportOutputCache.get_key(filing.storage, legal_filing_name)):
+        return get_pdf(filing.storage, legal_filing_name)
+
+    etag = ReportOutputCache.get_etag(cache_key)
+    headers = {'ETag': quote_etag(etag)}
+    if etag in request.if_none_match:
+        return '', HTTPStatus.NOT_MODIFIED, headers
+
+    if content := ReportOutputCache.get(cache_key):
+        return content, HTTPStatus.OK, headers
+
+    response = get_pdf(filing.storage, legal_filing_name)
+    content, status_code = response
+    if status_code != HTTPStatus.OK or not isinstance(content, bytes):
+        return response
+
+    ReportOutputCache.put(cache_key, content)
+    return content, status_code, headers
+
+
 def _get_document_list(business, filing):
     """Get list of document outputs."""
     if not (document_list := Filing.get_document_list(business, filing, request)):
@@ -108,7 +132,7 @@ def _get_receipt(business: Business, filing: Filing, token):
     headers = {'Authorization': 'Bearer ' + token}
 
     url = f'{current_app.config.get("PAYMENT_SVC_URL")}/{filing.storage.payment_token}/receipts'
-    receipt = requests.post(
+    receipt = http_client.post(
         url,
         json={
             'corpName': business.legal_name if business else filing.storage.temp_reg,
@@ -18,7 +18,6 @@ Provides all the search and retrieval from the business entity datastore.
 from http import HTTPStatus
 from typing import Generic, Optional, Tuple, TypeVar, Union
 
-import requests  # noqa: I001; grouping out of order to make both pylint & isort happy
 from requests import exceptions  # noqa: I001; grouping out of order to make both pylint & isort happy
 from flask import current_app, g, jsonify, request
 from flask_babel import _
@@ -48,6 +47,7 @@ from legal_api.services import (
 )
 from legal_api.services.authz import is_allowed
 from legal_api.services.filings import validate
+from legal_api.services.http_client import http_client
 from legal_api.services.utils import get_str
 from legal_api.utils import datetime
 from legal_api.utils.auth import jwt
@@ -228,7 +228,7 @@ def patch_filings(identifier, filing_id=None):
         payment_svc_url = '{}/{}'.format(current_app.config.get('PAYMENT_SVC_URL'), filing.payment_token)
         token = jwt.get_token_auth_header()
         headers = {'Authorization': 'Bearer ' + token}
-        rv = requests.delete(url=payment_svc_url, headers=headers, timeout=20.0)
+        rv = http_client.delete(url=payment_svc_url, headers=headers, timeout=20.0)
         if rv.status_code in (HTTPStatus.OK, HTTPStatus.ACCEPTED):
             filing.reset_filing_to_draft()
 
@@ -289,7 +289,7 @@ class ListFilingResource():
             payment_svc_url = current_app.config.get('PAYMENT_SVC_URL')
 
             if payment_token := filing_dict.get('filing', {}).get('header', {}).get('paymentToken'):
-                pay_response = requests.get(
+                pay_response = http_client.get(
                     url=f'{payment_svc_url}/{payment_token}',
                     headers=headers
                 )
@@ -762,10 +762,10 @@ class ListFilingResource():
             token = user_jwt.get_token_auth_header()
             headers = {'Authorization': 'Bearer ' + token,
                        'Content-Type': 'application/json'}
-            rv = requests.post(url=payment_svc_url,
-                               json=payload,
-                               headers=headers,
-                               timeout=20.0)
+            rv = http_client.post(url=payment_svc_url,
+                                  json=payload,
+                                  headers=headers,
+                                  timeout=20.0)
         except (exceptions.ConnectionError, exceptions.Timeout) as err:
             current_app.logger.error(f'Payment connection failure for {business.identifier}: filing:{filing.id}', err)
             return {'message': 'unable to create invoice for payment.'}, HTTPStatus.PAYMENT_REQUIRED
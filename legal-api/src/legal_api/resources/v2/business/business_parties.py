@@ -44,21 +44,15 @@ def get_parties(identifier, party_id=None):
             if request.args.get('date') else datetime.utcnow().date()
         party_roles = PartyRole.get_party_roles(business.id, end_date, request.args.get('role'))
 
-    party_role_dict = {}
     party_list = []
-    for party_role in party_roles:
-        party_role_json = party_role.json
-        party_role_dict.setdefault(party_role.party_id, []).append(
-              {'roleType': party_role_json['role'].replace('_', ' ').title(),
-               'appointmentDate': party_role_json['appointmentDate'],
-               'cessationDate': party_role_json['cessationDate']})
-    for key, value in party_role_dict.items():
-        party = [x for x in party_roles if x.party_id == key][0]
-        party_json = party.json
-        del party_json['role']
-        del party_json['appointmentDate']
-        del party_json['cessationDate']
-        party_json['roles'] = value
+    for roles in PartyRole.group_by_party(party_roles).values():
+        party_json = roles[0].party.json
+        party_json['roles'] = []
+        for party_role in roles:
+            role_json = party_role.role_json
+            party_json['roles'].append({'roleType': role_json['role'].replace('_', ' ').title(),
+                                        'appointmentDate': role_json['appointmentDate'],
+                                        'cessationDate': role_json['cessationDate']})
         party_list.append(party_json)
 
     if party_id:
@@ -16,16 +16,18 @@
 Provides all the search and retrieval from the business filings datastore.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from http import HTTPStatus
+from typing import Dict, Optional
 
-import requests
 from requests import exceptions  # noqa I001
 from flask import current_app, jsonify
 from flask_cors import cross_origin
 
 from legal_api.models import Business, Filing
 from legal_api.services import check_compliance, namex
+from legal_api.services.http_client import http_client
 from legal_api.utils.auth import jwt
 
 from .bp import bp
@@ -105,30 +107,14 @@ def construct_task_list(business):  # pylint: disable=too-many-locals; only 2 ex
                                                                  Filing.Status.PENDING.value,
                                                                  Filing.Status.PENDING_CORRECTION.value,
                                                                  Filing.Status.ERROR.value])
-    # Create a todo item for each pending filing
-    for filing in pending_filings:
-        filing_json = filing.json
-        if filing.payment_status_code == 'CREATED' and filing.payment_token:
-            # get current pay details from pay-api
-            try:
-                headers = {
-                    'Authorization': f'Bearer {jwt.get_token_auth_header()}',
-                    'Content-Type': 'application/json'
-                }
-                pay_response = requests.get(
-                    url=f'{current_app.config.get("PAYMENT_SVC_URL")}/{filing.payment_token}',
-                    headers=headers
-                )
-                pay_details = {
-                    'isPaymentActionRequired': pay_response.json().get('isPaymentActionRequired', False),
-                    'paymentMethod': pay_response.json().get('paymentMethod', '')
-                }
-                filing_json['filing']['header'].update(pay_details)
+    pay_details = _get_pay_details(business, pending_filings)
+    if pay_details is None:
+        return 'pay_connection_error'
 
-            except (exceptions.ConnectionError, exceptions.Timeout) as err:
-                current_app.logger.error(
-                    f'Payment connection failure for {business.identifier} task list. ', err)
-                return 'pay_connection_error'
+    # Create a todo item for each pending filing
+    for filing, filing_json in zip(pending_filings, Filing.get_json_projections(pending_filings)):
+        if details := pay_details.get(filing.payment_token):
+            filing_json['filing']['header'].update(details)
 
         task = {'task': filing_json, 'order': order, 'enabled': True}
         tasks.append(task)
@@ -158,6 +144,46 @@ def construct_task_list(business):  # pylint: disable=too-many-locals; only 2 ex
     return tasks
 
 
+def _get_pay_details(business, pending_filings) -> Optional[Dict[str, dict]]:
+    """Return the current pay-api details of the filings awaiting payment, keyed by payment token.
+
+    The lookups run concurrently, once per payment token. Returns None if a lookup fails, unless
+    TASK_LIST_PAY_PARTIAL_FAILURE is set, in which case the filings that failed are left without the details.
+    """
+    payment_tokens = {filing.payment_token for filing in pending_filings
+                      if filing.payment_status_code == 'CREATED' and filing.payment_token}
+    if not payment_tokens:
+        return {}
+
+    # the worker threads have no request context, so build everything they need here
+    payment_svc_url = current_app.config.get('PAYMENT_SVC_URL')
+    headers = {
+        'Authorization': f'Bearer {jwt.get_token_auth_header()}',
+        'Content-Type': 'application/json'
+    }
+
+    def get_details(payment_token):
+        pay_response = http_client.get(url=f'{payment_svc_url}/{payment_token}', headers=headers)
+        return {
+            'isPaymentActionRequired': pay_response.json().get('isPaymentActionRequired', False),
+            'paymentMethod': pay_response.json().get('paymentMethod', '')
+        }
+
+    pay_details = {}
+    max_workers = min(len(payment_tokens), current_app.config.get('TASK_LIST_PAY_MAX_WORKERS', 5))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_details, payment_token): payment_token for payment_token in payment_tokens}
+        for future in as_completed(futures):
+            try:
+                pay_details[futures[future]] = future.result()
+            except (exceptions.ConnectionError, exceptions.Timeout) as err:
+                current_app.logger.error(
+                    f'Payment connection failure for {business.identifier} task list. ', err)
+                if not current_app.config.get('TASK_LIST_PAY_PARTIAL_FAILURE'):
+                    return None
+    return pay_details
+
+
 def create_todo(business, ar_year, ar_min_date, ar_max_date, order, enabled):  # pylint: disable=too-many-arguments
     """Return a to-do JSON object."""
     todo = {
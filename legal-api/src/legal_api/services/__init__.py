@@ -18,11 +18,13 @@ from .business_details_version import VersionedBusinessDetailsService
 from .compliance import check_compliance
 from .document_meta import DocumentMetaService
 from .flags import Flags
+from .http_client import HttpClient
 from .minio import MinioService
 from .naics import NaicsService
 from .namex import NameXService
 from .pdf_service import PdfService
 from .queue import QueueService
+from .token_cache import TokenCache, TokenError, token_cache
 
 
 flags = Flags()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This manages all of the authentication and authorization service."""
+import threading
+import time
+from collections import OrderedDict
 from http import HTTPStatus
-from typing import Final, List
+from typing import Dict, Final, List, Optional, Tuple
 
-from flask import current_app
+from flask import current_app, g
 from flask_jwt_oidc import JwtManager
-from requests import Session, exceptions
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from requests import exceptions
 
 from legal_api.models import Business
+from legal_api.services.http_client import http_client
 
 
 SYSTEM_ROLE = 'system'
@@ -31,6 +33,89 @@ COLIN_SVC_ROLE = 'colin'
 PUBLIC_USER = 'public_user'
 
 
+class RoleCache():
+    """Bounded LRU cache of the roles the auth service grants a user on a business.
+
+    A UI page load fans out to many endpoints for the same business, so the roles are kept for a short time keyed by
+    (token subject, identifier). Denials are cached too, for a shorter time.
+    """
+
+    def __init__(self):
+        """Initialize this object."""
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[List[str]]:
+        """Return the cached roles, or None if there is no fresh entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple[str, str], roles: List[str], ttl: float, maxsize: int):
+        """Cache the roles for ttl seconds, evicting the least recently used entries past maxsize."""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (roles, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, identifier: str = None, subject: str = None):
+        """Drop the entries of a business and/or user, or every entry when neither is given."""
+        with self._lock:
+            for key in list(self._entries):
+                if (subject is None or key[0] == subject) and (identifier is None or key[1] == identifier):
+                    del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters and the number of cached entries."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+role_cache = RoleCache()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
+
+
+def _get_roles(identifier: str, jwt: JwtManager) -> List[str]:
+    """Return the roles the auth service grants the user on the business, using the role cache."""
+    token = jwt.get_token_auth_header()
+    token_info = getattr(g, 'jwt_oidc_token_info', None) or {}
+    key = (token_info.get('sub') or token, identifier)
+    if (roles := role_cache.get(key)) is not None:
+        return roles
+
+    template_url = current_app.config.get('AUTH_SVC_URL')
+    auth_url = template_url.format(identifier=identifier)
+    headers = {'Authorization': 'Bearer ' + token}
+    rv = http_client.get(url=auth_url, headers=headers)
+
+    if rv.status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN, HTTPStatus.NOT_FOUND) \
+            or (rv.status_code == HTTPStatus.OK and not rv.json().get('roles')):
+        role_cache.put(key, [],
+                       ttl=current_app.config.get('AUTHZ_CACHE_DENIED_TTL', 0),
+                       maxsize=current_app.config.get('AUTHZ_CACHE_MAXSIZE', 1000))
+        return []
+    if rv.status_code != HTTPStatus.OK:
+        # the auth service failed, e.g. it is down, so the lookup is not cached as a denial
+        return []
+
+    roles = rv.json().get('roles')
+    role_cache.put(key, roles,
+                   ttl=current_app.config.get('AUTHZ_CACHE_TTL', 0),
+                   maxsize=current_app.config.get('AUTHZ_CACHE_MAXSIZE', 1000))
+    return roles
+
+
 def authorized(  # pylint: disable=too-many-return-statements
         identifier: str, jwt: JwtManager, action: List[str]) -> bool:
     """Assert that the user is authorized to create filings against the business identifier."""
@@ -51,31 +136,16 @@ def authorized(  # pylint: disable=too-many-return-statements
         if any(elem in action for elem in staff_only_actions):
             return False
 
-        template_url = current_app.config.get('AUTH_SVC_URL')
-        auth_url = template_url.format(**vars())
-
-        token = jwt.get_token_auth_header()
-        headers = {'Authorization': 'Bearer ' + token}
         try:
-            http = Session()
-            retries = Retry(total=5,
-                            backoff_factor=0.1,
-                            status_forcelist=[500, 502, 503, 504])
-            http.mount('http://', HTTPAdapter(max_retries=retries))
-            rv = http.get(url=auth_url, headers=headers)
-
-            if rv.status_code != HTTPStatus.OK \
-                    or not rv.json().get('roles'):
-                return False
-
-            if all(elem.lower() in rv.json().get('roles') for elem in action):
+            roles = _get_roles(identifier, jwt)
+            if roles and all(elem.lower() in roles for elem in action):
                 return True
 
         except (exceptions.ConnectionError,  # pylint: disable=broad-except
                 exceptions.Timeout,
                 ValueError,
                 Exception) as err:
-            current_app.logger.error(f'template_url {template_url}, svc:{auth_url}')
+            auth_url = current_app.config.get('AUTH_SVC_URL')
             current_app.logger.error(f'Authorization connection failure for {identifier}, using svc:{auth_url}', err)
             return False
 
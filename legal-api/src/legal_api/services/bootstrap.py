@@ -20,12 +20,13 @@ import string
 from http import HTTPStatus
 from typing import Dict, Union
 
-import requests
 from flask import current_app
 from flask_babel import _ as babel  # noqa: N813, I001, I003 casting _ to babel
 from sqlalchemy.orm.exc import FlushError  # noqa: I001
 
 from legal_api.models import RegistrationBootstrap  # noqa: D204, I003, I001;# due to babel cast above
+from legal_api.services.http_client import http_client  # noqa: I001
+from legal_api.services.token_cache import TokenError, token_cache  # noqa: I001
 
 
 class RegistrationBootstrapService:
@@ -92,7 +93,7 @@ class RegistrationBootstrapService:
 class AccountService:
     """Wrapper to call Authentication Services.
 
-    @TODO Cache and refresh / retry token as needed to reduce calls.
+    The service account token is cached by token_cache and refreshed before it expires.
     """
 
     BEARER: str = 'Bearer '
@@ -110,18 +111,9 @@ class AccountService:
         client_id = current_app.config.get('ACCOUNT_SVC_CLIENT_ID')
         client_secret = current_app.config.get('ACCOUNT_SVC_CLIENT_SECRET')
 
-        data = 'grant_type=client_credentials'
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={'content-type': 'application/x-www-form-urlencoded'},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
         try:
-            return res.json().get('access_token')
-        except Exception:
+            return token_cache.get_token(token_url, client_id, client_secret, timeout=cls.timeout)
+        except TokenError:
             return None
 
     @classmethod
@@ -144,7 +136,7 @@ class AccountService:
                                   'corpTypeCode': corp_type_code,
                                   'name': business_name or business_registration
                                   })
-        entity_record = requests.post(
+        entity_record = http_client.post(
             url=account_svc_entity_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -157,7 +149,7 @@ class AccountService:
             'businessIdentifier': business_registration,
             'passCode': ''
         })
-        affiliate = requests.post(
+        affiliate = http_client.post(
             url=account_svc_affiliate_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -189,7 +181,7 @@ class AccountService:
             'corpTypeCode': corp_type_code,
             'name': business_name
         })
-        entity_record = requests.patch(
+        entity_record = http_client.patch(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -214,14 +206,14 @@ class AccountService:
         token = cls.get_bearer_token()
 
         # Delete an account:business affiliation
-        affiliate = requests.delete(
+        affiliate = http_client.delete(
             url=account_svc_affiliate_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
             timeout=cls.timeout
         )
         # Delete an entity record
-        entity_record = requests.delete(
+        entity_record = http_client.delete(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -14,9 +14,12 @@
 
 """This provides the service for getting business details as of a filing."""
 # pylint: disable=singleton-comparison ; pylint does not recognize sqlalchemy ==
+import copy
 from datetime import datetime
+from typing import Optional
 
 import pycountry
+from flask import current_app
 from sqlalchemy import or_
 from sqlalchemy_continuum import version_class
 
@@ -24,6 +27,7 @@ from legal_api.models import (
     Address,
     Alias,
     Business,
+    BusinessRevisionSnapshot,
     Filing,
     Office,
     Party,
@@ -38,26 +42,24 @@ from legal_api.models import (
 class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-methods
     """Provides service for getting business details as of a filing."""
 
+    # filing types whose json is rebuilt from the version tables, and so are worth a snapshot
+    SNAPSHOT_FILING_TYPES = ['incorporationApplication', 'changeOfDirectors', 'changeOfAddress', 'annualReport']
+
     @staticmethod
     def get_revision(filing_id, business_id):
-        """Consolidates based on filing type upto the given transaction id of a filing."""
+        """Consolidates based on filing type upto the given transaction id of a filing.
+
+        The snapshot of a completed filing is used when there is one, otherwise it is reconstructed.
+        """
         business = Business.find_by_internal_id(business_id)
         filing = Filing.find_by_id(filing_id)
 
         revision_json = {}
         revision_json['filing'] = {}
-        if filing.filing_type == 'incorporationApplication':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_ia_revision(filing, business)
-        elif filing.filing_type == 'changeOfDirectors':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_cod_revision(filing, business)
-        elif filing.filing_type == 'changeOfAddress':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_coa_revision(filing, business)
-        elif filing.filing_type == 'annualReport':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_ar_revision(filing, business)
+        if snapshot := VersionedBusinessDetailsService.find_revision_snapshot(filing):
+            revision_json['filing'] = copy.deepcopy(snapshot.revision_json)
+        elif filing.filing_type in VersionedBusinessDetailsService.SNAPSHOT_FILING_TYPES:
+            revision_json['filing'] = VersionedBusinessDetailsService.get_filing_revision(filing, business)
         elif filing.filing_type == 'correction':
             revision_json = filing.json
 
@@ -75,6 +77,66 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
 
         return revision_json
 
+    @staticmethod
+    def get_filing_revision(filing, business) -> Optional[dict]:
+        """Reconstruct the filing json, without the header, from the version tables."""
+        if filing.filing_type == 'incorporationApplication':
+            return VersionedBusinessDetailsService.get_ia_revision(filing, business)
+        if filing.filing_type == 'changeOfDirectors':
+            return VersionedBusinessDetailsService.get_cod_revision(filing, business)
+        if filing.filing_type == 'changeOfAddress':
+            return VersionedBusinessDetailsService.get_coa_revision(filing, business)
+        if filing.filing_type == 'annualReport':
+            return VersionedBusinessDetailsService.get_ar_revision(filing, business)
+        return None
+
+    @staticmethod
+    def find_revision_snapshot(filing) -> Optional[BusinessRevisionSnapshot]:
+        """Return the snapshot of a completed filing, if one has been stored."""
+        if filing.status not in [Filing.Status.COMPLETED.value, Filing.Status.CORRECTED.value] \
+                or not filing.transaction_id \
+                or filing.filing_type not in VersionedBusinessDetailsService.SNAPSHOT_FILING_TYPES:
+            return None
+        return BusinessRevisionSnapshot.find_by_filing(filing.id, filing.transaction_id)
+
+    @staticmethod
+    def save_revision_snapshot(filing_id) -> Optional[BusinessRevisionSnapshot]:
+        """Store the snapshot of a completed filing in the session, the caller is responsible for the commit.
+
+        Returns the existing snapshot if there is one, or None if the filing isn't one that gets a snapshot.
+        """
+        filing = Filing.find_by_id(filing_id)
+        if not filing \
+                or filing.status not in [Filing.Status.COMPLETED.value, Filing.Status.CORRECTED.value] \
+                or not filing.transaction_id \
+                or not filing.business_id \
+                or filing.filing_type not in VersionedBusinessDetailsService.SNAPSHOT_FILING_TYPES:
+            return None
+
+        if snapshot := BusinessRevisionSnapshot.find_by_filing(filing.id, filing.transaction_id):
+            return snapshot
+
+        business = Business.find_by_internal_id(filing.business_id)
+        snapshot = BusinessRevisionSnapshot(
+            business_id=filing.business_id,
+            filing_id=filing.id,
+            transaction_id=filing.transaction_id,
+            revision_json=VersionedBusinessDetailsService.get_filing_revision(filing, business)
+        )
+        snapshot.save_to_session()
+        return snapshot
+
+    @staticmethod
+    def invalidate_revision_snapshot(filing_id) -> int:
+        """Remove the snapshots of a filing, in the session, so they are rebuilt on the next request.
+
+        Called when a correction is filed against the filing.
+        """
+        removed = BusinessRevisionSnapshot.delete_by_filing(filing_id)
+        if removed:
+            current_app.logger.debug(f'Invalidated {removed} revision snapshot(s) for filing: {filing_id}')
+        return removed
+
     @staticmethod
     def get_ia_revision(filing, business) -> dict:
         """Consolidates incorporation application upto the given transaction id of a filing."""
@@ -230,6 +292,29 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .order_by(business_version.transaction_id).one_or_none()
         return business_revision
 
+    @staticmethod
+    def get_business_revisions(business) -> list:
+        """Return all the business version objects for a business, ordered by transaction id.
+
+        Used with find_business_revision to resolve many transactions without a query per transaction.
+        """
+        business_version = version_class(Business)
+        business_revisions = db.session.query(business_version) \
+            .filter(business_version.operation_type != 2) \
+            .filter(business_version.id == business.id) \
+            .order_by(business_version.transaction_id).all()
+        return business_revisions
+
+    @staticmethod
+    def find_business_revision(business_revisions: list, transaction_id):
+        """Return the business version object from business_revisions that was current at the transaction id."""
+        for business_revision in business_revisions:
+            if business_revision.transaction_id <= transaction_id and \
+                    (business_revision.end_transaction_id is None or
+                     business_revision.end_transaction_id > transaction_id):
+                return business_revision
+        return None
+
     @staticmethod
     def get_business_revision_before_filing(filing_id, business_id) -> dict:
         """Consolidates the business info of the previous filing."""
@@ -271,16 +356,22 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
                         offices_version.end_transaction_id > transaction_id)) \
             .order_by(offices_version.transaction_id).all()
 
-        for office in offices:
-            offices_json[office.office_type] = {}
+        # fetch the addresses of all the offices at once and group them in memory
+        office_addresses = {office.id: [] for office in offices}
+        if office_addresses:
             addresses_list = db.session.query(address_version) \
                 .filter(address_version.transaction_id <= transaction_id) \
                 .filter(address_version.operation_type != 2) \
-                .filter(address_version.office_id == office.id) \
+                .filter(address_version.office_id.in_(office_addresses.keys())) \
                 .filter(or_(address_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
                             address_version.end_transaction_id > transaction_id)) \
                 .order_by(address_version.transaction_id).all()
             for address in addresses_list:
+                office_addresses[address.office_id].append(address)
+
+        for office in offices:
+            offices_json[office.office_type] = {}
+            for address in office_addresses[office.id]:
                 offices_json[office.office_type][f'{address.address_type}Address'] = \
                     VersionedBusinessDetailsService.address_revision_json(address)
 
@@ -299,16 +390,30 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .filter(or_(party_role_version.end_transaction_id == None,   # pylint: disable=singleton-comparison # noqa: E711,E501;
                         party_role_version.end_transaction_id > transaction_id)) \
             .order_by(party_role_version.transaction_id).all()
+        party_roles = [party_role for party_role in party_roles if party_role.cessation_date is None]
+
+        # fetch the parties and their addresses for all the roles at once
+        party_revisions = VersionedBusinessDetailsService.get_party_revisions(
+            transaction_id, {party_role.party_id for party_role in party_roles})
+        address_ids = set()
+        for party_revision in party_revisions.values():
+            address_ids.update({party_revision.delivery_address_id, party_revision.mailing_address_id})
+        address_revisions = VersionedBusinessDetailsService.get_address_revisions(transaction_id, address_ids)
+
         parties = []
+        parties_by_officer_id = {}
         for party_role in party_roles:
-            if party_role.cessation_date is None:
-                party_role_json = VersionedBusinessDetailsService.party_role_revision_json(transaction_id,
-                                                                                           party_role, is_ia_or_after)
-                if 'roles' in party_role_json and (party := next((x for x in parties if x['officer']['id']
-                                                                  == party_role_json['officer']['id']), None)):
-                    party['roles'].extend(party_role_json['roles'])
-                else:
-                    parties.append(party_role_json)
+            party_role_json = VersionedBusinessDetailsService.party_role_revision_json(
+                transaction_id, party_role, is_ia_or_after,
+                party_revision=party_revisions.get(party_role.party_id),
+                address_revisions=address_revisions)
+            if 'roles' in party_role_json and \
+                    (party := parties_by_officer_id.get(party_role_json['officer'].get('id'))):
+                party['roles'].extend(party_role_json['roles'])
+            else:
+                parties.append(party_role_json)
+                if 'roles' in party_role_json:
+                    parties_by_officer_id[party_role_json['officer']['id']] = party_role_json
 
         return parties
 
@@ -323,11 +428,12 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .filter(or_(share_class_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
                         share_class_version.end_transaction_id > transaction_id)) \
             .order_by(share_class_version.transaction_id).all()
+        share_series = VersionedBusinessDetailsService.get_share_series_revisions(
+            transaction_id, [share_class.id for share_class in share_classes_list])
         share_classes = []
         for share_class in share_classes_list:
             share_class_json = VersionedBusinessDetailsService.share_class_revision_json(share_class)
-            share_class_json['series'] = VersionedBusinessDetailsService.get_share_series_revision(transaction_id,
-                                                                                                   share_class.id)
+            share_class_json['series'] = share_series.get(share_class.id, [])
             share_class_json['type'] = 'Class'
             share_class_json['id'] = str(share_class_json['id'])
             share_classes.append(share_class_json)
@@ -352,6 +458,31 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             share_series_arr.append(share_series_json)
         return share_series_arr
 
+    @staticmethod
+    def get_share_series_revisions(transaction_id, share_class_ids: list) -> dict:
+        """Consolidates all share series of the share classes upto the given transaction id, in one query.
+
+        Returns a dict of share class id to its list of share series json.
+        """
+        share_series_by_class = {}
+        if not share_class_ids:
+            return share_series_by_class
+
+        share_series_version = version_class(ShareSeries)
+        share_series_list = db.session.query(share_series_version) \
+            .filter(share_series_version.transaction_id <= transaction_id) \
+            .filter(share_series_version.operation_type != 2) \
+            .filter(share_series_version.share_class_id.in_(share_class_ids)) \
+            .filter(or_(share_series_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
+                        share_series_version.end_transaction_id > transaction_id)) \
+            .order_by(share_series_version.transaction_id).all()
+        for share_series in share_series_list:
+            share_series_json = VersionedBusinessDetailsService.share_series_revision_json(share_series)
+            share_series_json['type'] = 'Series'
+            share_series_json['id'] = str(share_series_json['id'])
+            share_series_by_class.setdefault(share_series.share_class_id, []).append(share_series_json)
+        return share_series_by_class
+
     @staticmethod
     def get_name_translations_revision(transaction_id, business_id) -> dict:
         """Consolidates all name translations upto the given transaction id."""
@@ -405,13 +536,19 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         return resolutions_arr
 
     @staticmethod
-    def party_role_revision_json(transaction_id, party_role_revision, is_ia_or_after) -> dict:
-        """Return the party member as a json object."""
+    def party_role_revision_json(transaction_id, party_role_revision, is_ia_or_after,
+                                 party_revision=None, address_revisions: dict = None) -> dict:
+        """Return the party member as a json object.
+
+        The party and address revisions are queried unless they have been preloaded and passed in.
+        """
         cessation_date = datetime.date(party_role_revision.cessation_date).isoformat()\
             if party_role_revision.cessation_date else None
-        party_revision = VersionedBusinessDetailsService.get_party_revision(transaction_id,
-                                                                            party_role_revision.party_id)
-        party = VersionedBusinessDetailsService.party_revision_json(transaction_id, party_revision, is_ia_or_after)
+        if party_revision is None:
+            party_revision = VersionedBusinessDetailsService.get_party_revision(transaction_id,
+                                                                                party_role_revision.party_id)
+        party = VersionedBusinessDetailsService.party_revision_json(transaction_id, party_revision, is_ia_or_after,
+                                                                    address_revisions)
 
         if is_ia_or_after:
             party['roles'] = [{
@@ -442,6 +579,24 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .order_by(party_version.transaction_id).one_or_none()
         return party
 
+    @staticmethod
+    def get_party_revisions(transaction_id, party_ids) -> dict:
+        """Consolidates all the parties changes upto the given transaction id, in one query.
+
+        Returns a dict of party id to party revision.
+        """
+        if not party_ids:
+            return {}
+        party_version = version_class(Party)
+        parties = db.session.query(party_version) \
+            .filter(party_version.transaction_id <= transaction_id) \
+            .filter(party_version.operation_type != 2) \
+            .filter(party_version.id.in_(party_ids)) \
+            .filter(or_(party_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
+                        party_version.end_transaction_id > transaction_id)) \
+            .order_by(party_version.transaction_id).all()
+        return {party.id: party for party in parties}
+
     @staticmethod
     def party_revision_type_json(party_revision, is_ia_or_after) -> dict:
         """Return the party member by type as a json object."""
@@ -472,12 +627,19 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         return member
 
     @staticmethod
-    def party_revision_json(transaction_id, party_revision, is_ia_or_after) -> dict:
-        """Return the party member as a json object."""
+    def party_revision_json(transaction_id, party_revision, is_ia_or_after, address_revisions: dict = None) -> dict:
+        """Return the party member as a json object.
+
+        address_revisions is a dict of address id to preloaded address revision, the addresses are queried if not set.
+        """
+        def get_address_revision(address_id):
+            if address_revisions is not None:
+                return address_revisions.get(address_id)
+            return VersionedBusinessDetailsService.get_address_revision(transaction_id, address_id)
+
         member = VersionedBusinessDetailsService.party_revision_type_json(party_revision, is_ia_or_after)
         if party_revision.delivery_address_id:
-            address_revision = VersionedBusinessDetailsService.get_address_revision(
-                transaction_id, party_revision.delivery_address_id)
+            address_revision = get_address_revision(party_revision.delivery_address_id)
             # This condition can be removed once we correct data in address and address_version table
             # by removing empty address entry.
             if address_revision and address_revision.postal_code:
@@ -488,13 +650,12 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         if party_revision.mailing_address_id:
             member_mailing_address = \
                 VersionedBusinessDetailsService.address_revision_json(
-                    VersionedBusinessDetailsService.get_address_revision
-                    (transaction_id, party_revision.mailing_address_id))
+                    get_address_revision(party_revision.mailing_address_id))
             if 'addressType' in member_mailing_address:
                 del member_mailing_address['addressType']
             member['mailingAddress'] = member_mailing_address
         else:
-            if party_revision.delivery_address:
+            if 'deliveryAddress' in member:
                 member['mailingAddress'] = member['deliveryAddress']
 
         if is_ia_or_after:
@@ -517,6 +678,25 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .order_by(address_version.transaction_id).one_or_none()
         return address
 
+    @staticmethod
+    def get_address_revisions(transaction_id, address_ids) -> dict:
+        """Consolidates all the addresses changes upto the given transaction id, in one query.
+
+        Returns a dict of address id to address revision.
+        """
+        address_ids = [address_id for address_id in address_ids if address_id]
+        if not address_ids:
+            return {}
+        address_version = version_class(Address)
+        addresses = db.session.query(address_version) \
+            .filter(address_version.transaction_id <= transaction_id) \
+            .filter(address_version.operation_type != 2) \
+            .filter(address_version.id.in_(address_ids)) \
+            .filter(or_(address_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
+                        address_version.end_transaction_id > transaction_id)) \
+            .order_by(address_version.transaction_id).all()
+        return {address.id: address for address in addresses}
+
     @staticmethod
     def address_revision_json(address_revision):
         """Return a dict of this object, with keys in JSON format."""
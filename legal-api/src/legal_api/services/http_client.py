@@ -0,0 +1,146 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared HTTP client for the calls legal-api makes to the other services.
+
+A single requests.Session is shared by the process, so connections to each upstream host are pooled and kept alive
+between calls instead of being opened for every request. Every call gets a default timeout and idempotent calls are
+retried with backoff on connection errors and 5xx responses. The latency and errors of each upstream are recorded.
+"""
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from requests import Response, Session, exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient():
+    """Pooled, keep-alive HTTP client with timeouts, retries and per-upstream metrics."""
+
+    RETRY_STATUSES = [500, 502, 503, 504]
+
+    def __init__(self, app=None):
+        """Initialize this object."""
+        self.pool_connections = 10
+        self.pool_maxsize = 20
+        self.timeout = (5.0, 20.0)
+        self.retries = 3
+        self.backoff_factor = 0.1
+        self._session = None
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict] = {}
+
+        if app:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the pools, timeouts and retries from the app config."""
+        self.pool_connections = app.config.get('HTTP_CLIENT_POOL_CONNECTIONS', self.pool_connections)
+        self.pool_maxsize = app.config.get('HTTP_CLIENT_POOL_MAXSIZE', self.pool_maxsize)
+        self.timeout = (app.config.get('HTTP_CLIENT_CONNECT_TIMEOUT', self.timeout[0]),
+                        app.config.get('HTTP_CLIENT_READ_TIMEOUT', self.timeout[1]))
+        self.retries = app.config.get('HTTP_CLIENT_RETRIES', self.retries)
+        self.backoff_factor = app.config.get('HTTP_CLIENT_BACKOFF_FACTOR', self.backoff_factor)
+        with self._lock:
+            if self._session:
+                self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> Session:
+        """Return the shared session, created on first use."""
+        if not self._session:
+            with self._lock:
+                if not self._session:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Session:
+        # only the idempotent methods are retried, the default for urllib3
+        retries = Retry(total=self.retries,
+                        backoff_factor=self.backoff_factor,
+                        status_forcelist=self.RETRY_STATUSES,
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              max_retries=retries)
+        session = Session()
+        # the session is shared by the calls made for every user, so cookies set by an upstream are never kept
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Send the request on the shared session, recording the latency and any error against the upstream."""
+        kwargs.setdefault('timeout', self.timeout)
+        upstream = urlsplit(url).netloc
+        start = time.perf_counter()
+        try:
+            response = getattr(self.session, method.lower())(url, **kwargs)
+        except exceptions.RequestException:
+            self._record(upstream, time.perf_counter() - start, error=True)
+            raise
+        self._record(upstream, time.perf_counter() - start, error=response.status_code >= 500)
+        return response
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Send a GET request."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        """Send a POST request."""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        """Send a PUT request."""
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        """Send a PATCH request."""
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        """Send a DELETE request."""
+        return self.request('DELETE', url, **kwargs)
+
+    def _record(self, upstream: str, elapsed: float, error: bool):
+        with self._lock:
+            metrics = self._metrics.setdefault(upstream, {'requests': 0, 'errors': 0, 'totalMs': 0.0, 'maxMs': 0.0})
+            metrics['requests'] += 1
+            metrics['errors'] += int(error)
+            metrics['totalMs'] += elapsed * 1000
+            metrics['maxMs'] = max(metrics['maxMs'], elapsed * 1000)
+
+    def metrics(self, upstream: Optional[str] = None) -> Dict:
+        """Return the request count, error count and latency of each upstream host."""
+        with self._lock:
+            snapshot = {
+                host: {**values,
+                       'avgMs': round(values['totalMs'] / values['requests'], 2) if values['requests'] else 0.0}
+                for host, values in self._metrics.items()
+            }
+        return snapshot.get(upstream, {}) if upstream else snapshot
+
+    def reset_metrics(self):
+        """Clear the recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+
+http_client = HttpClient()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
@@ -15,10 +15,10 @@
 """This provides the service for naics-api calls."""
 
 
-import requests
 from flask import current_app
 
 from legal_api.services.bootstrap import AccountService
+from legal_api.services.http_client import http_client
 
 
 class NaicsService:
@@ -30,7 +30,7 @@ class NaicsService:
         try:
             naics_url = current_app.config.get('NAICS_API_URL')
             token = AccountService.get_bearer_token()
-            response = requests.get(naics_url + '/' + naics_code, headers={
+            response = http_client.get(naics_url + '/' + naics_code, headers={
                 'Content-Type': 'application/json',
                 'Authorization': 'Bearer ' + token
             })
@@ -18,10 +18,11 @@ from enum import Enum
 
 import datedelta
 import pytz
-import requests
 from flask import current_app
 
 from ..models import Filing
+from .http_client import http_client
+from .token_cache import TokenError, token_cache
 from .utils import get_str
 
 
@@ -55,17 +56,14 @@ class NameXService():
         namex_url = current_app.config.get('NAMEX_SVC_URL')
 
         # Get access token for namex-api in a different keycloak realm
-        auth = requests.post(auth_url, auth=(username, secret), headers={
-            'Content-Type': 'application/x-www-form-urlencoded'}, data={'grant_type': 'client_credentials'})
-
-        # Return the auth response if an error occurs
-        if auth.status_code != 200:
-            return auth.json()
-
-        token = dict(auth.json())['access_token']
+        try:
+            token = token_cache.get_token(auth_url, username, secret)
+        except TokenError as err:
+            # Return the auth response if an error occurs
+            return err.response.json()
 
         # Perform proxy call using the inputted identifier (e.g. NR 1234567)
-        nr_response = requests.get(namex_url + 'requests/' + identifier, headers={
+        nr_response = http_client.get(namex_url + 'requests/' + identifier, headers={
             'Content-Type': 'application/json',
             'Authorization': 'Bearer ' + token
         })
@@ -81,17 +79,14 @@ class NameXService():
         namex_url = current_app.config.get('NAMEX_SVC_URL')
 
         # Get access token for namex-api in a different keycloak realm
-        auth = requests.post(auth_url, auth=(username, secret), headers={
-            'Content-Type': 'application/x-www-form-urlencoded'}, data={'grant_type': 'client_credentials'})
-
-        # Return the auth response if an error occurs
-        if auth.status_code != 200:
-            return auth.json()
-
-        token = dict(auth.json())['access_token']
+        try:
+            token = token_cache.get_token(auth_url, username, secret)
+        except TokenError as err:
+            # Return the auth response if an error occurs
+            return err.response.json()
 
         # Perform update proxy call using nr number (e.g. NR 1234567)
-        nr_response = requests.put(namex_url + 'requests/' + nr_json['nrNum'], headers={
+        nr_response = http_client.put(namex_url + 'requests/' + nr_json['nrNum'], headers={
             'Content-Type': 'application/json',
             'Authorization': 'Bearer ' + token
         }, json=nr_json)
@@ -0,0 +1,127 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process wide cache of the service account (client credentials) tokens.
+
+Tokens are keyed by the token endpoint (the keycloak realm / audience) and client id. A token is refreshed once it is
+within the refresh margin of its expiry. Only one thread refreshes a given token at a time; while the old token is
+still valid the other threads keep using it, otherwise they wait for the refresh to finish.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from requests import Response, exceptions
+
+from legal_api.services.http_client import http_client
+
+
+class TokenError(Exception):
+    """Raised when the token endpoint does not return a token."""
+
+    def __init__(self, response: Optional[Response] = None):
+        """Initialize the exception with the response of the token endpoint."""
+        super().__init__('Unable to get a service account token.')
+        self.response = response
+
+
+@dataclass
+class _Token:
+    access_token: str
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def refresh_at(self) -> float:
+        """Return when the token should be refreshed, at the latest half way through its lifetime."""
+        return self.expires_at - min(TokenCache.REFRESH_MARGIN, (self.expires_at - self.fetched_at) / 2)
+
+
+class TokenCache():
+    """Thread safe cache of client credentials tokens."""
+
+    DEFAULT_EXPIRES_IN = 300  # used when the token endpoint does not say
+    REFRESH_MARGIN = 60
+
+    def __init__(self):
+        """Initialize this object."""
+        self._tokens: Dict[Tuple[str, str], _Token] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, token_url: str, client_id: str, client_secret: str, timeout=None) -> str:
+        """Return a cached token for the client, fetching a new one when it is close to expiry."""
+        key = (token_url, client_id)
+        token = self._tokens.get(key)
+        now = time.time()
+        if token and now < token.refresh_at:
+            return token.access_token
+
+        lock = self._key_lock(key)
+        if token and now < token.expires_at:
+            # still valid, refresh proactively unless another thread already is
+            if not lock.acquire(blocking=False):
+                return token.access_token
+        else:
+            lock.acquire()  # pylint: disable=consider-using-with; released below
+        try:
+            token = self._tokens.get(key)
+            if token and time.time() < token.refresh_at:
+                return token.access_token  # refreshed by another thread while waiting
+            try:
+                new_token = self._fetch(token_url, client_id, client_secret, timeout)
+            except (TokenError, exceptions.RequestException):
+                if token and time.time() < token.expires_at:
+                    return token.access_token  # keep using it until it expires, the next call retries
+                raise
+            self._tokens[key] = new_token
+            return new_token.access_token
+        finally:
+            lock.release()
+
+    def invalidate(self, token_url: str, client_id: str):
+        """Drop the cached token, e.g. after the upstream rejected it."""
+        self._tokens.pop((token_url, client_id), None)
+
+    def clear(self):
+        """Drop all the cached tokens."""
+        self._tokens.clear()
+
+    def _key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _fetch(self, token_url: str, client_id: str, client_secret: str, timeout) -> _Token:
+        kwargs = {'timeout': timeout} if timeout else {}
+        fetched_at = time.time()
+        res = http_client.post(url=token_url,
+                               data='grant_type=client_credentials',
+                               headers={'content-type': 'application/x-www-form-urlencoded'},
+                               auth=(client_id, client_secret),
+                               **kwargs)
+        if res.status_code != HTTPStatus.OK:
+            raise TokenError(res)
+        try:
+            body = res.json()
+            access_token = body['access_token']
+        except Exception as err:
+            raise TokenError(res) from err
+
+        expires_in = body.get('expires_in') or self.DEFAULT_EXPIRES_IN
+        return _Token(access_token=access_token, fetched_at=fetched_at, expires_at=fetched_at + float(expires_in))
+
+
+token_cache = TokenCache()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
@@ -22,6 +22,7 @@ from .pytest_marks import (
     api_v2,
     integration_affiliation,
     integration_authorization,
+    integration_benchmark,
     integration_colin,
     integration_namerequests,
     integration_nats,
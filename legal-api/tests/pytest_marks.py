@@ -37,6 +37,9 @@ integration_authorization = pytest.mark.skipif(
     (os.getenv('RUN_AUTHORIZATION_TESTS', False) is False),
     reason='Test requiring authorization service run when RUN_AUTHORIZATION_TESTS is set.')
 
+integration_benchmark = pytest.mark.skipif((os.getenv('RUN_BENCHMARK_TESTS', False) is False),
+                                           reason='Benchmarks run when RUN_BENCHMARK_TESTS is set.')
+
 integration_colin = pytest.mark.skipif((os.getenv('RUN_COLIN_TESTS', False) is False),
                                        reason='COLIN tests are only run when requested.')
 
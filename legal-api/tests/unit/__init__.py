@@ -12,3 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Centralized setup of logging for the service."""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from legal_api.models import db
+
+
+@contextmanager
+def count_statements():
+    """Collect the SQL statements run on the engine within the block, into the list that is yielded."""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
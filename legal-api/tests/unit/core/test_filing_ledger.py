@@ -23,6 +23,7 @@ from legal_api.core import Filing as CoreFiling
 from legal_api.models import Business, Comment, Filing, UserRoles
 from legal_api.models.user import UserRoles
 from legal_api.utils.datetime import datetime
+from tests.unit import count_statements
 from tests.unit.models import factory_business, factory_completed_filing, factory_user
 from tests.unit.services.utils import helper_create_jwt
 
@@ -93,3 +94,33 @@ def test_common_ledger_items(session):
     assert common_ledger_items['documentsLink'] is not None
 
 
+def test_ledger_query_count(session):
+    """Assert that the number of queries to build the ledger does not grow with the number of filings."""
+    def ledger_query_count(identifier, num_of_filings):
+        founding_date = datetime.utcnow() - datedelta.datedelta(months=num_of_filings)
+        business = factory_business(identifier=identifier, founding_date=founding_date, last_ar_date=None,
+                                    entity_type=Business.LegalTypes.BCOMP.value)
+        user = factory_user(username=f'{identifier}-user')
+        for i in range(num_of_filings):
+            filing = copy.deepcopy(FILING_TEMPLATE)
+            filing['filing']['header']['name'] = 'annualReport'
+            f = factory_completed_filing(business, filing, filing_date=founding_date + datedelta.datedelta(months=i))
+            f.submitter_id = user.id
+            for c in range(2):
+                comment = Comment()
+                comment.comment = f'this comment {c}'
+                f.comments.append(comment)
+            f.save()
+        session.expire_all()
+
+        with count_statements() as statements:
+            ledger = CoreFiling.ledger(business.id, jwt=None)
+
+        assert len(ledger) == num_of_filings
+        assert all(filing['commentsCount'] == 2 for filing in ledger)
+        return len(statements)
+
+    small_count = ledger_query_count('BC1234501', 2)
+    large_count = ledger_query_count('BC1234502', 12)
+
+    assert small_count == large_count
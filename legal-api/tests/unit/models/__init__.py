@@ -319,6 +319,28 @@ def factory_party_role(delivery_address: Address, mailing_address: Address, offi
     return party_role
 
 
+def factory_business_with_parties(identifier, num_of_parties):
+    """Create a business with directors that are also custodians, each with both addresses."""
+    business = factory_business(identifier)
+    for i in range(num_of_parties):
+        officer = Party(
+            first_name=f'First{i}',
+            last_name=f'Last{i}',
+            middle_initial=''
+        )
+        officer.delivery_address = Address(city=f'Delivery City {i}', address_type=Address.DELIVERY)
+        officer.mailing_address = Address(city=f'Mailing City {i}', address_type=Address.MAILING)
+        for role_type in (PartyRole.RoleTypes.DIRECTOR, PartyRole.RoleTypes.CUSTODIAN):
+            business.party_roles.append(PartyRole(
+                role=role_type.value,
+                appointment_date=datetime(2017, 5, 17),
+                cessation_date=None,
+                party=officer
+            ))
+    business.save()
+    return business
+
+
 def factory_share_class(business_identifier: str):
     """Create a share class."""
     business = factory_business(business_identifier)
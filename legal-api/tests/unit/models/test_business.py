@@ -339,3 +339,23 @@ def test_get_next_value_from_sequence(session, business_type, expected):
 
     else:
         assert not Business.get_next_value_from_sequence(business_type)
+
+
+def test_get_all_by_no_tax_id_paged(session):
+    """Assert that the businesses with no tax id are paged in identifier order."""
+    for identifier, legal_type, tax_id in [('BC0000003', 'BC', None),
+                                           ('BC0000001', 'BEN', None),
+                                           ('BC0000002', 'BC', '123456789BC0001'),
+                                           ('CP0000004', 'CP', None),
+                                           ('BC0000005', 'ULC', None)]:
+        Business(legal_name=f'legal_name-{identifier}',
+                 identifier=identifier,
+                 legal_type=legal_type,
+                 tax_id=tax_id,
+                 founding_date=EPOCH_DATETIME,
+                 last_ledger_timestamp=EPOCH_DATETIME).save()
+
+    assert [b.identifier for b in Business.get_all_by_no_tax_id()] == ['BC0000001', 'BC0000003', 'BC0000005']
+    assert [b.identifier for b in Business.get_all_by_no_tax_id(limit=2)] == ['BC0000001', 'BC0000003']
+    assert [b.identifier for b in Business.get_all_by_no_tax_id(after_identifier='BC0000003', limit=2)] == \
+        ['BC0000005']
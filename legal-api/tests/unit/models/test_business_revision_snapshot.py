@@ -0,0 +1,66 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the BusinessRevisionSnapshot Model.
+
+Test-Suite to ensure that the BusinessRevisionSnapshot Model and its use by the
+VersionedBusinessDetailsService are working as expected.
+"""
+import copy
+
+from registry_schemas.example_data import ANNUAL_REPORT
+
+from legal_api.models import BusinessRevisionSnapshot
+from legal_api.services import VersionedBusinessDetailsService
+from tests.unit.models import factory_business, factory_completed_filing
+
+
+def test_snapshot_save_and_find(session):
+    """Assert that a snapshot can be saved and found by filing and transaction."""
+    business = factory_business('CP1234567')
+    filing = factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+
+    snapshot = BusinessRevisionSnapshot(business_id=business.id,
+                                        filing_id=filing.id,
+                                        transaction_id=filing.transaction_id,
+                                        revision_json={'annualReport': {}})
+    snapshot.save()
+
+    assert snapshot.id
+    assert BusinessRevisionSnapshot.find_by_filing(filing.id, filing.transaction_id).id == snapshot.id
+    assert not BusinessRevisionSnapshot.find_by_filing(filing.id, filing.transaction_id + 1)
+
+
+def test_revision_uses_snapshot(session):
+    """Assert that get_revision reads the stored snapshot, and falls back to reconstruction once invalidated."""
+    business = factory_business('CP1234567')
+    filing = factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+
+    live_revision = VersionedBusinessDetailsService.get_revision(filing.id, business.id)
+
+    snapshot = VersionedBusinessDetailsService.save_revision_snapshot(filing.id)
+    session.commit()
+    assert snapshot.revision_json['annualReport'] == live_revision['filing']['annualReport']
+
+    # alter the stored snapshot to prove it is what gets returned
+    snapshot.revision_json = {**snapshot.revision_json, 'annualReport': {'snapshot': True}}
+    session.commit()
+    revision = VersionedBusinessDetailsService.get_revision(filing.id, business.id)
+    assert revision['filing']['annualReport'] == {'snapshot': True}
+    assert revision['filing']['header']['filingId'] == filing.id
+
+    assert VersionedBusinessDetailsService.invalidate_revision_snapshot(filing.id) == 1
+    session.commit()
+    revision = VersionedBusinessDetailsService.get_revision(filing.id, business.id)
+    assert revision['filing']['annualReport'] == live_revision['filing']['annualReport']
@@ -19,6 +19,7 @@ Test-Suite to ensure that the Business Model is working as expected.
 import copy
 import datetime
 import json
+import time
 from http import HTTPStatus
 
 import datedelta
@@ -39,8 +40,9 @@ from sqlalchemy.exc import DataError
 from sqlalchemy_continuum import versioning_manager
 
 from legal_api.exceptions import BusinessException
-from legal_api.models import Business, Filing, User
-from tests import EPOCH_DATETIME
+from legal_api.models import Business, Comment, Filing, User
+from legal_api.models.colin_event_id import ColinEventId
+from tests import EPOCH_DATETIME, integration_benchmark
 from tests.conftest import not_raises
 from tests.unit.models import (
     factory_business,
@@ -759,3 +761,61 @@ def test_submitter_info(session):
     filing.save()
 
     assert filing.id
+
+
+def test_get_json_projections(session):
+    """Assert that the projections match the json of the filings, without copying the filing sections."""
+    user = factory_user('idir/staff-person')
+    business = factory_business('CP1234567')
+    filing = factory_completed_filing(business, ANNUAL_REPORT)
+    filing.submitter_id = user.id
+    colin_event_id = ColinEventId()
+    colin_event_id.colin_event_id = 12346
+    filing.colin_event_ids.append(colin_event_id)
+    for text in ('first comment', 'second comment'):
+        comment = Comment()
+        comment.comment = text
+        comment.staff_id = user.id
+        filing.comments.append(comment)
+    filing.save()
+    correction = factory_completed_filing(business, CORRECTION_AR)
+    filing.parent_filing = correction
+    filing.save()
+    other_filing = factory_filing(business, ANNUAL_REPORT)
+
+    filings = [filing, correction, other_filing]
+    projections = Filing.get_json_projections(filings)
+
+    assert projections == [f.json for f in filings]
+    assert projections[0]['filing']['header']['isCorrected'] is True
+    assert projections[0]['filing']['header']['colinIds'] == [12346]
+    assert len(projections[0]['filing']['header']['comments']) == 2
+    assert projections[1]['filing']['header']['affectedFilings'] == [filing.id]
+    # only the header is copied
+    assert projections[0]['filing']['annualReport'] is filing.filing_json['filing']['annualReport']
+    assert projections[0]['filing']['header'] is not filing.filing_json['filing']['header']
+    assert 'filingId' not in filing.filing_json['filing']['header']
+    assert Filing.get_json_projections([]) == []
+
+
+@integration_benchmark
+def test_get_json_projections_benchmark(session, benchmark_report):
+    """Compare the time taken to serialize small and very large filings with json and the projections."""
+    business = factory_business('CP1234567')
+    large_filing_json = copy.deepcopy(ANNUAL_REPORT)
+    large_filing_json['filing']['annualReport']['directors'] = [
+        {'officer': {'firstName': f'First{i}', 'lastName': f'Last{i}'},
+         'deliveryAddress': {'streetAddress': f'{i} Main St', 'addressCity': 'Victoria', 'addressCountry': 'CA'}}
+        for i in range(5000)]
+
+    for name, filing_json in (('small', ANNUAL_REPORT), ('large', large_filing_json)):
+        filings = [factory_filing(business, filing_json) for _ in range(20)]
+        start = time.perf_counter()
+        for filing in filings:
+            assert filing.json
+        json_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert len(Filing.get_json_projections(filings)) == len(filings)
+        projection_time = time.perf_counter() - start
+        benchmark_report(f'{name} filings, json: {json_time:.3f}s, projections: {projection_time:.3f}s')
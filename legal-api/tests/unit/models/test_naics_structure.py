@@ -17,8 +17,14 @@
 Test-Suite to ensure that the NaicsStructure Model is working as expected.
 """
 import json
+import time
+
+import pytest
 
 from legal_api.models import NaicsStructure
+from legal_api.models.naics_search_index import NaicsSearchIndex
+from tests import integration_benchmark
+
 
 def test_naics_find_by_search_term(session):
     """Assert matching naics search results are returned.
@@ -80,6 +86,58 @@ def test_naics_find_by_search_term_no_results(session):
     assert len(results) == 0
 
 
+@pytest.mark.parametrize('search_term', [
+    'roast',
+    'chocolate confectionery manufacturing',
+    'confectionery chocolate',
+    'CHOCOLATE',
+    'ba',
+    'roastasdf',
+])
+def test_naics_search_index_matches_db(app, session, search_term):
+    """Assert that the search index returns the same structures and elements as the database search."""
+    def _by_code(results):
+        return {result.code: sorted(element.id for element in result.naics_elements) for result in results}
+
+    assert app.config.get('NAICS_SEARCH_INDEX_ENABLED')
+    assert _by_code(NaicsStructure.find_by_search_term(search_term)) == \
+        _by_code(NaicsStructure.find_by_search_term_in_db(search_term))
+
+
+def test_naics_search_index():
+    """Assert that the search index follows the exact and non-exact match rules."""
+    index = NaicsSearchIndex(
+        structures=[(1, 'Chocolate Confectionery Manufacturing'), (2, 'Coffee and Tea Manufacturing')],
+        elements=[(10, 1, 'chocolate bars'), (11, 1, 'cocoa'), (20, 2, 'coffee roasting'),
+                  (21, 2, 'chocolate coffee'), (30, 3, 'not a level 5 structure')])
+
+    # the class title matches, so all of its elements are returned, with the matching elements of the others
+    assert index.search('Chocolate') == {1: {10, 11}, 2: {21}}
+    # no class title matches, so the elements matching any of the words are returned
+    assert index.search('roasting bars') == {1: {10}, 2: {20}}
+    # terms shorter than a trigram still match
+    assert index.search('co') == {1: {10, 11}, 2: {20, 21}}
+    assert index.search('level') == {}
+    assert index.search('asdf') == {}
+
+
+@integration_benchmark
+def test_naics_search_benchmark(app, session, benchmark_report):
+    """Compare the time taken by the search index and the database to search NAICS."""
+    search_terms = ['roast', 'chocolate confectionery manufacturing', 'confectionery chocolate', 'bakery',
+                    'software', 'consulting', 'retail']
+    NaicsStructure.get_search_index()
+    timings = {}
+    for name, search in (('index', NaicsStructure.find_by_search_term),
+                         ('db', NaicsStructure.find_by_search_term_in_db)):
+        start = time.perf_counter()
+        for _ in range(20):
+            for search_term in search_terms:
+                search(search_term)
+        timings[name] = time.perf_counter() - start
+    benchmark_report(f'NAICS search, index: {timings["index"]:.3f}s, db: {timings["db"]:.3f}s')
+
+
 def test_naics_find_by_naics_code(app, session):
     """Assert naics code can be retrieved by code."""
 
@@ -0,0 +1,73 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the OutboxMessage Model.
+
+Test-Suite to ensure that the OutboxMessage Model is working as expected.
+"""
+from datetime import timedelta
+
+from registry_schemas.example_data import ANNUAL_REPORT
+
+from legal_api.models import OutboxMessage, db
+
+from tests.unit.models import factory_business, factory_filing
+
+
+def test_claim_due_in_order(session):
+    """Assert that only the oldest pending message of each filing is claimed."""
+    business = factory_business('CP1234567')
+    filing = factory_filing(business, ANNUAL_REPORT)
+    other_filing = factory_filing(business, ANNUAL_REPORT)
+    first = OutboxMessage(filing_id=filing.id, business_id=business.id, action='email', payload={'option': 'mras'})
+    second = OutboxMessage(filing_id=filing.id, business_id=business.id, action='event')
+    other = OutboxMessage(filing_id=other_filing.id, business_id=business.id, action='event')
+    for message in (first, second, other):
+        message.save_to_session()
+    db.session.commit()
+
+    claimed = OutboxMessage.claim_due(10, timedelta(minutes=5))
+    assert [message.id for message in claimed] == [first.id, other.id]
+    db.session.commit()
+
+    # claimed messages aren't due again until the lease is over
+    assert not OutboxMessage.claim_due(10, timedelta(minutes=5))
+
+    # once the first message is processed, the next one of the filing is due
+    first.mark_processed()
+    db.session.commit()
+    assert [message.id for message in OutboxMessage.claim_due(10, timedelta(minutes=5))] == [second.id]
+    assert [message.status for message in OutboxMessage.find_by_filing(filing.id)] == \
+        [OutboxMessage.Status.PROCESSED.value, OutboxMessage.Status.PENDING.value]
+
+
+def test_mark_failed(session):
+    """Assert that a failed message is retried with a doubling backoff, until it is FAILED."""
+    business = factory_business('CP1234567')
+    filing = factory_filing(business, ANNUAL_REPORT)
+    message = OutboxMessage(filing_id=filing.id, business_id=business.id, action='event')
+    message.save_to_session()
+    db.session.commit()
+
+    message.mark_failed('first', 3, timedelta(seconds=30))
+    first_retry = message.next_attempt_at
+    message.mark_failed('second', 3, timedelta(seconds=30))
+    assert message.next_attempt_at - first_retry >= timedelta(seconds=30)
+    assert message.status == OutboxMessage.Status.PENDING.value
+
+    message.mark_failed('third', 3, timedelta(seconds=30))
+    db.session.commit()
+    assert message.attempts == 3
+    assert message.last_error == 'third'
+    assert message.status == OutboxMessage.Status.FAILED.value
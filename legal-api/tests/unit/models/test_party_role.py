@@ -177,6 +177,45 @@ def test_find_party_by_name(session):
     assert should_find_testorg.id == org.id
 
 
+def test_find_parties_by_name(session):
+    """Assert that the parties of a list of names are found at once, by their normalized name."""
+    # setup
+    business = factory_business('CP1234567')
+    other_business = factory_business('CP7654321')
+    person = Party(first_name='Michael', last_name='Crane', middle_initial='Joe')
+    org = Party(organization_name=' testOrg ', party_type=Party.PartyTypes.ORGANIZATION.value)
+    other_person = Party(first_name='Testing', last_name='Other', middle_initial='')
+    for party, business_id in ((person, business.id), (org, business.id), (other_person, other_business.id)):
+        party.save()
+        PartyRole(
+            role=PartyRole.RoleTypes.DIRECTOR.value,
+            appointment_date=datetime.datetime(2017, 5, 17),
+            cessation_date=None,
+            party_id=party.id,
+            business_id=business_id
+        ).save()
+    assert person.normalized_name == 'MICHAEL JOE CRANE'
+    assert org.normalized_name == 'TESTORG'
+
+    # test
+    names = [
+        PartyRole.get_party_name('michael', 'crane', 'joe', ''),
+        PartyRole.get_party_name('', '', '', 'testorg'),
+        PartyRole.get_party_name('Testing', 'Other', '', ''),
+    ]
+    parties = PartyRole.find_parties_by_name(business.id, names)
+
+    # check
+    assert {name: party.id for name, party in parties.items()} == {'MICHAEL JOE CRANE': person.id, 'TESTORG': org.id}
+    assert PartyRole.find_parties_by_name(business.id, []) == {}
+
+    # the normalized name follows the name
+    person.middle_initial = ''
+    person.save()
+    assert person.normalized_name == 'MICHAEL CRANE'
+    assert PartyRole.find_party_by_name(business.id, 'Michael', 'Crane', '', '').id == person.id
+
+
 def test_get_party_roles(session):
     """Assert that the get_party_roles works as expected."""
     identifier = 'CP1234567'
@@ -17,6 +17,8 @@
 Test-Suite to ensure that the RequestTracker Model is working as expected.
 """
 
+from datetime import datetime, timedelta
+
 from legal_api.models import RequestTracker
 
 from tests.unit.models import factory_business, factory_filing
@@ -151,3 +153,36 @@ def test_find_request_tracker_by(session):
                                  filing_id=filing.id)
     assert len(res) == 1
     assert res[0].id == request_tracker.id
+
+
+def test_claim_due_retries(session):
+    """Assert that only the failed requests whose retry is due are claimed, and aren't due again during the lease."""
+    identifier = 'FM1234567'
+    business = factory_business(identifier)
+    now = datetime.utcnow()
+
+    def create_request_tracker(next_retry_date, is_processed=False, retry_number=0):
+        request_tracker = RequestTracker(
+            business_id=business.id,
+            service_name=RequestTracker.ServiceName.BN_HUB,
+            request_type=RequestTracker.RequestType.INFORM_CRA,
+            is_processed=is_processed,
+            retry_number=retry_number,
+            next_retry_date=next_retry_date
+        )
+        request_tracker.save()
+        return request_tracker
+
+    due = create_request_tracker(now - timedelta(minutes=1))
+    earlier_due = create_request_tracker(now - timedelta(minutes=5))
+    create_request_tracker(now + timedelta(minutes=5))
+    create_request_tracker(now - timedelta(minutes=5), is_processed=True)
+    create_request_tracker(now - timedelta(minutes=5), retry_number=9)
+    create_request_tracker(None)
+
+    res = RequestTracker.claim_due_retries(RequestTracker.ServiceName.BN_HUB, 9, 10, timedelta(minutes=10))
+    assert [request_tracker.id for request_tracker in res] == [earlier_due.id, due.id]
+    assert all(request_tracker.next_retry_date > now for request_tracker in res)
+    session.commit()
+
+    assert not RequestTracker.claim_due_retries(RequestTracker.ServiceName.BN_HUB, 9, 10, timedelta(minutes=10))
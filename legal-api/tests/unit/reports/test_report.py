@@ -15,11 +15,9 @@
 """Test-Suite to ensure that the Report class is working as expected."""
 import copy
 from contextlib import suppress
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from flask import current_app
 from registry_schemas.example_data import (
     ALTERATION_FILING_TEMPLATE,
     ANNUAL_REPORT,
@@ -98,12 +96,10 @@ def set_dates(report):
 
 
 def substitute_template_parts(report):
-    """Assert _substitute_template_parts works as expected."""
-    template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-    template_code = Path(f'{template_path}/{report._get_template_filename()}').read_text()
-    # substitute template parts
-    template_code = report._substitute_template_parts(template_code)
+    """Assert the template parts are substituted in the report template."""
+    template_code = report._get_template()
     assert template_code
+    assert '[[common/style.html]]' not in template_code
 
 
 def set_description(report):
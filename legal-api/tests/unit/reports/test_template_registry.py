@@ -0,0 +1,98 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the report template registry is working as expected."""
+import base64
+import os
+import time
+from pathlib import Path
+
+from legal_api.reports import Report
+from legal_api.reports.template_registry import TemplateRegistry
+from tests import integration_benchmark
+
+
+def _assemble(template_path, template_name, template_parts):
+    """Return the template assembled from the files on disk, the way it was done for every request."""
+    template_code = Path(f'{template_path}/{template_name}').read_text()
+    for template_part in template_parts:
+        template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
+        template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
+    return template_code
+
+
+def test_template_assembled_once(app):
+    """Assert that a template is assembled and encoded once and matches the on disk assembly."""
+    registry = TemplateRegistry()
+    with app.app_context():
+        template_name, template_parts = Report.get_all_templates()[0]
+        expected = _assemble(app.config['REPORT_TEMPLATE_PATH'], template_name, template_parts)
+
+        template = registry.get(template_name, template_parts)
+        assert template.code == expected
+        assert base64.b64decode(template.encoded).decode('utf-8') == expected
+        assert registry.get(template_name, template_parts) is template
+
+
+def test_template_mtime_invalidation(app, tmp_path):
+    """Assert that a changed template part is picked up only when mtime checking is on."""
+    (tmp_path / 'template-parts').mkdir()
+    (tmp_path / 'main.html').write_text('<html>[[part.html]]</html>')
+    part = tmp_path / 'template-parts' / 'part.html'
+    part.write_text('one')
+
+    registry = TemplateRegistry()
+    with app.app_context():
+        app.config['REPORT_TEMPLATE_PATH'], template_path = str(tmp_path), app.config['REPORT_TEMPLATE_PATH']
+        check_mtime = app.config.get('REPORT_TEMPLATE_CHECK_MTIME')
+        try:
+            app.config['REPORT_TEMPLATE_CHECK_MTIME'] = False
+            assert registry.get('main.html', ['part']).code == '<html>one</html>'
+
+            part.write_text('two')
+            os.utime(part, (time.time() + 10, time.time() + 10))
+            assert registry.get('main.html', ['part']).code == '<html>one</html>'
+
+            app.config['REPORT_TEMPLATE_CHECK_MTIME'] = True
+            assert registry.get('main.html', ['part']).code == '<html>two</html>'
+        finally:
+            app.config['REPORT_TEMPLATE_PATH'] = template_path
+            app.config['REPORT_TEMPLATE_CHECK_MTIME'] = check_mtime
+
+
+@integration_benchmark
+def test_template_assembly_cost(app, benchmark_report):
+    """Report the per request template assembly cost, from disk and from the warmed up registry."""
+    registry = TemplateRegistry()
+    requests = 20
+    with app.app_context():
+        templates = Report.get_all_templates()
+        template_path = app.config['REPORT_TEMPLATE_PATH']
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            for template_name, template_parts in templates:
+                code = _assemble(template_path, template_name, template_parts)
+                base64.b64encode(bytes(code, 'utf-8')).decode()
+        uncached = (time.perf_counter() - start) / requests
+
+        registry.warm_up(templates)
+        start = time.perf_counter()
+        for _ in range(requests):
+            for template_name, template_parts in templates:
+                registry.get(template_name, template_parts)
+        cached = (time.perf_counter() - start) / requests
+
+    benchmark_report(f'assembly of {len(templates)} templates per request: disk {uncached * 1000:.2f}ms, '
+                     f'registry {cached * 1000:.3f}ms')
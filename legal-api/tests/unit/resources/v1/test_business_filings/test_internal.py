@@ -349,6 +349,32 @@ def test_get_colin_id(session, client, jwt):
     assert rv.status_code == HTTPStatus.NOT_FOUND
 
 
+def test_get_known_colin_ids(session, client, jwt):
+    """Assert the internal/filings/colin_id/known endpoint returns the colin ids already in legal."""
+    # setup
+    identifier = 'CP7654321'
+    b = factory_business(identifier)
+    factory_business_mailing_address(b)
+    factory_completed_filing(b, ANNUAL_REPORT, colin_id=1234)
+    factory_completed_filing(b, ANNUAL_REPORT, colin_id=1236)
+
+    rv = client.post('/api/v1/businesses/internal/filings/colin_id/known',
+                     json={'colinIds': [1234, 1235, 1236]},
+                     headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.OK
+    assert sorted(rv.json['colinIds']) == [1234, 1236]
+
+    rv = client.post('/api/v1/businesses/internal/filings/colin_id/known',
+                     json={'colinIds': [1234]},
+                     headers=create_header(jwt, [STAFF_ROLE]))
+    assert rv.status_code == HTTPStatus.UNAUTHORIZED
+
+    rv = client.post('/api/v1/businesses/internal/filings/colin_id/known',
+                     json={},
+                     headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_get_colin_last_update(session, client, jwt):
     """Assert the get endpoint for ColinLastUpdate returns last updated colin id."""
     from tests.unit.models import db
@@ -408,3 +434,33 @@ def test_future_filing_coa(session, client, jwt):
     assert paid_filings[0]['filing']['header']['filingId'] == filing.id
     assert paid_filings[0]['filing']['header']['paymentToken']
     assert paid_filings[0]['filing']['header']['effectiveDate']
+
+
+def test_get_due_filings(session, client, jwt):
+    """Assert that only the ids of the PAID filings whose effective date has come are returned."""
+    import pytz
+    from tests.unit.models import factory_pending_filing
+    # setup
+    identifier = 'CP7654321'
+    b = factory_business(identifier, (datetime.utcnow() - datedelta.YEAR), None, Business.LegalTypes.BCOMP.value)
+    factory_business_mailing_address(b)
+    coa = copy.deepcopy(FILING_HEADER)
+    coa['filing']['header']['name'] = 'changeOfAddress'
+    coa['filing']['changeOfAddress'] = CHANGE_OF_ADDRESS
+    coa['filing']['business']['identifier'] = identifier
+
+    filings = {}
+    for name, effective_date, paid in [('due', datetime.utcnow() - datedelta.DAY, True),
+                                       ('future', datetime.utcnow() + datedelta.DAY, True),
+                                       ('unpaid', datetime.utcnow() - datedelta.DAY, False)]:
+        filing = factory_pending_filing(b, coa)
+        filing.effective_date = pytz.utc.localize(effective_date)
+        if paid:
+            filing.payment_completion_date = pytz.utc.localize(datetime.utcnow())
+        filing.save()
+        filings[name] = filing
+    assert filings['due'].status == Filing.Status.PAID.value
+
+    rv = client.get('/api/v1/businesses/internal/filings/due', headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json == {'filingIds': [filings['due'].id]}
@@ -21,7 +21,14 @@ from http import HTTPStatus
 
 from legal_api.models import Business
 from legal_api.services.authz import STAFF_ROLE
-from tests.unit.models import Address, PartyRole, factory_business, factory_party_role
+from tests.unit import count_statements
+from tests.unit.models import (
+    Address,
+    PartyRole,
+    factory_business,
+    factory_business_with_parties,
+    factory_party_role,
+)
 from tests.unit.services.utils import create_header
 
 
@@ -271,3 +278,22 @@ def test_directors_coop_no_mailing_address(session, client, jwt):
     assert 'directors' in rv.json
     assert rv.json['directors'][0]['deliveryAddress']['addressCity'] == 'Test Delivery City'
     assert 'mailingAddress' not in rv.json['directors'][0]
+
+
+def test_get_business_directors_query_count(session, client, jwt):
+    """Assert that the number of queries to get the directors does not grow with the number of directors."""
+    counts = {}
+    for identifier, num_of_directors in (('CP7654301', 1), ('CP7654302', 200)):
+        factory_business_with_parties(identifier, num_of_directors)
+        session.expire_all()
+        with count_statements() as statements:
+            rv = client.get(f'/api/v2/businesses/{identifier}/directors',
+                            headers=create_header(jwt, [STAFF_ROLE], identifier))
+        counts[num_of_directors] = len(statements)
+
+        assert rv.status_code == HTTPStatus.OK
+        assert len(rv.json['directors']) == num_of_directors
+        assert {director['deliveryAddress']['addressCity'] for director in rv.json['directors']} == \
+            {f'Delivery City {i}' for i in range(num_of_directors)}
+
+    assert counts[1] == counts[200]
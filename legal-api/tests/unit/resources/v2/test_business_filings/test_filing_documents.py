@@ -637,3 +637,51 @@ def test_get_receipt_request_mock(session, client, jwt, requests_mock):
 
     assert rv.status_code == HTTPStatus.CREATED
     assert requests_mock.called_once
+
+
+def test_completed_filing_pdf_output_cache(session, client, jwt, monkeypatch, tmp_path):
+    """Assert that the pdf of a completed filing is rendered once, served with an ETag, and rebuilt on correction."""
+    from legal_api.resources.v2.business.business_filings import business_documents
+
+    identifier = 'CP7654321'
+    business = factory_business(identifier)
+    filing = factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+
+    renders = []
+
+    def mock_get_pdf(filing_storage, report_type):
+        renders.append(report_type)
+        return b'%PDF-1.4 rendered', HTTPStatus.OK
+
+    monkeypatch.setattr(business_documents, 'get_pdf', mock_get_pdf)
+    monkeypatch.setitem(current_app.config, 'REPORT_CACHE_STORE', 'disk')
+    monkeypatch.setitem(current_app.config, 'REPORT_CACHE_DISK_PATH', str(tmp_path))
+
+    url = f'/api/v2/businesses/{identifier}/filings/{filing.id}/documents/annualReport'
+    headers = create_header(jwt, [STAFF_ROLE], identifier, **{'accept': 'application/pdf'})
+
+    rv = client.get(url, headers=headers)
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.data == b'%PDF-1.4 rendered'
+    assert rv.headers['ETag'].startswith('"') and rv.headers['ETag'].endswith('"')
+    etag = rv.headers['ETag'].strip('"')
+    assert etag
+
+    rv = client.get(url, headers=headers)
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.data == b'%PDF-1.4 rendered'
+    assert len(renders) == 1
+
+    rv = client.get(url, headers={**headers, 'If-None-Match': f'"{etag}"'})
+    assert rv.status_code == HTTPStatus.NOT_MODIFIED
+    assert len(renders) == 1
+
+    # a correction filed against the filing is a new key, so the output is rendered again
+    correction = factory_completed_filing(business, copy.deepcopy(CORRECTION_AR))
+    filing.parent_filing_id = correction.id
+    filing.save()
+
+    rv = client.get(url, headers=headers)
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.headers['ETag'].strip('"') != etag
+    assert len(renders) == 2
@@ -20,7 +20,15 @@ import datetime
 from http import HTTPStatus
 
 from legal_api.services.authz import STAFF_ROLE
-from tests.unit.models import Address, Party, PartyRole, factory_business, factory_party_role
+from tests.unit import count_statements
+from tests.unit.models import (
+    Address,
+    Party,
+    PartyRole,
+    factory_business,
+    factory_business_with_parties,
+    factory_party_role,
+)
 from tests.unit.services.utils import create_header
 
 
@@ -294,3 +302,29 @@ def test_get_parties_invalid_business(session, client, jwt):
     # check
     assert rv.status_code == HTTPStatus.NOT_FOUND
     assert rv.json == {'message': f'{identifier} not found'}
+
+
+def _count_statements(session, client, url, headers):
+    """Return the response of the GET and the number of statements it ran."""
+    session.expire_all()
+    with count_statements() as statements:
+        rv = client.get(url, headers=headers)
+    return rv, len(statements)
+
+
+def test_get_business_parties_query_count(session, client, jwt):
+    """Assert that the number of queries to get the parties does not grow with the number of parties."""
+    counts = {}
+    for identifier, num_of_parties in (('CP7654301', 1), ('CP7654302', 200)):
+        factory_business_with_parties(identifier, num_of_parties)
+        rv, counts[num_of_parties] = _count_statements(session, client,
+                                                       f'/api/v2/businesses/{identifier}/parties',
+                                                       create_header(jwt, [STAFF_ROLE], identifier))
+
+        assert rv.status_code == HTTPStatus.OK
+        assert len(rv.json['parties']) == num_of_parties
+        assert all(len(party['roles']) == 2 for party in rv.json['parties'])
+        assert {party['mailingAddress']['addressCity'] for party in rv.json['parties']} == \
+            {f'Mailing City {i}' for i in range(num_of_parties)}
+
+    assert counts[1] == counts[200]
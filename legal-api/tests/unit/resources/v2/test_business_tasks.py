@@ -227,6 +227,48 @@ def test_get_tasks_error_filings(session, client, jwt):
     assert rv.json['tasks'][0]['task']['filing']['header']['filingId'] == filing.id
 
 
+@pytest.mark.parametrize('test_name, partial_failure, expected_status', [
+    ('fail_whole_list', False, HTTPStatus.SERVICE_UNAVAILABLE),
+    ('partial_failure', True, HTTPStatus.OK),
+])
+def test_get_tasks_pay_details(app, session, client, jwt, requests_mock, monkeypatch,
+                               test_name, partial_failure, expected_status):
+    """Assert that the pay details are fetched once per payment token and a failed lookup is handled."""
+    from requests import exceptions
+    from flask import current_app
+    from tests.unit.models import AR_FILING, factory_business_mailing_address
+    # setup
+    identifier = 'CP7654321'
+    b = factory_business(identifier, last_ar_date=datetime(2019, 8, 13))
+    factory_business_mailing_address(b)
+    filings = []
+    for payment_token in (11, 12):
+        filing = factory_pending_filing(b, AR_FILING, datetime(2019, 8, 5, 7, 7, 58, 272362))
+        filing.payment_token = payment_token
+        filing.payment_status_code = 'CREATED'
+        filing.save()
+        filings.append(filing)
+
+    payment_svc_url = current_app.config.get('PAYMENT_SVC_URL')
+    requests_mock.get(f'{payment_svc_url}/11',
+                      json={'isPaymentActionRequired': True, 'paymentMethod': 'ONLINE_BANKING'})
+    requests_mock.get(f'{payment_svc_url}/12', exc=exceptions.ConnectTimeout)
+    monkeypatch.setitem(app.config, 'TASK_LIST_PAY_PARTIAL_FAILURE', partial_failure)
+
+    # test
+    rv = client.get(f'/api/v2/businesses/{identifier}/tasks', headers=create_header(jwt, [STAFF_ROLE], identifier))
+
+    # check
+    assert rv.status_code == expected_status
+    assert requests_mock.call_count == 2
+    if partial_failure:
+        headers = {task['task']['filing']['header']['filingId']: task['task']['filing']['header']
+                   for task in rv.json['tasks'] if 'filing' in task['task']}
+        assert headers[filings[0].id]['isPaymentActionRequired']
+        assert headers[filings[0].id]['paymentMethod'] == 'ONLINE_BANKING'
+        assert 'paymentMethod' not in headers[filings[1].id]
+
+
 def test_get_tasks_pending_correction_filings(session, client, jwt):
     """Assert that to-do list returns the error filings."""
     from freezegun import freeze_time
@@ -22,7 +22,16 @@ import pytest
 from flask import jsonify
 from legal_api.models.business import Business
 
-from legal_api.services.authz import BASIC_USER, COLIN_SVC_ROLE, STAFF_ROLE, authorized, get_allowed, is_allowed
+from legal_api.services.authz import (
+    BASIC_USER,
+    COLIN_SVC_ROLE,
+    STAFF_ROLE,
+    RoleCache,
+    authorized,
+    get_allowed,
+    is_allowed,
+    role_cache,
+)
 from tests import integration_authorization, not_github_ci
 
 from .utils import helper_create_jwt
@@ -556,3 +565,97 @@ def test_is_allowed(monkeypatch, app, jwt, test_name, state, filing_type, sub_fi
         for legal_type in legal_types:
             filing_types = is_allowed(state, filing_type, legal_type, jwt, sub_filing_type)
             assert filing_types == expected
+
+
+def test_authorized_roles_cached(monkeypatch, app, jwt):
+    """Assert that repeated checks for the same user and business make one auth service call."""
+    from requests import Response
+    identifier = 'CP1234567'
+    token = helper_create_jwt(jwt, roles=[BASIC_USER], username='username')
+    headers = {'Authorization': 'Bearer ' + token}
+    calls = []
+
+    def mock_get(*args, **kwargs):  # pylint: disable=unused-argument; mocks of library methods
+        calls.append(kwargs.get('url'))
+        resp = Response()
+        resp.status_code = 200
+        resp._content = b'{"roles": ["view"]}'
+        return resp
+
+    def mock_auth(one, two):  # pylint: disable=unused-argument; mocks of library methods
+        return headers[one]
+
+    monkeypatch.setattr('requests.sessions.Session.get', mock_get)
+    monkeypatch.setitem(app.config, 'AUTHZ_CACHE_TTL', 30)
+    role_cache.invalidate()
+
+    with app.test_request_context():
+        monkeypatch.setattr('flask.request.headers.get', mock_auth)
+        assert authorized(identifier, jwt, ['view'])
+        assert authorized(identifier, jwt, ['view'])
+        assert not authorized(identifier, jwt, ['edit'])
+        assert len(calls) == 1
+
+        role_cache.invalidate(identifier=identifier)
+        assert authorized(identifier, jwt, ['view'])
+        assert len(calls) == 2
+
+    role_cache.invalidate()
+
+
+
+@pytest.mark.parametrize('status_code,cached', [
+    (HTTPStatus.OK, True),
+    (HTTPStatus.UNAUTHORIZED, True),
+    (HTTPStatus.FORBIDDEN, True),
+    (HTTPStatus.NOT_FOUND, True),
+    (HTTPStatus.INTERNAL_SERVER_ERROR, False),
+    (HTTPStatus.SERVICE_UNAVAILABLE, False),
+])
+def test_authorized_denied_cached(monkeypatch, app, jwt, status_code, cached):
+    """Assert that denials are cached, but a failed auth service lookup is not."""
+    from requests import Response
+    identifier = 'CP1234567'
+    token = helper_create_jwt(jwt, roles=[BASIC_USER], username='username')
+    headers = {'Authorization': 'Bearer ' + token}
+    calls = []
+
+    def mock_get(*args, **kwargs):  # pylint: disable=unused-argument; mocks of library methods
+        calls.append(kwargs.get('url'))
+        resp = Response()
+        resp.status_code = status_code
+        resp._content = b'{"roles": []}'
+        return resp
+
+    def mock_auth(one, two):  # pylint: disable=unused-argument; mocks of library methods
+        return headers[one]
+
+    monkeypatch.setattr('requests.sessions.Session.get', mock_get)
+    monkeypatch.setitem(app.config, 'AUTHZ_CACHE_DENIED_TTL', 30)
+    role_cache.invalidate()
+
+    with app.test_request_context():
+        monkeypatch.setattr('flask.request.headers.get', mock_auth)
+        assert not authorized(identifier, jwt, ['view'])
+        assert not authorized(identifier, jwt, ['view'])
+        assert len(calls) == (1 if cached else 2)
+
+    role_cache.invalidate()
+
+def test_role_cache():
+    """Assert that the role cache expires, evicts and counts its entries."""
+    cache = RoleCache()
+
+    assert cache.get(('sub', 'CP1234567')) is None
+    cache.put(('sub', 'CP1234567'), ['view'], ttl=30, maxsize=2)
+    cache.put(('sub', 'CP7654321'), [], ttl=30, maxsize=2)
+    assert cache.get(('sub', 'CP1234567')) == ['view']
+    assert cache.get(('sub', 'CP7654321')) == []
+
+    cache.put(('sub', 'BC1234567'), ['view'], ttl=30, maxsize=2)
+    assert cache.get(('sub', 'CP1234567')) is None  # least recently used is evicted
+
+    cache.put(('sub', 'CP1234567'), ['view'], ttl=0, maxsize=2)
+    assert cache.get(('sub', 'CP1234567')) is None  # a ttl of 0 is not cached
+
+    assert cache.stats() == {'hits': 2, 'misses': 3, 'size': 2}
@@ -0,0 +1,90 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the VersionedBusinessDetailsService is working as expected."""
+import copy
+
+from registry_schemas.example_data import INCORPORATION_FILING_TEMPLATE
+
+from legal_api.models import Address, Business, Office, Party, PartyRole, ShareClass, ShareSeries
+from legal_api.services import VersionedBusinessDetailsService
+from legal_api.utils.datetime import datetime
+from tests.unit import count_statements
+from tests.unit.models import factory_business, factory_completed_filing
+
+
+def _address(address_type):
+    return Address(city='Test City', street='Test Street', postal_code='T3S3T3',
+                   country='CA', region='BC', address_type=address_type)
+
+
+def load_business(identifier, num_of_directors, num_of_share_classes):
+    """Create a business with offices, directors and share classes, and a completed IA filing."""
+    business = factory_business(identifier, entity_type=Business.LegalTypes.BCOMP.value)
+
+    for office_type in ('registeredOffice', 'recordsOffice'):
+        office = Office(office_type=office_type)
+        office.addresses.append(_address(Address.DELIVERY))
+        office.addresses.append(_address(Address.MAILING))
+        business.offices.append(office)
+
+    for i in range(num_of_directors):
+        party = Party(first_name=f'first-{i}', last_name=f'last-{i}', party_type=Party.PartyTypes.PERSON.value)
+        party.delivery_address = _address(Address.DELIVERY)
+        party.mailing_address = _address(Address.MAILING)
+        party_role = PartyRole(role=PartyRole.RoleTypes.DIRECTOR.value,
+                               appointment_date=datetime.utcnow(),
+                               party=party)
+        business.party_roles.append(party_role)
+
+    for i in range(num_of_share_classes):
+        share_class = ShareClass(name=f'Share Class {i}', priority=i, max_share_flag=True, max_shares=1000,
+                                 par_value_flag=False, special_rights_flag=False)
+        for j in range(2):
+            share_class.series.append(ShareSeries(name=f'Share Series {i}-{j}', priority=j, max_share_flag=True,
+                                                  max_shares=500, special_rights_flag=False))
+        business.share_classes.append(share_class)
+    business.save()
+
+    filing = factory_completed_filing(business, copy.deepcopy(INCORPORATION_FILING_TEMPLATE))
+    return business, filing
+
+
+def revision_statement_count(business, filing):
+    """Return the revision and the number of SQL statements issued to build it."""
+    with count_statements() as statements:
+        revision = VersionedBusinessDetailsService.get_revision(filing.id, business.id)
+    return revision, len(statements)
+
+
+def test_revision_statement_count(session, benchmark_report):
+    """Assert that the statements per get_revision don't grow with the number of directors and share classes."""
+    small_business, small_filing = load_business('BC1234501', 1, 1)
+    large_business, large_filing = load_business('BC1234502', 20, 10)
+    session.expire_all()
+
+    small_revision, small_count = revision_statement_count(small_business, small_filing)
+    large_revision, large_count = revision_statement_count(large_business, large_filing)
+
+    large_ia = large_revision['filing']['incorporationApplication']
+    assert len(large_ia['parties']) == 20
+    assert all(party['deliveryAddress'] and party['mailingAddress'] for party in large_ia['parties'])
+    assert len(large_ia['shareStructure']['shareClasses']) == 10
+    assert all(len(share_class['series']) == 2 for share_class in large_ia['shareStructure']['shareClasses'])
+    assert set(large_ia['offices'].keys()) == {'registeredOffice', 'recordsOffice'}
+    assert small_revision['filing']['incorporationApplication']['parties']
+
+    benchmark_report(f'statements per get_revision, 1 director and 1 share class: {small_count}, '
+                     f'20 directors and 10 share classes: {large_count}')
+    assert small_count == large_count
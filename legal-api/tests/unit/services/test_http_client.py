@@ -0,0 +1,73 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the shared HTTP client.
+
+Test-Suite to ensure that the HttpClient is working as expected.
+"""
+import pytest
+from flask import Flask
+from requests import exceptions
+
+from legal_api.services import HttpClient
+
+
+def test_http_client_init_app():
+    """Assert that the pools, timeouts and retries are read from the app config."""
+    app = Flask(__name__)
+    app.config['HTTP_CLIENT_POOL_MAXSIZE'] = 5
+    app.config['HTTP_CLIENT_CONNECT_TIMEOUT'] = 1.0
+    app.config['HTTP_CLIENT_READ_TIMEOUT'] = 2.0
+    app.config['HTTP_CLIENT_RETRIES'] = 0
+
+    client = HttpClient(app)
+
+    assert client.pool_maxsize == 5
+    assert client.timeout == (1.0, 2.0)
+    assert client.session.get_adapter('https://example.com')._pool_maxsize == 5
+    assert client.session is client.session
+
+
+def test_http_client_records_metrics(requests_mock):
+    """Assert that the latency and errors of each upstream are recorded."""
+    client = HttpClient()
+    requests_mock.get('https://pay.example.com/invoices/1', json={'id': 1})
+    requests_mock.post('https://pay.example.com/invoices', status_code=503)
+    requests_mock.get('https://auth.example.com/entities/CP1234567', exc=exceptions.ConnectTimeout)
+
+    assert client.get('https://pay.example.com/invoices/1').json() == {'id': 1}
+    assert client.post('https://pay.example.com/invoices', json={}).status_code == 503
+    with pytest.raises(exceptions.ConnectTimeout):
+        client.get('https://auth.example.com/entities/CP1234567')
+
+    pay = client.metrics('pay.example.com')
+    assert pay['requests'] == 2
+    assert pay['errors'] == 1
+    assert client.metrics('auth.example.com')['errors'] == 1
+    assert requests_mock.request_history[0].timeout == client.timeout
+
+    client.reset_metrics()
+    assert client.metrics() == {}
+
+
+def test_http_client_does_not_keep_cookies(requests_mock):
+    """Assert that cookies set by an upstream are not sent on later calls."""
+    client = HttpClient()
+    requests_mock.get('https://auth.example.com/login', headers={'Set-Cookie': 'session=user-1; Path=/'})
+    requests_mock.get('https://auth.example.com/entities/CP1234567', json={})
+
+    client.get('https://auth.example.com/login')
+    client.get('https://auth.example.com/entities/CP1234567')
+
+    assert not client.session.cookies
+    assert 'Cookie' not in requests_mock.request_history[1].headers
@@ -0,0 +1,89 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the service account token cache.
+
+Test-Suite to ensure that the TokenCache is working as expected.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from legal_api.services import TokenCache, TokenError
+
+
+TOKEN_URL = 'https://auth.example.com/realms/bcregistry/token'
+
+
+def test_token_is_cached(requests_mock):
+    """Assert that the token endpoint is only called once per client while the token is fresh."""
+    cache = TokenCache()
+    requests_mock.post(TOKEN_URL, json={'access_token': 'abc', 'expires_in': 300})
+
+    assert cache.get_token(TOKEN_URL, 'legal-api', 'secret') == 'abc'
+    assert cache.get_token(TOKEN_URL, 'legal-api', 'secret') == 'abc'
+    assert requests_mock.call_count == 1
+
+    cache.get_token(TOKEN_URL, 'entity-filer', 'secret')
+    assert requests_mock.call_count == 2
+
+
+def test_token_refreshed_before_expiry(requests_mock):
+    """Assert that a token is refreshed once it is within the refresh margin of its expiry."""
+    cache = TokenCache()
+    requests_mock.post(TOKEN_URL, [{'json': {'access_token': 'old', 'expires_in': 300}},
+                                   {'json': {'access_token': 'new', 'expires_in': 300}}])
+    now = time.time()
+
+    with patch('legal_api.services.token_cache.time.time', return_value=now):
+        assert cache.get_token(TOKEN_URL, 'legal-api', 'secret') == 'old'
+    with patch('legal_api.services.token_cache.time.time', return_value=now + 250):
+        assert cache.get_token(TOKEN_URL, 'legal-api', 'secret') == 'new'
+
+
+def test_token_kept_when_refresh_fails(requests_mock):
+    """Assert that a still valid token is used when the proactive refresh fails."""
+    cache = TokenCache()
+    requests_mock.post(TOKEN_URL, [{'json': {'access_token': 'old', 'expires_in': 300}},
+                                   {'json': {'error': 'unavailable'}, 'status_code': 503}])
+    now = time.time()
+
+    with patch('legal_api.services.token_cache.time.time', return_value=now):
+        cache.get_token(TOKEN_URL, 'legal-api', 'secret')
+    with patch('legal_api.services.token_cache.time.time', return_value=now + 250):
+        assert cache.get_token(TOKEN_URL, 'legal-api', 'secret') == 'old'
+    with patch('legal_api.services.token_cache.time.time', return_value=now + 400):
+        with pytest.raises(TokenError) as err:
+            cache.get_token(TOKEN_URL, 'legal-api', 'secret')
+    assert err.value.response.status_code == 503
+
+
+def test_concurrent_requests_fetch_once(requests_mock):
+    """Assert that concurrent callers do not stampede the token endpoint."""
+    cache = TokenCache()
+    requests_mock.post(TOKEN_URL, json={'access_token': 'abc', 'expires_in': 300})
+    tokens = []
+
+    def get_token():
+        tokens.append(cache.get_token(TOKEN_URL, 'legal-api', 'secret'))
+
+    threads = [threading.Thread(target=get_token) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ['abc'] * 10
+    assert requests_mock.call_count == 1
@@ -19,7 +19,8 @@ import asyncio
 import functools
 import json
 import signal
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
 
 
 from nats.aio.client import Client as NATS  # noqa N814; by convention the name is NATS
@@ -57,6 +58,10 @@ class ServiceWorker:
         self.config = config
         self._name = name
         self._version = version
+        self._in_flight: Set[asyncio.Future] = set()
+        self._in_flight_slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._draining = False
 
         async def conn_lost_cb(error):
             logger.info('Connection lost:%s', error)
@@ -148,6 +153,11 @@ class ServiceWorker:
             **{'cb': self.cb_handler},
             **self.subscription_options
         }
+        handle_on_loop = subscription_options.pop('handle_on_loop', False)
+        if subscription_options.get('manual_acks') and subscription_options.get('cb'):
+            subscription_options['cb'] = self._manual_ack_cb(subscription_options['cb'],
+                                                             subscription_options.get('max_inflight', 1),
+                                                             handle_on_loop)
 
         await self.nc.connect(**nats_connection_options)
         await self.sc.connect(**stan_connection_options)
@@ -157,8 +167,59 @@ class ServiceWorker:
                     subscription_options.get('cb').__name__ if subscription_options.get('cb') else 'no_call_back',
                     subscription_options.get('queue'))
 
+    def _manual_ack_cb(self, handler, max_inflight: int, handle_on_loop: bool = False):
+        """Wrap the handler to handle up to max_inflight messages at once, acking each one once it is handled.
+
+        A message the handler raises on is not acked, so it is redelivered once the ack_wait is over.
+        With more than one message in flight each one is handled on a worker thread, in its own event loop,
+        so the thread bound app contexts and db sessions of the handlers are kept apart.
+        Handlers that hand their blocking work over to threads of their own set handle_on_loop to run on the loop.
+        """
+        if max_inflight > 1 and not handle_on_loop and not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix='queue')
+
+        @functools.wraps(handler)
+        async def cb(msg):
+            if self._draining:
+                return  # not acked, so it is redelivered to another member of the queue group
+            if not self._in_flight_slots:
+                self._in_flight_slots = asyncio.Semaphore(max_inflight)
+            # waiting here holds back the subscription until a message in flight is done
+            await self._in_flight_slots.acquire()
+            task = asyncio.ensure_future(self._handle(handler, msg))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+        return cb
+
+    async def _handle(self, handler, msg):
+        """Handle the msg and ack it on the connection it was delivered on."""
+        sc = self.sc
+        try:
+            if self._executor:
+                await asyncio.get_running_loop().run_in_executor(self._executor, asyncio.run, handler(msg))
+            else:
+                await handler(msg)
+            await sc.ack(msg)
+        except Exception as err:  # pylint: disable=broad-except; the message is redelivered, whatever the error
+            logger.warning('Message seq:%s was not acked and will be redelivered: %s', msg.sequence, err)
+        finally:
+            self._in_flight_slots.release()
+
+    async def drain(self, timeout: Optional[float] = None):
+        """Stop taking new messages, and wait up to timeout seconds for the messages in flight to be acked."""
+        self._draining = True
+        if self._in_flight:
+            logger.info('Draining %s messages in flight...', len(self._in_flight))
+            _, pending = await asyncio.wait(set(self._in_flight), timeout=timeout)
+            if pending:
+                logger.warning('%s messages still in flight after the drain, they will be redelivered', len(pending))
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
     async def close(self):
-        """Close the stream and nats connections."""
+        """Drain the messages in flight, then close the stream and nats connections."""
+        await self.drain(getattr(self.config, 'NATS_DRAIN_TIMEOUT', None))
         try:
             await self.sc.close()
             await self.nc.close()
@@ -166,9 +227,17 @@ class ServiceWorker:
             logger.debug('error when closing the streams: %s', err, stack_info=True)
 
     async def publish(self, subject: str, msg: Dict):
-        """Publish the msg as a JSON struct to the subject, using the streaming NATS connection."""
-        await self.sc.publish(subject=subject,
-                              payload=json.dumps(msg).encode('utf-8'))
+        """Publish the msg as a JSON struct to the subject, using the streaming NATS connection.
+
+        When called from another event loop, e.g. one running on a worker thread, the publish is handed over
+        to the loop that owns the connection.
+        """
+        publish = self.sc.publish(subject=subject,
+                                  payload=json.dumps(msg).encode('utf-8'))
+        if self._loop and asyncio.get_running_loop() is not self._loop:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(publish, self._loop))
+            return
+        await publish
 
 
 class QueueServiceManager:
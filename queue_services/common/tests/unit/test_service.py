@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test Suite to ensure the ServiceWorker wrapper is working as expected."""
+import asyncio
+import threading
+import time
+
 import pytest
 
 from entity_queue_common.service import ServiceWorker
@@ -84,3 +88,88 @@ async def test_service_connect(stan_server, event_loop):
 
     # teardown
     await service.close()
+
+
+class SC():
+    """A streaming connection that records the acks."""
+
+    def __init__(self):
+        self.acked = []
+
+    async def ack(self, msg):
+        self.acked.append(msg.sequence)
+
+
+class Msg():
+    """A message as delivered by the streaming connection."""
+
+    def __init__(self, sequence):
+        self.sequence = sequence
+
+
+@pytest.mark.asyncio
+async def test_manual_acks():
+    """Assert that a message is acked once it is handled, and isn't acked when the handler fails."""
+    async def handler(msg):
+        if msg.sequence == 2:
+            raise Exception('redeliver me')
+
+    service = ServiceWorker(loop=None, cb_handler=None, config=config.get_named_config())
+    service.sc = SC()
+    cb = service._manual_ack_cb(handler, max_inflight=1)  # pylint: disable=protected-access
+    for sequence in (1, 2, 3):
+        await cb(Msg(sequence))
+    await service.drain()
+
+    assert service.sc.acked == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_manual_acks_max_inflight():
+    """Assert that up to max_inflight messages are handled at once, and the drain waits for them."""
+    in_flight = []
+    peak = []
+
+    async def handler(msg):
+        in_flight.append(msg.sequence)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.remove(msg.sequence)
+
+    service = ServiceWorker(loop=None, cb_handler=None, config=config.get_named_config())
+    service.sc = SC()
+    cb = service._manual_ack_cb(handler, max_inflight=3)  # pylint: disable=protected-access
+    for sequence in range(6):
+        await cb(Msg(sequence))
+    await service.drain(timeout=5)
+
+    assert max(peak) == 3
+    assert sorted(service.sc.acked) == list(range(6))
+
+    # once draining, new messages are left for redelivery
+    await cb(Msg(6))
+    assert 6 not in service.sc.acked
+
+
+@pytest.mark.asyncio
+async def test_manual_acks_handle_on_loop():
+    """Assert that handlers that offload their own work run on the loop, and are acked once that work is done."""
+    loop_thread = threading.get_ident()
+    threads = []
+
+    async def handler(msg):
+        threads.append(threading.get_ident())
+        await asyncio.get_running_loop().run_in_executor(None, time.sleep, 0.01)
+        if msg.sequence == 1:
+            raise Exception('redeliver me')
+
+    service = ServiceWorker(loop=None, cb_handler=None, config=config.get_named_config())
+    service.sc = SC()
+    cb = service._manual_ack_cb(handler, max_inflight=3, handle_on_loop=True)  # pylint: disable=protected-access
+    for sequence in range(4):
+        await cb(Msg(sequence))
+    await service.drain(timeout=5)
+
+    assert service._executor is None  # pylint: disable=protected-access
+    assert set(threads) == {loop_thread}
+    assert sorted(service.sc.acked) == [0, 2, 3]
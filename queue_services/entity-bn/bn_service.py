@@ -17,7 +17,7 @@
 """s2i based launch script to run the service."""
 import asyncio
 
-from entity_bn.worker import APP_CONFIG, cb_subscription_handler, qsm
+from entity_bn.worker import APP_CONFIG, FLASK_APP, cb_subscription_handler, qsm, run_retry_scheduler
 
 
 if __name__ == '__main__':
@@ -26,6 +26,7 @@ if __name__ == '__main__':
     event_loop.run_until_complete(qsm.run(loop=event_loop,
                                           config=APP_CONFIG,
                                           callback=cb_subscription_handler))
+    event_loop.create_task(run_retry_scheduler(FLASK_APP))
     try:
         event_loop.run_forever()
     finally:
@@ -15,6 +15,8 @@
 
 Processors hold the logic to communicate with CRA.
 """
+import random
+from datetime import timedelta
 from pathlib import Path
 
 import requests
@@ -22,6 +24,7 @@ from entity_queue_common.service_utils import logger
 from flask import current_app
 from jinja2 import Template
 from legal_api.models import RequestTracker
+from legal_api.utils.datetime import datetime
 
 
 program_type_code = {
@@ -67,3 +70,17 @@ def request_bn_hub(input_xml):
     except requests.exceptions.RequestException as err:
         logger.error(err, exc_info=True)
         return None, str(err)
+
+
+def schedule_retry(request_tracker: RequestTracker):
+    """Schedule the next attempt of a failed request, backing off exponentially with jitter.
+
+    The retry scheduler of the worker picks the request up once it is due, so the queue isn't held up meanwhile.
+    """
+    base_delay = current_app.config.get('BN_HUB_RETRY_BASE_DELAY')
+    max_delay = current_app.config.get('BN_HUB_RETRY_MAX_DELAY')
+    delay = min(max_delay, base_delay * 2 ** request_tracker.retry_number)
+    # half of the delay is jitter, so the retries of requests that failed together are spread out
+    delay = delay / 2 + random.uniform(0, delay / 2)  # nosec; not used for security
+    request_tracker.next_retry_date = datetime.utcnow() + timedelta(seconds=delay)
+    request_tracker.save()
@@ -24,15 +24,15 @@ from legal_api.utils.datetime import datetime
 from legal_api.utils.legislation_datetime import LegislationDatetime
 from sqlalchemy_continuum import version_class
 
-from entity_bn.bn_processors import build_input_xml, document_sub_type, request_bn_hub
-from entity_bn.exceptions import BNException
+from entity_bn.bn_processors import build_input_xml, document_sub_type, request_bn_hub, schedule_retry
+from entity_bn.exceptions import BNException, BNNotReadyException
 
 
 def process(business: Business, filing: Filing):  # pylint: disable=too-many-branches
     """Process the incoming change of registration request."""
     if not business.tax_id or len(business.tax_id) != 15:
-        raise BNException(f'Business {business.identifier}, ' +
-                          'Cannot inform CRA about change of registration before receiving Business Number (BN15).')
+        raise BNNotReadyException(f'Business {business.identifier}, Cannot inform CRA about change of registration '
+                                  'before receiving Business Number (BN15).')
 
     if filing.meta_data and filing.meta_data.get('changeOfRegistration', {}).get('toLegalName'):
         _change_name(business, filing, RequestTracker.RequestType.CHANGE_NAME)
@@ -102,11 +102,13 @@ def _change_name(business: Business, filing: Filing,  # pylint: disable=too-many
             root = Et.fromstring(response)
             if root.tag == 'SBNAcknowledgement':
                 request_tracker.is_processed = True
+                request_tracker.next_retry_date = None
     request_tracker.response_object = response
     request_tracker.save()
 
     if not request_tracker.is_processed:
         if request_tracker.retry_number < max_retry:
+            schedule_retry(request_tracker)
             raise BNException(f'Retry number: {request_tracker.retry_number + 1}' +
                               f' for {business.identifier}, TrackerId: {request_tracker.id}.')
 
@@ -167,11 +169,13 @@ def _change_address(business: Business, filing: Filing,  # pylint: disable=too-m
             root = Et.fromstring(response)
             if root.tag == 'SBNAcknowledgement':
                 request_tracker.is_processed = True
+                request_tracker.next_retry_date = None
     request_tracker.response_object = response
     request_tracker.save()
 
     if not request_tracker.is_processed:
         if request_tracker.retry_number < max_retry:
+            schedule_retry(request_tracker)
             raise BNException(f'Retry number: {request_tracker.retry_number + 1}' +
                               f' for {business.identifier}, TrackerId: {request_tracker.id}.')
 
@@ -30,6 +30,7 @@ from entity_bn.bn_processors import (
     business_type_code,
     program_type_code,
     request_bn_hub,
+    schedule_retry,
 )
 from entity_bn.exceptions import BNException
 
@@ -53,6 +54,7 @@ def process(business: Business):  # pylint: disable=too-many-branches
 
     if not inform_cra_tracker.is_processed:
         if inform_cra_tracker.retry_number < max_retry:
+            schedule_retry(inform_cra_tracker)
             raise BNException(f'Retry number: {inform_cra_tracker.retry_number + 1}' +
                               f' for {business.identifier}, TrackerId: {inform_cra_tracker.id}.')
 
@@ -79,6 +81,7 @@ def process(business: Business):  # pylint: disable=too-many-branches
 
     if not get_bn_tracker.is_processed:
         if get_bn_tracker.retry_number < max_retry:
+            schedule_retry(get_bn_tracker)
             raise BNException(f'Retry number: {get_bn_tracker.retry_number + 1}' +
                               f' for {business.identifier}, TrackerId: {get_bn_tracker.id}.')
 
@@ -114,6 +117,7 @@ def _inform_cra(business: Business, request_tracker: RequestTracker):
             root = Et.fromstring(response)
             if root.tag == 'SBNAcknowledgement':
                 request_tracker.is_processed = True
+                request_tracker.next_retry_date = None
     request_tracker.response_object = response
     request_tracker.save()
 
@@ -132,6 +136,7 @@ def _get_bn(business: Business, request_tracker: RequestTracker, transaction_id:
         business.tax_id = bn15
         business.save()
         request_tracker.is_processed = True
+        request_tracker.next_retry_date = None
 
     request_tracker.response_object = json.dumps(response)
     request_tracker.save()
@@ -67,6 +67,13 @@ class _Config():  # pylint: disable=too-few-public-methods
     BN_HUB_CLIENT_ID = os.getenv('BN_HUB_CLIENT_ID', None)
     BN_HUB_CLIENT_SECRET = os.getenv('BN_HUB_CLIENT_SECRET', None)
     BN_HUB_MAX_RETRY = int(os.getenv('BN_HUB_MAX_RETRY', '9'))
+    # failed requests are retried in the background, backing off from the base delay up to the max delay (seconds)
+    BN_HUB_RETRY_BASE_DELAY = int(os.getenv('BN_HUB_RETRY_BASE_DELAY', '60'))
+    BN_HUB_RETRY_MAX_DELAY = int(os.getenv('BN_HUB_RETRY_MAX_DELAY', '3600'))
+    BN_HUB_RETRY_POLL_INTERVAL = int(os.getenv('BN_HUB_RETRY_POLL_INTERVAL', '30'))
+    BN_HUB_RETRY_BATCH_SIZE = int(os.getenv('BN_HUB_RETRY_BATCH_SIZE', '20'))
+    # a claimed retry isn't picked up by another replica until the lease is over (seconds)
+    BN_HUB_RETRY_LEASE = int(os.getenv('BN_HUB_RETRY_LEASE', '300'))
     TEMPLATE_PATH = os.getenv('TEMPLATE_PATH', None)
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -95,7 +102,12 @@ class _Config():  # pylint: disable=too-few-public-methods
         'subject': os.getenv('NATS_ENTITY_EVENT_SUBJECT', 'error'),
         'queue': os.getenv('NATS_QUEUE', 'error'),
         'durable_name': os.getenv('NATS_QUEUE', 'error') + '_durable',
+        # with manual acks up to max_inflight messages are handled at once, each one acked once it is handled
+        'manual_acks': os.getenv('NATS_MANUAL_ACKS', 'False').lower() == 'true',
+        'max_inflight': int(os.getenv('NATS_MAX_INFLIGHT', '1')),
+        'ack_wait': int(os.getenv('NATS_ACK_WAIT', '30')),
     }
+    NATS_DRAIN_TIMEOUT = int(os.getenv('NATS_DRAIN_TIMEOUT', '30'))
 
     # legislative timezone for future effective dating
     LEGISLATIVE_TIMEZONE = os.getenv('LEGISLATIVE_TIMEZONE', 'America/Vancouver')
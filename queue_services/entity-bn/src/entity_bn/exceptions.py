@@ -16,3 +16,7 @@
 
 class BNException(Exception):
     """BN exception for the Queue Services."""
+
+
+class BNNotReadyException(BNException):
+    """The business can't be sent to BN Hub yet, e.g. it has no BN15 until its registration is done."""
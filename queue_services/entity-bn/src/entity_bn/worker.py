@@ -13,7 +13,7 @@
 # limitations under the License.
 """The unique worker functionality for this service is contained here.
 
-The entry-point is the **cb_subscription_handler**
+The entry-point is the **cb_subscription_handler**, failed BN Hub requests are retried by **run_retry_scheduler**
 
 The design and flow leverage a few constraints that are placed upon it
 by NATS Streaming and using AWAIT on the default loop.
@@ -25,8 +25,10 @@ Flask-SQLAlchemy currently allows the base model to be changed, or reworking
 the model to a standalone SQLAlchemy usage with an async engine would need
 to be pursued.
 """
+import asyncio
 import json
 import os
+from datetime import timedelta
 from typing import Dict
 
 import nats
@@ -35,13 +37,13 @@ from entity_queue_common.service_utils import QueueException, logger
 from flask import Flask
 from legal_api import db
 from legal_api.core import Filing as FilingCore
-from legal_api.models import Business
+from legal_api.models import Business, Filing, RequestTracker
 from sentry_sdk import capture_message
 from sqlalchemy.exc import OperationalError
 
 from entity_bn import config
 from entity_bn.bn_processors import change_of_registration, registration
-from entity_bn.exceptions import BNException
+from entity_bn.exceptions import BNException, BNNotReadyException
 
 
 qsm = QueueServiceManager()  # pylint: disable=invalid-name
@@ -82,6 +84,54 @@ async def process_event(filing_msg: Dict, flask_app: Flask):  # pylint: disable=
             change_of_registration.process(business, filing_core_submission.storage)
 
 
+def retry_due_requests(flask_app: Flask) -> int:
+    """Retry the failed BN Hub requests that are due, and return the number of filings retried.
+
+    The processors skip the requests that are already done, so the filing is processed again as a whole.
+    The due requests are claimed first, so the schedulers of the other replicas don't retry them as well.
+    """
+    with flask_app.app_context():
+        request_trackers = RequestTracker.claim_due_retries(
+            RequestTracker.ServiceName.BN_HUB,
+            flask_app.config.get('BN_HUB_MAX_RETRY'),
+            flask_app.config.get('BN_HUB_RETRY_BATCH_SIZE'),
+            timedelta(seconds=flask_app.config.get('BN_HUB_RETRY_LEASE')))
+        db.session.commit()
+        retried = set()
+        for request_tracker in request_trackers:
+            key = (request_tracker.business_id, request_tracker.filing_id)
+            if key in retried:
+                continue
+            retried.add(key)
+
+            try:
+                business = Business.find_by_internal_id(request_tracker.business_id)
+                if request_tracker.request_type in (RequestTracker.RequestType.INFORM_CRA,
+                                                    RequestTracker.RequestType.GET_BN):
+                    registration.process(business)
+                else:
+                    change_of_registration.process(business, Filing.find_by_id(request_tracker.filing_id))
+            except BNException as err:
+                logger.info('BN Hub retry failed, retrying later: %s', err)
+            except Exception as err:  # pylint: disable=broad-except; keep on retrying the other requests
+                db.session.rollback()
+                capture_message(f'Queue Error: BN Hub retry failed for TrackerId: {request_tracker.id}, {err}',
+                                level='error')
+                logger.error('BN Hub retry failed for TrackerId: %s', request_tracker.id, exc_info=True)
+        return len(retried)
+
+
+async def run_retry_scheduler(flask_app: Flask):
+    """Retry the failed BN Hub requests as they come due, alongside the subscription."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(None, retry_due_requests, flask_app)
+        except Exception:  # pylint: disable=broad-except; keep the scheduler alive, e.g. while the DB is down
+            logger.error('Unable to retry the BN Hub requests', exc_info=True)
+        await asyncio.sleep(flask_app.config.get('BN_HUB_RETRY_POLL_INTERVAL'))
+
+
 async def cb_subscription_handler(msg: nats.aio.client.Msg):
     """Use Callback to process Queue Msg objects."""
     try:
@@ -92,9 +142,12 @@ async def cb_subscription_handler(msg: nats.aio.client.Msg):
     except OperationalError as err:
         logger.error('Queue Blocked - Database Issue: %s', json.dumps(event_message), exc_info=True)
         raise err  # We don't want to handle the error, as a DB down would drain the queue
+    except BNNotReadyException as err:
+        logger.warning('Queue BN Issue, business not ready: %s, %s', err, json.dumps(event_message))
+        raise err  # nothing is scheduled to retry it, so try again after sometime
     except BNException as err:
-        logger.error('Queue BN Issue: %s, %s', err, json.dumps(event_message), exc_info=True)
-        raise err  # We don't want to handle the error, try again after sometime
+        # the failed request is retried by the retry scheduler, so the queue keeps flowing meanwhile
+        logger.warning('Queue BN Issue, retry scheduled: %s, %s', err, json.dumps(event_message))
     except (QueueException, Exception) as err:  # pylint: disable=broad-except
         # Catch Exception so that any error is still caught and the message is removed from the queue
         capture_message('Queue Error:' + json.dumps(event_message), level='error')
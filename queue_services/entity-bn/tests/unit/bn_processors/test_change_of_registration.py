@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The Test Suites to ensure that the change of registration is operating correctly."""
+import json
 import xml.etree.ElementTree as Et
 
 import pytest
 from entity_queue_common.service_utils import QueueException
 from legal_api.models import RequestTracker
 
-from entity_bn.exceptions import BNException
+from entity_bn import worker
+from entity_bn.exceptions import BNException, BNNotReadyException
 from entity_bn.worker import process_event
 from tests.unit import create_filing, create_registration_data
 
@@ -157,3 +159,40 @@ async def test_retry_registration(app, session, mocker, request_type, data):
     assert len(request_trackers) == 1
     assert request_trackers[0].is_processed is False
     assert request_trackers[0].retry_number == 9
+
+
+async def test_change_of_registration_without_bn15(app, session, mocker):
+    """Assert that a change of registration before the BN15 is received is redelivered, not dropped."""
+    filing_id, business_id = create_registration_data('SP')
+    json_filing = {
+        'filing': {
+            'header': {
+                'name': 'changeOfRegistration'
+            },
+            'changeOfRegistration': {}
+        }
+    }
+    filing = create_filing(json_filing=json_filing, business_id=business_id)
+    filing._meta_data = {'changeOfRegistration': {'toLegalName': 'new name'}}
+    filing.save()
+    event_message = {
+        'type': 'bc.registry.business.changeOfRegistration',
+        'data': {
+            'filing': {
+                'header': {'filingId': filing.id}
+            }
+        }
+    }
+    request_bn_hub = mocker.patch('entity_bn.bn_processors.change_of_registration.request_bn_hub')
+
+    with pytest.raises(BNNotReadyException):
+        await process_event(event_message, app)
+
+    request_bn_hub.assert_not_called()
+    assert not RequestTracker.find_by(business_id, RequestTracker.ServiceName.BN_HUB, filing_id=filing.id)
+
+    # the message isn't acked, so it's redelivered until the registration receives the BN15
+    mocker.patch.object(worker, 'process_event', side_effect=BNNotReadyException('no BN15'))
+    msg = mocker.MagicMock(sequence=1, data=json.dumps(event_message).encode('utf-8'))
+    with pytest.raises(BNNotReadyException):
+        await worker.cb_subscription_handler(msg)
@@ -13,13 +13,15 @@
 # limitations under the License.
 """The Test Suites to ensure that the registration is operating correctly."""
 import xml.etree.ElementTree as Et
+from datetime import timedelta
 
 import pytest
 from entity_queue_common.service_utils import QueueException
 from legal_api.models import Business, RequestTracker
+from legal_api.utils.datetime import datetime
 
 from entity_bn.exceptions import BNException
-from entity_bn.worker import process_event
+from entity_bn.worker import process_event, retry_due_requests
 from tests.unit import create_registration_data
 
 
@@ -139,3 +141,43 @@ async def test_retry_registration(app, session, mocker, request_type):
         assert len(request_trackers) == 1
         assert request_trackers[0].is_processed is False
         assert request_trackers[0].retry_number == 9
+
+
+async def test_retry_scheduler(app, session, mocker):
+    """Test the failed request is scheduled for a retry, and retried once it is due."""
+    filing_id, business_id = create_registration_data('SP')
+    responses = [(500, ''), (200, acknowledgement_response)]
+    mocker.patch('entity_bn.bn_processors.registration.request_bn_hub', side_effect=lambda _: responses.pop(0))
+    mocker.patch('entity_bn.bn_processors.registration._get_program_account', return_value=(200, {
+        'business_no': '993775204',
+        'business_program_id': 'BC',
+        'cross_reference_program_no': 'FM1234567',
+        'program_account_ref_no': 1})
+    )
+
+    with pytest.raises(BNException):
+        await process_event({
+            'type': 'bc.registry.business.registration',
+            'data': {
+                'filing': {
+                    'header': {'filingId': filing_id}
+                }
+            }
+        }, app)
+
+    request_tracker = RequestTracker.find_by(business_id,
+                                             RequestTracker.ServiceName.BN_HUB,
+                                             RequestTracker.RequestType.INFORM_CRA)[0]
+    assert request_tracker.next_retry_date > datetime.utcnow()
+    # not due yet
+    assert retry_due_requests(app) == 0
+
+    request_tracker.next_retry_date = datetime.utcnow() - timedelta(seconds=1)
+    request_tracker.save()
+    assert retry_due_requests(app) == 1
+
+    assert request_tracker.is_processed
+    assert request_tracker.next_retry_date is None
+    assert retry_due_requests(app) == 0
+    assert request_tracker.retry_number == 1
+    assert Business.find_by_internal_id(business_id).tax_id == '993775204BC0001'
@@ -75,6 +75,9 @@ class _Config():  # pylint: disable=too-few-public-methods
     # variables
     LEGISLATIVE_TIMEZONE = os.getenv('LEGISLATIVE_TIMEZONE', 'America/Vancouver')
     TEMPLATE_PATH = os.getenv('TEMPLATE_PATH', None)
+    # the pdf attachments of an email are generated concurrently, each one within the timeout (seconds)
+    EMAIL_ATTACHMENT_MAX_WORKERS = int(os.getenv('EMAIL_ATTACHMENT_MAX_WORKERS', '4'))
+    EMAIL_ATTACHMENT_TIMEOUT = int(os.getenv('EMAIL_ATTACHMENT_TIMEOUT', '60'))
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
@@ -130,7 +133,12 @@ class _Config():  # pylint: disable=too-few-public-methods
         'subject': os.getenv('NATS_EMAILER_SUBJECT', 'error'),
         'queue': os.getenv('NATS_QUEUE', 'error'),
         'durable_name': os.getenv('NATS_QUEUE', 'error') + '_durable',
+        # with manual acks up to max_inflight messages are handled at once, each one acked once it is handled
+        'manual_acks': os.getenv('NATS_MANUAL_ACKS', 'False').lower() == 'true',
+        'max_inflight': int(os.getenv('NATS_MAX_INFLIGHT', '1')),
+        'ack_wait': int(os.getenv('NATS_ACK_WAIT', '30')),
     }
+    NATS_DRAIN_TIMEOUT = int(os.getenv('NATS_DRAIN_TIMEOUT', '30'))
 
     ENTITY_EVENT_PUBLISH_OPTIONS = {
         'subject': os.getenv('NATS_ENTITY_EVENT_SUBJECT', 'entity.events'),
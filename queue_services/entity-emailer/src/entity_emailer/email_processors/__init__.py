@@ -17,14 +17,25 @@ Processors hold the business logic for how an email is interpreted and sent.
 """
 from __future__ import annotations
 
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from http import HTTPStatus
 from pathlib import Path
+from typing import List, Optional
 
 import requests
 from entity_queue_common.service_utils import logger
 from flask import current_app
 from legal_api.models import Filing
+from legal_api.services.http_client import http_client
 from legal_api.utils.legislation_datetime import LegislationDatetime
+from sentry_sdk import capture_message
+
+
+# a multiple of 3, so the base64 of the chunks can be joined together
+ATTACHMENT_CHUNK_SIZE = 3 * 64 * 1024
 
 
 def get_filing_info(filing_id: str) -> (Filing, dict, dict, str, str):
@@ -117,6 +128,80 @@ def get_user_from_auth(user_name: str, token: str) -> requests.Response:
     return user_info
 
 
+def get_attachments(filing_id: int, token: str, attachments: List[dict]) -> List[dict]:
+    """Generate the pdf attachments concurrently, and return the ones generated in the order given.
+
+    Each attachment is a dict of the type (for the logs), fileName, url, and optionally method, json and the
+    expected status. An attachment that fails or times out is logged, reported to sentry and left out.
+    """
+    if not attachments:
+        return []
+
+    headers = {
+        'Accept': 'application/pdf',
+        'Authorization': f'Bearer {token}'
+    }
+    timeout = current_app.config.get('EMAIL_ATTACHMENT_TIMEOUT')
+    max_workers = min(current_app.config.get('EMAIL_ATTACHMENT_MAX_WORKERS'), len(attachments))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        encoded = list(executor.map(lambda attachment: _get_attachment(filing_id, attachment, headers, timeout),
+                                    attachments))
+
+    pdfs = []
+    for attachment, file_bytes in zip(attachments, encoded):
+        if file_bytes is not None:
+            pdfs.append(
+                {
+                    'fileName': attachment['fileName'],
+                    'fileBytes': file_bytes,
+                    'fileUrl': '',
+                    'attachOrder': len(pdfs) + 1
+                }
+            )
+    return pdfs
+
+
+def _get_attachment(filing_id: int, attachment: dict, headers: dict, timeout: int) -> Optional[str]:
+    """Return the base64 encoded pdf of the attachment, or None if it couldn't be generated."""
+    start = time.perf_counter()
+    size = 0
+    try:
+        with http_client.request(attachment.get('method', 'GET'),
+                                 attachment['url'],
+                                 json=attachment.get('json'),
+                                 headers=headers,
+                                 timeout=timeout,
+                                 stream=True) as response:
+            if response.status_code != attachment.get('status', HTTPStatus.OK):
+                raise requests.exceptions.HTTPError(f'status: {response.status_code}', response=response)
+            encoded, size = _encode_content(response, start + timeout)
+            return encoded
+    except requests.exceptions.RequestException as err:
+        logger.error('Failed to get %s pdf for filing: %s, %s', attachment['type'], filing_id, err)
+        capture_message(f'Email Queue: filing id={filing_id}, error={attachment["type"]} generation', level='error')
+        return None
+    finally:
+        logger.info('Email Queue: filing id=%s, attachment=%s, bytes=%s, ms=%.0f',
+                    filing_id, attachment['type'], size, (time.perf_counter() - start) * 1000)
+
+
+def _encode_content(response: requests.Response, deadline: float) -> (str, int):
+    """Base64 encode the streamed pdf a chunk at a time, so the raw pdf isn't held in memory as well."""
+    encoded = []
+    size = 0
+    remainder = b''
+    for chunk in response.iter_content(chunk_size=ATTACHMENT_CHUNK_SIZE):
+        if time.perf_counter() > deadline:
+            raise requests.exceptions.Timeout('timed out reading the pdf')
+        size += len(chunk)
+        chunk = remainder + chunk
+        cut = len(chunk) - len(chunk) % 3
+        encoded.append(base64.b64encode(chunk[:cut]).decode('utf-8'))
+        remainder = chunk[cut:]
+    encoded.append(base64.b64encode(remainder).decode('utf-8'))
+    return ''.join(encoded), size
+
+
 def substitute_template_parts(template_code: str) -> str:
     """Substitute template parts in main template.
 
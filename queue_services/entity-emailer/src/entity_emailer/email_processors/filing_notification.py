@@ -14,20 +14,22 @@
 """Email processing rules and actions for Incorporation Application notifications."""
 from __future__ import annotations
 
-import base64
 import re
 from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from entity_queue_common.service_utils import logger
 from flask import current_app
 from jinja2 import Template
 from legal_api.models import Business, Filing
 from legal_api.services import NameXService
-from sentry_sdk import capture_message
 
-from entity_emailer.email_processors import get_filing_info, get_recipients, substitute_template_parts
+from entity_emailer.email_processors import (
+    get_attachments,
+    get_filing_info,
+    get_recipients,
+    substitute_template_parts,
+)
 
 
 FILING_TYPE_CONVERTER = {
@@ -47,48 +49,27 @@ def _get_pdfs(
         filing: Filing,
         filing_date_time: str,
         effective_date: str) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the pdfs for the incorporation output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        'Accept': 'application/pdf',
-        'Authorization': f'Bearer {token}'
-    }
+    attachments = []
+    filing_url = f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
     legal_type = business.get('legalType', None)
 
     if filing.filing_type == 'correction':
         original_filing_type = filing.filing_json['filing']['correction']['correctedFilingType']
     if status == Filing.Status.PAID.value:
         # add filing pdf
-        filing_pdf = requests.get(
-            f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}',
-            headers=headers
-        )
-        if filing_pdf.status_code != HTTPStatus.OK:
-            logger.error('Failed to get pdf for filing: %s', filing.id)
-            capture_message(f'Email Queue: filing id={filing.id}, error=pdf generation', level='error')
+        if filing.filing_type == 'correction':
+            file_name = original_filing_type[0].upper() + \
+                ' '.join(re.findall('[a-zA-Z][^A-Z]*', original_filing_type[1:]))
+            file_name = f'{file_name} (Corrected)'
         else:
-            filing_pdf_encoded = base64.b64encode(filing_pdf.content)
-            if filing.filing_type == 'correction':
-                file_name = original_filing_type[0].upper() + \
-                    ' '.join(re.findall('[a-zA-Z][^A-Z]*', original_filing_type[1:]))
-                file_name = f'{file_name} (Corrected)'
-            else:
-                file_name = filing.filing_type[0].upper() + \
-                    ' '.join(re.findall('[a-zA-Z][^A-Z]*', filing.filing_type[1:]))
-                if ar_date := filing.filing_json['filing'].get('annualReport', {}).get('annualReportDate'):
-                    file_name = f'{ar_date[:4]} {file_name}'
+            file_name = filing.filing_type[0].upper() + \
+                ' '.join(re.findall('[a-zA-Z][^A-Z]*', filing.filing_type[1:]))
+            if ar_date := filing.filing_json['filing'].get('annualReport', {}).get('annualReportDate'):
+                file_name = f'{ar_date[:4]} {file_name}'
+        attachments.append({'type': 'pdf', 'fileName': f'{file_name}.pdf', 'url': filing_url})
 
-            pdfs.append(
-                {
-                    'fileName': f'{file_name}.pdf',
-                    'fileBytes': filing_pdf_encoded.decode('utf-8'),
-                    'fileUrl': '',
-                    'attachOrder': attach_order
-                }
-            )
-            attach_order += 1
         # add receipt pdf
         if filing.filing_type == 'incorporationApplication' or (filing.filing_type == 'correction' and
                                                                 original_filing_type == 'incorporationApplication'):
@@ -99,150 +80,52 @@ def _get_pdfs(
 
         # business_data won't be available for incorporationApplication
         business_data = Business.find_by_internal_id(filing.business_id)
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.append({
+            'type': 'receipt',
+            'fileName': 'Receipt.pdf',
+            'method': 'POST',
+            'url': f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
+            'json': {
                 'corpName': corp_name,
                 'filingDateTime': filing_date_time,
                 'effectiveDateTime': effective_date if effective_date != filing_date_time else '',
                 'filingIdentifier': str(filing.id),
                 'businessNumber': business_data.tax_id if business_data and business_data.tax_id else ''
             },
-            headers=headers
-        )
-        if receipt.status_code != HTTPStatus.CREATED:
-            logger.error('Failed to get receipt pdf for filing: %s', filing.id)
-            capture_message(f'Email Queue: filing id={filing.id}, error=receipt generation', level='error')
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    'fileName': 'Receipt.pdf',
-                    'fileBytes': receipt_encoded.decode('utf-8'),
-                    'fileUrl': '',
-                    'attachOrder': attach_order
-                }
-            )
-            attach_order += 1
+            'status': HTTPStatus.CREATED
+        })
     if status == Filing.Status.COMPLETED.value:
         if legal_type != Business.LegalTypes.COOP.value:
             # add notice of articles
-            noa = requests.get(
-                f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
-                '?type=noticeOfArticles',
-                headers=headers
-            )
-            if noa.status_code != HTTPStatus.OK:
-                logger.error('Failed to get noa pdf for filing: %s', filing.id)
-                capture_message(f'Email Queue: filing id={filing.id}, error=noa generation', level='error')
-            else:
-                noa_encoded = base64.b64encode(noa.content)
-                pdfs.append(
-                    {
-                        'fileName': 'Notice of Articles.pdf',
-                        'fileBytes': noa_encoded.decode('utf-8'),
-                        'fileUrl': '',
-                        'attachOrder': attach_order
-                    }
-                )
-                attach_order += 1
+            attachments.append({'type': 'noa',
+                                'fileName': 'Notice of Articles.pdf',
+                                'url': f'{filing_url}?type=noticeOfArticles'})
 
         if filing.filing_type == 'incorporationApplication' or (filing.filing_type == 'correction' and
                                                                 original_filing_type == 'incorporationApplication' and
                                                                 get_additional_info(filing).get('nameChange', False)):
             # add certificate
-            certificate = requests.get(
-                f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
-                '?type=certificate',
-                headers=headers
-            )
-            if certificate.status_code != HTTPStatus.OK:
-                logger.error('Failed to get certificate pdf for filing: %s', filing.id)
-                capture_message(f'Email Queue: filing id={filing.id}, error=certificate generation', level='error')
-            else:
-                certificate_encoded = base64.b64encode(certificate.content)
-                file_name = 'Incorporation Certificate (Corrected).pdf' if filing.filing_type == 'correction' \
-                    else 'Incorporation Certificate.pdf'
-                pdfs.append(
-                    {
-                        'fileName': file_name,
-                        'fileBytes': certificate_encoded.decode('utf-8'),
-                        'fileUrl': '',
-                        'attachOrder': attach_order
-                    }
-                )
-                attach_order += 1
+            file_name = 'Incorporation Certificate (Corrected).pdf' if filing.filing_type == 'correction' \
+                else 'Incorporation Certificate.pdf'
+            attachments.append({'type': 'certificate', 'fileName': file_name, 'url': f'{filing_url}?type=certificate'})
 
             if legal_type == Business.LegalTypes.COOP.value:
                 # Add rules
-                rules = requests.get(
-                    f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
-                    '?type=certifiedRules',
-                    headers=headers
-                )
-                if rules.status_code != HTTPStatus.OK:
-                    logger.error('Failed to get certifiedRules pdf for filing: %s', filing.id)
-                    capture_message(f'Email Queue: filing id={filing.id}, error=certifiedRules generation',
-                                    level='error')
-                else:
-                    certified_rules_encoded = base64.b64encode(rules.content)
-                    pdfs.append(
-                        {
-                            'fileName': 'Certified Rules.pdf',
-                            'fileBytes': certified_rules_encoded.decode('utf-8'),
-                            'fileUrl': '',
-                            'attachOrder': attach_order
-                        }
-                    )
-                    attach_order += 1
-
+                attachments.append({'type': 'certifiedRules',
+                                    'fileName': 'Certified Rules.pdf',
+                                    'url': f'{filing_url}?type=certifiedRules'})
                 # Add memorandum
-                memorandum = requests.get(
-                    f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
-                    '?type=certifiedMemorandum',
-                    headers=headers
-                )
-                if memorandum.status_code != HTTPStatus.OK:
-                    logger.error('Failed to get certifiedMemorandum pdf for filing: %s', filing.id)
-                    capture_message(f'Email Queue: filing id={filing.id}, error=certifiedMemorandum generation',
-                                    level='error')
-                else:
-                    certified_memorandum_encoded = base64.b64encode(memorandum.content)
-                    pdfs.append(
-                        {
-                            'fileName': 'Certified Memorandum.pdf',
-                            'fileBytes': certified_memorandum_encoded.decode('utf-8'),
-                            'fileUrl': '',
-                            'attachOrder': attach_order
-                        }
-                    )
-                    attach_order += 1
+                attachments.append({'type': 'certifiedMemorandum',
+                                    'fileName': 'Certified Memorandum.pdf',
+                                    'url': f'{filing_url}?type=certifiedMemorandum'})
 
         if filing.filing_type == 'alteration' and get_additional_info(filing).get('nameChange', False):
             # add certificate of name change
-            certificate = requests.get(
-                f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business["identifier"]}/filings/{filing.id}'
-                '?type=certificateOfNameChange',
-                headers=headers
-            )
-            if certificate.status_code != HTTPStatus.OK:
-                logger.error('Failed to get certificateOfNameChange pdf for filing: %s', filing.id)
-                capture_message(f'Email Queue: filing id={filing.id}, error=certificateOfNameChange generation',
-                                level='error')
-            else:
-                certificate_encoded = base64.b64encode(certificate.content)
-                file_name = 'Certificate of Name Change.pdf'
-                pdfs.append(
-                    {
-                        'fileName': file_name,
-                        'fileBytes': certificate_encoded.decode('utf-8'),
-                        'fileUrl': '',
-                        'attachOrder': attach_order
-                    }
-                )
-                attach_order += 1
+            attachments.append({'type': 'certificateOfNameChange',
+                                'fileName': 'Certificate of Name Change.pdf',
+                                'url': f'{filing_url}?type=certificateOfNameChange'})
 
-    return pdfs
+    return get_attachments(filing.id, token, attachments)
 
 
 def process(email_info: dict, token: str) -> dict:  # pylint: disable=too-many-locals, , too-many-branches
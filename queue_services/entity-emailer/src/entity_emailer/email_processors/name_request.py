@@ -23,6 +23,7 @@ from entity_queue_common.service_utils import logger
 from flask import current_app
 from jinja2 import Template
 from legal_api.services import NameXService
+from legal_api.services.token_cache import TokenError, token_cache
 from sentry_sdk import capture_message
 
 from entity_emailer.email_processors import substitute_template_parts
@@ -137,15 +138,9 @@ def get_nr_bearer_token():
     client_id = current_app.config.get('NAMEX_SERVICE_CLIENT_USERNAME')
     client_secret = current_app.config.get('NAMEX_SERVICE_CLIENT_SECRET')
 
-    data = 'grant_type=client_credentials'
-    # get service account token
-    res = requests.post(url=token_url,
-                        data=data,
-                        headers={'content-type': 'application/x-www-form-urlencoded'},
-                        auth=(client_id, client_secret))
     try:
-        return res.json().get('access_token')
-    except Exception:  # noqa B902; pylint: disable=W0703;
+        return token_cache.get_token(token_url, client_id, client_secret)
+    except TokenError:
         logger.error('Failed to get nr token')
         capture_message('Failed to get nr token', level='error')
         return None
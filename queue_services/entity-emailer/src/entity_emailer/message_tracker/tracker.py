@@ -11,22 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Functionality for tracking processing of messages in queue."""
+"""Functionality for tracking processing of messages in queue.
 
-import json
-
-import nats
+A message is claimed for processing with a single upsert, that only succeeds for a new message or one that
+failed before, so no separate lookup is needed to skip the messages that are being or have been processed.
+"""
+from typing import List, Tuple
 
 from entity_emailer.email_processors import filing_notification
 from tracker.models import MessageProcessing
 from tracker.services import MessageProcessingService
 
 
-def get_message_context_properties(queue_msg: nats.aio.client.Msg):  # pylint: disable=too-many-return-statements
-    """Get key message properties from a queue message."""
+def get_message_context_properties(email_msg: dict):  # pylint: disable=too-many-return-statements
+    """Get key message properties from the parsed queue message."""
     # todo update this code to just use the cloud event message id when all
     #  publishers are publishing to emailer queue with cloud event format
-    email_msg = json.loads(queue_msg.data.decode('utf-8'))
     etype = email_msg.get('type', None)
 
     message_context_properties = {
@@ -108,112 +108,62 @@ def create_message_context_properties(message_type, message_id, source, identifi
     }
 
 
-def is_processable_message(message_context_properties: dict):
-    """Determine if message needs to be processed."""
-    msg = None
-    is_cloud_event_format = message_context_properties.get('is_cloud_event_format')
-    source = message_context_properties.get('source')
-    message_id = message_context_properties.get('message_id')
-
-    if is_cloud_event_format:
-        if source is None or message_id is None:
-            return False, None
-        msg: MessageProcessing = \
-            MessageProcessingService.find_message_by_source_and_message_id(source, message_id)
-    else:
-        if message_id is None:
-            return False, None
-        msg: MessageProcessing = \
-            MessageProcessingService.find_message_by_message_id(message_id)
-
-    if msg is None or msg.status == MessageProcessing.Status.FAILED.value:
-        return True, msg
-
-    return False, msg
-
+def is_trackable_message(message_context_properties: dict) -> bool:
+    """Determine if the message can be tracked, which is required for it to be processed."""
+    if message_context_properties.get('message_id') is None:
+        return False
+    if message_context_properties.get('is_cloud_event_format') and message_context_properties.get('source') is None:
+        return False
+    return True
 
-def start_tracking_message(message_context_properties: dict, email_msg: dict, existing_tracker_msg: MessageProcessing):
-    """Create a new message with PROCESSING status or update an existing message to PROCESSING status."""
-    if existing_tracker_msg:
-        return update_message_status_to_processing(existing_tracker_msg)
 
-    return create_processing_message(message_context_properties, email_msg)
+def claim_message(message_context_properties: dict, email_msg: dict) -> bool:
+    """Claim the message for processing, returning whether it should be processed."""
+    return bool(claim_messages([(message_context_properties, email_msg)]))
 
 
-def complete_tracking_message(tracker_msg: MessageProcessing):
-    """Update existing message state to COMPLETED."""
-    update_message_status_to_complete(tracker_msg)
-
-
-def mark_tracking_message_as_failed(message_context_properties: dict,
-                                    email_msg: dict,
-                                    existing_tracker_msg: MessageProcessing,
-                                    error_details: str):
-    """Create a new message with FAILED status or update an existing message to FAILED status."""
-    if error_details and len(error_details) > 1000:
-        error_details = error_details[:1000]
-
-    if existing_tracker_msg \
-            and existing_tracker_msg.status == MessageProcessing.Status.PROCESSING.value:
-        return update_message_status_to_failed(existing_tracker_msg, error_details)
+def claim_messages(messages: List[Tuple[dict, dict]]) -> List[str]:
+    """Claim the messages in flight for processing at once, returning the message ids to process.
 
-    if existing_tracker_msg \
-            and existing_tracker_msg.status == MessageProcessing.Status.FAILED.value:
-        return update_failed_message(existing_tracker_msg, error_details)
+    Messages are given as (message_context_properties, email_msg) pairs.
+    """
+    tracked = {}
+    for message_context_properties, email_msg in messages:
+        if is_trackable_message(message_context_properties):
+            # a message redelivered while in flight is only claimed once
+            tracked.setdefault(message_context_properties['message_id'],
+                               _tracker_message(message_context_properties, email_msg))
+    return MessageProcessingService.claim_messages(list(tracked.values()))
 
-    return create_failed_message(message_context_properties, email_msg, error_details)
 
+def complete_tracking_message(message_context_properties: dict):
+    """Update the message state to COMPLETE."""
+    complete_tracking_messages([message_context_properties])
 
-def create_message(message_context_properties: dict,
-                   msg: str,
-                   status: MessageProcessing.Status,
-                   error_details: None):
-    """Create MessageProcessing record."""
-    message_id = message_context_properties.get('message_id')
-    source = message_context_properties.get('source')
-    identifier = message_context_properties.get('identifier')
-    message_type = message_context_properties.get('type')
-    new_status = status
-    message_json = msg
 
-    result = MessageProcessingService.create_message(
-        message_id=message_id,
-        source=source,
-        identifier=identifier,
-        message_type=message_type,
-        status=new_status,
-        message_json=message_json,
-        last_error=error_details,
-        seen_count=1
-    )
-    return result
+def complete_tracking_messages(messages_context_properties: List[dict]):
+    """Update the state of the messages to COMPLETE at once."""
+    MessageProcessingService.update_messages_status(
+        [properties['message_id'] for properties in messages_context_properties if properties.get('message_id')],
+        MessageProcessing.Status.COMPLETE)
 
 
-def create_processing_message(message_context_properties: dict, msg: str):
-    """Create message with status of PROCESSING."""
-    return create_message(message_context_properties, msg, MessageProcessing.Status.PROCESSING, None)
-
-
-def create_failed_message(message_context_properties: dict, msg: str, error_details: str):
-    """Create message with status of FAILED."""
-    return create_message(message_context_properties, msg, MessageProcessing.Status.FAILED, error_details)
-
-
-def update_message_status_to_processing(msg: MessageProcessing):
-    """Update existing message status to PROCESSING."""
-    return MessageProcessingService.update_message_status(msg, MessageProcessing.Status.PROCESSING, None, True)
-
-
-def update_message_status_to_complete(tracker_msg: MessageProcessing):
-    """Update existing message status to COMPLETE."""
-    MessageProcessingService.update_message_status(tracker_msg, MessageProcessing.Status.COMPLETE, None, False)
+def mark_tracking_message_as_failed(message_context_properties: dict, email_msg: dict, error_details: str):
+    """Update the message state to FAILED, tracking it if it wasn't already."""
+    if not is_trackable_message(message_context_properties):
+        return
 
+    if error_details and len(error_details) > 1000:
+        error_details = error_details[:1000]
 
-def update_message_status_to_failed(msg: MessageProcessing, error_details: str):
-    """Update existing message status to FAILED."""
-    return MessageProcessingService.update_message_status(msg, MessageProcessing.Status.FAILED, error_details, False)
+    MessageProcessingService.fail_message(_tracker_message(message_context_properties, email_msg), error_details)
 
 
-def update_failed_message(msg: MessageProcessing, error_details: str):
-    """Update error message for existing failed message."""
-    return MessageProcessingService.update_message_last_error(msg, error_details, False)
+def _tracker_message(message_context_properties: dict, email_msg: dict) -> dict:
+    return {
+        'message_id': message_context_properties.get('message_id'),
+        'source': message_context_properties.get('source'),
+        'identifier': message_context_properties.get('identifier'),
+        'message_type': message_context_properties.get('type'),
+        'message_json': email_msg
+    }
@@ -165,17 +165,16 @@ def process_email(email_msg: dict, flask_app: Flask):  # pylint: disable=too-man
 async def cb_subscription_handler(msg: nats.aio.client.Msg):
     """Use Callback to process Queue Msg objects."""
     with FLASK_APP.app_context():
-
+        email_msg = None
+        message_context_properties = {}
         try:
             logger.info('Received raw message seq: %s, data=  %s', msg.sequence, msg.data.decode())
             email_msg = json.loads(msg.data.decode('utf-8'))
             logger.debug('Extracted email msg: %s', email_msg)
-            message_context_properties = tracker_util.get_message_context_properties(msg)
-            process_message, tracker_msg = tracker_util.is_processable_message(message_context_properties)
-            if process_message:
-                tracker_msg = tracker_util.start_tracking_message(message_context_properties, email_msg, tracker_msg)
+            message_context_properties = tracker_util.get_message_context_properties(email_msg)
+            if tracker_util.claim_message(message_context_properties, email_msg):
                 process_email(email_msg, FLASK_APP)
-                tracker_util.complete_tracking_message(tracker_msg)
+                tracker_util.complete_tracking_message(message_context_properties)
             else:
                 # Skip processing of message due to message state - previously processed or currently being
                 # processed
@@ -183,27 +182,18 @@ async def cb_subscription_handler(msg: nats.aio.client.Msg):
         except OperationalError as err:
             logger.error('Queue Blocked - Database Issue: %s', json.dumps(email_msg), exc_info=True)
             error_details = f'OperationalError - {str(err)}'
-            tracker_util.mark_tracking_message_as_failed(message_context_properties,
-                                                         email_msg,
-                                                         tracker_msg,
-                                                         error_details)
+            tracker_util.mark_tracking_message_as_failed(message_context_properties, email_msg, error_details)
             raise err  # We don't want to handle the error, as a DB down would drain the queue
         except EmailException as err:
             logger.error('Queue Error - email failed to send: %s'
                          '\n\nThis message has been put back on the queue for reprocessing.',
                          json.dumps(email_msg), exc_info=True)
             error_details = f'EmailException - {str(err)}'
-            tracker_util.mark_tracking_message_as_failed(message_context_properties,
-                                                         email_msg,
-                                                         tracker_msg,
-                                                         error_details)
+            tracker_util.mark_tracking_message_as_failed(message_context_properties, email_msg, error_details)
             raise err  # we don't want to handle the error, so that the message gets put back on the queue
         except (QueueException, Exception) as err:  # noqa B902; pylint: disable=W0703;
             # Catch Exception so that any error is still caught and the message is removed from the queue
             capture_message('Queue Error: ' + json.dumps(email_msg), level='error')
             logger.error('Queue Error: %s', json.dumps(email_msg), exc_info=True)
             error_details = f'QueueException, Exception - {str(err)}'
-            tracker_util.mark_tracking_message_as_failed(message_context_properties,
-                                                         email_msg,
-                                                         tracker_msg,
-                                                         error_details)
+            tracker_util.mark_tracking_message_as_failed(message_context_properties, email_msg, error_details)
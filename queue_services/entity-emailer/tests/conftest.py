@@ -49,6 +49,17 @@ def not_raises(exception):
         raise pytest.fail(f'DID RAISE {exception}')
 
 
+@pytest.fixture
+def benchmark_report(request):
+    """Return a function that writes a benchmark result to the terminal, under the name of the test."""
+    reporter = request.config.pluginmanager.get_plugin('terminalreporter')
+
+    def report(result: str):
+        reporter.write_line(f'{request.node.name}: {result}')
+
+    return report
+
+
 # fixture to freeze utcnow to a fixed date-time
 @pytest.fixture
 def freeze_datetime_utcnow(monkeypatch):
@@ -0,0 +1,63 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the message tracker overhead per message, against the tracker database.
+
+Run with RUN_EMAILER_BENCHMARK set; EMAILER_BENCHMARK_MESSAGES sets the number of messages tracked.
+"""
+import os
+import time
+import uuid
+
+from entity_emailer.message_tracker import tracker as tracker_util
+from tests.pytest_marks import integration_benchmark
+
+
+def _messages(count: int):
+    """Return the context properties and payloads of count new name request messages."""
+    messages = []
+    for _ in range(count):
+        message_payload = {
+            'specversion': '1.x-wip',
+            'type': 'bc.registry.names.request',
+            'source': 'nr_pay',
+            'id': str(uuid.uuid4()),
+            'identifier': '781020202',
+            'data': {}
+        }
+        messages.append((tracker_util.get_message_context_properties(message_payload), message_payload))
+    return messages
+
+
+@integration_benchmark
+def test_tracker_overhead(app, tracker_app, tracker_db, session, benchmark_report):  # pylint: disable=unused-argument
+    """Report the tracker overhead per message, claiming one message at a time and in batches."""
+    count = int(os.getenv('EMAILER_BENCHMARK_MESSAGES', '500'))
+
+    messages = _messages(count)
+    start = time.perf_counter()
+    for message_context_properties, email_msg in messages:
+        assert tracker_util.claim_message(message_context_properties, email_msg)
+        tracker_util.complete_tracking_message(message_context_properties)
+    single = (time.perf_counter() - start) / count
+
+    messages = _messages(count)
+    start = time.perf_counter()
+    for i in range(0, count, 10):
+        batch = messages[i:i + 10]
+        assert len(tracker_util.claim_messages(batch)) == len(batch)
+        tracker_util.complete_tracking_messages([properties for properties, _ in batch])
+    batched = (time.perf_counter() - start) / count
+
+    benchmark_report(f'tracker overhead per message: single {single * 1000:.2f}ms, '
+                     f'batches of 10 {batched * 1000:.2f}ms')
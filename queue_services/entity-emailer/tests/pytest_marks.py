@@ -24,3 +24,6 @@ load_dotenv(find_dotenv())
 
 colin_api_integration = pytest.mark.skipif((os.getenv('RUN_COLIN_API', False) is False),
                                            reason='requires access to COLIN API')
+
+integration_benchmark = pytest.mark.skipif((os.getenv('RUN_EMAILER_BENCHMARK', False) is False),
+                                           reason='requires RUN_EMAILER_BENCHMARK and a tracker database')
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The Unit Tests for the Incorporation email processor."""
+import base64
 from unittest.mock import patch
 
 import pytest
 from legal_api.models import Business
 
-from entity_emailer.email_processors import filing_notification
+from entity_emailer.email_processors import filing_notification, get_attachments
 from tests.unit import prep_incorp_filing, prep_incorporation_correction_filing, prep_maintenance_filing
 
 
@@ -119,3 +120,44 @@ def test_maintenance_notification(app, session, status, filing_type):
             assert mock_get_recipients.call_args[0][0] == status
             assert mock_get_recipients.call_args[0][1] == filing.filing_json
             assert mock_get_recipients.call_args[0][2] == token
+
+
+def test_get_attachments(app):
+    """Assert that the attachments are streamed and encoded in order, leaving out the failed ones."""
+    class Response():
+        def __init__(self, status_code, content):
+            self.status_code = status_code
+            self.content = content
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(self.content), 5):  # chunks that aren't a multiple of 3
+                yield self.content[i:i + 5]
+
+    responses = {
+        'https://legal/filing': Response(200, b'filing pdf content'),
+        'https://pay/receipts': Response(201, b'receipt'),
+        'https://legal/noa': Response(500, b''),
+    }
+    attachments = [
+        {'type': 'pdf', 'fileName': 'Filing.pdf', 'url': 'https://legal/filing'},
+        {'type': 'noa', 'fileName': 'Notice of Articles.pdf', 'url': 'https://legal/noa'},
+        {'type': 'receipt', 'fileName': 'Receipt.pdf', 'url': 'https://pay/receipts', 'method': 'POST',
+         'json': {}, 'status': 201},
+    ]
+    with app.app_context():
+        with patch('entity_emailer.email_processors.http_client.request',
+                   side_effect=lambda method, url, **kwargs: responses[url]):
+            pdfs = get_attachments(1, 'token', attachments)
+
+    assert pdfs == [
+        {'fileName': 'Filing.pdf', 'fileBytes': base64.b64encode(b'filing pdf content').decode('utf-8'),
+         'fileUrl': '', 'attachOrder': 1},
+        {'fileName': 'Receipt.pdf', 'fileBytes': base64.b64encode(b'receipt').decode('utf-8'),
+         'fileUrl': '', 'attachOrder': 2},
+    ]
@@ -17,6 +17,7 @@ from unittest.mock import patch
 import pytest
 
 from entity_emailer import worker
+from entity_emailer.message_tracker import tracker as tracker_util
 from entity_queue_common.service_utils import EmailException, QueueException  # noqa: I001
 from tracker.models import MessageProcessing
 from . import create_mock_message  # noqa: I003
@@ -408,3 +409,35 @@ async def test_should_correctly_track_retries_for_failed_processing(tracker_app,
     assert result.status == 'FAILED'
     assert result.message_seen_count == 5
     assert result.last_error == 'QueueException, Exception - Queue Error.'
+
+
+async def test_should_claim_messages_in_flight_at_once(tracker_app, tracker_db, session):
+    """Assert that a batch of messages is claimed at once, skipping the processing and complete ones."""
+    def nr_message(message_id):
+        message_payload = {
+            'specversion': '1.x-wip',
+            'type': 'bc.registry.names.request',
+            'source': 'nr_pay',
+            'id': message_id,
+            'identifier': '781020202',
+            'data': {}
+        }
+        return tracker_util.get_message_context_properties(message_payload), message_payload
+
+    new, failed, complete = (nr_message(f'16fd2111-8baf-433b-82eb-8c7fada84f0{i}') for i in range(3))
+    tracker_util.mark_tracking_message_as_failed(*failed, 'Queue Error.')
+    assert tracker_util.claim_message(*complete)
+    tracker_util.complete_tracking_message(complete[0])
+
+    # the same message redelivered while in flight is only claimed once
+    claimed = tracker_util.claim_messages([new, failed, complete, new])
+    assert sorted(claimed) == sorted([new[0]['message_id'], failed[0]['message_id']])
+
+    # messages being processed aren't claimed again
+    assert not tracker_util.claim_messages([new, failed])
+
+    tracker_util.complete_tracking_messages([new[0], failed[0]])
+    for message_id, seen_count in ((new[0]['message_id'], 1), (failed[0]['message_id'], 2)):
+        result = MessageProcessing.find_message_by_message_id(message_id=message_id)
+        assert result.status == 'COMPLETE'
+        assert result.message_seen_count == seen_count
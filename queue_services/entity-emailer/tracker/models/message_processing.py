@@ -19,7 +19,10 @@ The MessageProcessing class and Schema are held in this module.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy.dialects.postgresql import JSONB
+from typing import List
+
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from . import db
 
@@ -78,3 +81,66 @@ class MessageProcessing(db.Model):
                        message_id=message_id)
         result = q.one_or_none()
         return result
+
+
+    @staticmethod
+    def claim_messages(messages: List[dict]) -> List[str]:
+        """Claim the messages for processing in one atomic upsert, and return the message ids claimed.
+
+        A new message is inserted as PROCESSING, and one that FAILED before is set back to PROCESSING with
+        its seen count incremented; a message that is processing or complete isn't claimed.
+        """
+        if not messages:
+            return []
+
+        now = datetime.utcnow()
+        table = MessageProcessing.__table__
+        stmt = insert(table).values([{**message,
+                                      'status': MessageProcessing.Status.PROCESSING.value,
+                                      'message_seen_count': 1,
+                                      'create_date': now,
+                                      'last_update': now} for message in messages])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.message_id],
+            set_={'status': MessageProcessing.Status.PROCESSING.value,
+                  'message_seen_count': table.c.message_seen_count + 1,
+                  'last_update': now},
+            where=and_(table.c.status == MessageProcessing.Status.FAILED.value,
+                       table.c.source.isnot_distinct_from(stmt.excluded.source))
+        ).returning(table.c.message_id)
+        claimed = [message_id for (message_id,) in db.session.execute(stmt, mapper=MessageProcessing)]
+        db.session.commit()
+        return claimed
+
+
+    @staticmethod
+    def fail_message(message: dict, error: str):
+        """Mark the message as FAILED with the error, inserting it if it wasn't tracked yet."""
+        now = datetime.utcnow()
+        table = MessageProcessing.__table__
+        stmt = insert(table).values(**message,
+                                    status=MessageProcessing.Status.FAILED.value,
+                                    last_error=error,
+                                    message_seen_count=1,
+                                    create_date=now,
+                                    last_update=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.message_id],
+            set_={'status': MessageProcessing.Status.FAILED.value,
+                  'last_error': error,
+                  'last_update': now}
+        )
+        db.session.execute(stmt, mapper=MessageProcessing)
+        db.session.commit()
+
+
+    @staticmethod
+    def update_status(message_ids: List[str], status: Status):
+        """Set the status of the messages, without loading them first."""
+        if not message_ids:
+            return
+
+        db.session.query(MessageProcessing). \
+            filter(MessageProcessing.message_id.in_(message_ids)). \
+            update({'status': status.value, 'last_update': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
@@ -17,7 +17,7 @@
 
 
 from legal_api.utils import datetime  # noqa: I001
-from typing import Optional
+from typing import List, Optional
 
 from tracker.models import MessageProcessing
 
@@ -107,3 +107,21 @@ class MessageProcessingService:  # pylint: disable=too-many-public-methods
         msg = MessageProcessing.find_message_by_source_and_message_id(source=source, message_id=message_id)
 
         return msg
+
+
+    @staticmethod
+    def claim_messages(messages: List[dict]) -> List[str]:
+        """Claim the new and previously failed messages for processing, returning the message ids claimed."""
+        return MessageProcessing.claim_messages(messages)
+
+
+    @staticmethod
+    def fail_message(message: dict, error: str):
+        """Mark the message as FAILED, tracking it if it wasn't already."""
+        MessageProcessing.fail_message(message, error)
+
+
+    @staticmethod
+    def update_messages_status(message_ids: List[str], status: MessageProcessing.Status):
+        """Update the status of the messages by message_id."""
+        MessageProcessing.update_status(message_ids, status)
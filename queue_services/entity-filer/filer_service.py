@@ -17,7 +17,7 @@
 """s2i based launch script to run the service."""
 import asyncio
 
-from entity_filer.worker import APP_CONFIG, cb_subscription_handler, qsm
+from entity_filer.worker import APP_CONFIG, cb_subscription_handler, outbox_dispatcher, qsm
 
 if __name__ == '__main__':
 
@@ -25,6 +25,7 @@ if __name__ == '__main__':
     event_loop.run_until_complete(qsm.run(loop=event_loop,
                                           config=APP_CONFIG,
                                           callback=cb_subscription_handler))
+    event_loop.create_task(outbox_dispatcher.run())
     try:
         event_loop.run_forever()
     finally:
@@ -90,11 +90,22 @@ class _Config():  # pylint: disable=too-few-public-methods
         'ping_max_out': 5,
     }
 
+    # filings for different businesses are processed concurrently when above 1,
+    # each message is then acked once its filing is processed, with up to FILER_MAX_WORKERS in flight
+    FILER_MAX_WORKERS = int(os.getenv('FILER_MAX_WORKERS', '1'))
+
     SUBSCRIPTION_OPTIONS = {
         'subject': os.getenv('NATS_FILER_SUBJECT', 'error'),
         'queue': os.getenv('NATS_QUEUE', 'error'),
         'durable_name': os.getenv('NATS_QUEUE', 'error') + '_durable',
+        # with manual acks up to max_inflight messages are handled at once, each one acked once it is handled
+        'manual_acks': FILER_MAX_WORKERS > 1 or os.getenv('NATS_MANUAL_ACKS', 'False').lower() == 'true',
+        'max_inflight': FILER_MAX_WORKERS if FILER_MAX_WORKERS > 1 else int(os.getenv('NATS_MAX_INFLIGHT', '1')),
+        'ack_wait': int(os.getenv('NATS_ACK_WAIT', '30')),
+        # the worker pool hands the filings over to threads of its own
+        'handle_on_loop': FILER_MAX_WORKERS > 1,
     }
+    NATS_DRAIN_TIMEOUT = int(os.getenv('NATS_DRAIN_TIMEOUT', '30'))
 
     ENTITY_EVENT_PUBLISH_OPTIONS = {
         'subject': os.getenv('NATS_ENTITY_EVENT_SUBJECT', 'entity.events'),
@@ -104,6 +115,13 @@ class _Config():  # pylint: disable=too-few-public-methods
         'subject': os.getenv('NATS_EMAILER_SUBJECT', 'entity.email'),
     }
 
+    # the outbox of filing side effects is drained in batches, retrying failures with a doubling backoff
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', '50'))
+    OUTBOX_POLL_INTERVAL = float(os.getenv('OUTBOX_POLL_INTERVAL', '1'))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '8'))
+    OUTBOX_BACKOFF_SECONDS = int(os.getenv('OUTBOX_BACKOFF_SECONDS', '30'))
+    OUTBOX_LEASE_SECONDS = int(os.getenv('OUTBOX_LEASE_SECONDS', '300'))
+
     COLIN_API = os.getenv('COLIN_API', '')
 
     # service accounts
@@ -16,7 +16,7 @@ from contextlib import suppress
 from typing import Dict
 
 import dpath
-import sentry_sdk
+from entity_queue_common.service_utils import QueueException
 from legal_api.models import Business, Filing
 
 from entity_filer.filing_meta import FilingMeta
@@ -88,6 +88,4 @@ def post_process(business: Business, filing: Filing, correction: bool = False):
             business,
             filing.json['filing']['alteration']['contactPoint']
         ):
-            sentry_sdk.capture_message(
-                f'Queue Error: Update Business for filing:{filing.id},error:{err}',
-                level='error')
+            raise QueueException(f'Queue Error: Update Business for filing:{filing.id}, error:{err}')
@@ -19,7 +19,12 @@ from entity_queue_common.service_utils import QueueException, logger
 from legal_api.models import Business, PartyRole
 
 from entity_filer.filing_meta import FilingMeta
-from entity_filer.filing_processors.filing_components import create_party, create_role, update_director
+from entity_filer.filing_processors.filing_components import (
+    create_party,
+    create_role,
+    find_parties,
+    update_director,
+)
 
 
 def process(business: Business, filing: Dict, filing_meta: FilingMeta):  # pylint: disable=too-many-branches;
@@ -29,6 +34,8 @@ def process(business: Business, filing: Dict, filing_meta: FilingMeta):  # pylin
 
     business.last_cod_date = filing_meta.application_date
     new_director_names = []
+    # the existing parties of the directors that may be appointed, found at once
+    parties_by_name = find_parties(business.id, new_directors)
 
     for new_director in new_directors:  # pylint: disable=too-many-nested-blocks;
         # Applies only for filings coming from colin.
@@ -61,7 +68,7 @@ def process(business: Business, filing: Dict, filing_meta: FilingMeta):  # pylin
         if 'appointed' in new_director['actions']:
 
             # add new diretor party role to the business
-            party = create_party(business_id=business.id, party_info=new_director)
+            party = create_party(business_id=business.id, party_info=new_director, parties_by_name=parties_by_name)
             role = {
                 'roleType': 'Director',
                 'appointmentDate': new_director.get('appointmentDate'),
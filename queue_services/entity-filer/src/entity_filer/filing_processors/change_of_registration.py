@@ -17,7 +17,7 @@ from contextlib import suppress
 from typing import Dict
 
 import dpath
-import sentry_sdk
+from entity_queue_common.service_utils import QueueException
 from legal_api.models import Address, Business, Filing, Party, PartyRole
 
 from entity_filer.filing_meta import FilingMeta
@@ -143,6 +143,4 @@ def post_process(business: Business, filing: Filing):
             business,
             filing.json['filing']['changeOfRegistration']['contactPoint']
         ):
-            sentry_sdk.capture_message(
-                f'Queue Error: Update Business for filing:{filing.id},error:{err}',
-                level='error')
+            raise QueueException(f'Queue Error: Update Business for filing:{filing.id}, error:{err}')
@@ -26,7 +26,6 @@ from contextlib import suppress
 from typing import Dict
 
 import dpath
-import sentry_sdk
 from entity_queue_common.service_utils import QueueException
 from legal_api.models import Business, Filing
 
@@ -119,6 +118,4 @@ def post_process(business: Business, filing: Filing):
             business,
             filing.json['filing']['conversion']['contactPoint']
         ):
-            sentry_sdk.capture_message(
-                f'Queue Error: Update Business for filing:{filing.id}, error:{err}',
-                level='error')
+            raise QueueException(f'Queue Error: Update Business for filing:{filing.id}, error:{err}')
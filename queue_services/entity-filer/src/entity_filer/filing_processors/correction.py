@@ -16,6 +16,7 @@ from typing import Dict
 
 import pytz
 from legal_api.models import Comment, Filing
+from legal_api.services import VersionedBusinessDetailsService
 
 from entity_filer.filing_meta import FilingMeta
 
@@ -28,6 +29,9 @@ def process(correction_filing: Filing, filing: Dict, filing_meta: FilingMeta):
     original_filing = Filing.find_by_id(filing['correction']['correctedFilingId'])
     original_filing.parent_filing = correction_filing
 
+    # the stored revision of the original filing is no longer the final word on it
+    VersionedBusinessDetailsService.invalidate_revision_snapshot(original_filing.id)
+
     # add comment to the original filing
     original_filing.comments.append(
         Comment(
@@ -14,7 +14,7 @@
 """This module contains all of the Legal Filing specific component processors."""
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pycountry
 from legal_api.models import Address, Business, Office, Party, PartyRole, ShareClass, ShareSeries
@@ -85,20 +85,41 @@ def create_office(business, office_type, addresses) -> Office:
     return office
 
 
-def create_party(business_id: int, party_info: dict, create: bool = True) -> Party:
-    """Create a new party or get them if they already exist."""
+def get_party_name(party_info: dict) -> str:
+    """Return the name of the party as it is compared with the name of an existing party."""
+    if not (middle_initial := party_info['officer'].get('middleInitial')):
+        middle_initial = party_info['officer'].get('middleName', '')
+
+    return PartyRole.get_party_name(
+        first_name=party_info['officer'].get('firstName', ''),
+        last_name=party_info['officer'].get('lastName', ''),
+        middle_initial=middle_initial,
+        org_name=party_info['officer'].get('organizationName', '')
+    )
+
+
+def find_parties(business_id: int, parties_info: List[dict]) -> Dict[str, Party]:
+    """Return the existing parties of the business matching any of the parties, by name, in one query."""
+    return PartyRole.find_parties_by_name(business_id, [get_party_name(party_info) for party_info in parties_info])
+
+
+def create_party(business_id: int, party_info: dict, create: bool = True,
+                 parties_by_name: Optional[Dict[str, Party]] = None) -> Party:
+    """Create a new party or get them if they already exist.
+
+    parties_by_name holds the existing parties found by find_parties, to look them up without a query.
+    """
     party = None
     if not (middle_initial := party_info['officer'].get('middleInitial')):
         middle_initial = party_info['officer'].get('middleName', '')
 
     if create:
-        party = PartyRole.find_party_by_name(
-            business_id=business_id,
-            first_name=party_info['officer'].get('firstName', '').upper(),
-            last_name=party_info['officer'].get('lastName', '').upper(),
-            middle_initial=middle_initial.upper(),
-            org_name=party_info['officer'].get('organizationName', '').upper()
-        )
+        party_name = get_party_name(party_info)
+        if parties_by_name is None:
+            party = PartyRole.find_parties_by_name(business_id, [party_name]).get(party_name)
+        elif (party := parties_by_name.get(party_name)) and party.name != party_name:
+            # renamed since it was found
+            party = None
     if not party:
         party = Party(
             first_name=party_info['officer'].get('firstName', '').upper(),
@@ -119,6 +140,9 @@ def create_party(business_id: int, party_info: dict, create: bool = True) -> Par
     if party_info.get('mailingAddress', None):
         mailing_address = create_address(party_info['mailingAddress'], Address.MAILING)
         party.mailing_address = mailing_address
+
+    if create and parties_by_name is not None:
+        parties_by_name.setdefault(party_name, party)
     return party
 
 
@@ -16,7 +16,6 @@ import json
 from http import HTTPStatus
 
 import requests
-import sentry_sdk
 from entity_queue_common.service_utils import QueueException
 from flask import current_app
 from legal_api.models import Business, Filing, RegistrationBootstrap
@@ -43,15 +42,14 @@ def consume_nr(business: Business, filing: Filing, filing_type='incorporationApp
                 timeout=AccountService.timeout
             )
             if not rv.status_code == HTTPStatus.OK:
-                raise QueueException
+                raise QueueException(f'Queue Error: Unable to consume NR:{nr_num} for filing:{filing.id}, '
+                                     f'status:{rv.status_code}')
 
             # remove the NR from the account
             if filing.temp_reg and (bootstrap := RegistrationBootstrap.find_by_identifier(filing.temp_reg)):
                 AccountService.delete_affiliation(bootstrap.account, nr_num)
     except KeyError:
         pass  # return
-    except Exception:  # pylint: disable=broad-except; note out any exception, but don't fail the call
-        sentry_sdk.capture_message(f'Queue Error: Consume NR error for filing:{filing.id}', level='error')
 
 
 def set_legal_name(business: Business, name_request_info: dict):
@@ -18,7 +18,6 @@ from http import HTTPStatus
 from typing import Dict
 
 import dpath
-import sentry_sdk
 from entity_queue_common.service_utils import QueueException
 from legal_api.models import Business, Filing, RegistrationBootstrap
 from legal_api.services.bootstrap import AccountService
@@ -32,44 +31,34 @@ from entity_filer.filing_processors.filing_components.parties import update_part
 
 def update_affiliation(business: Business, filing: Filing):
     """Create an affiliation for the business and remove the bootstrap."""
-    try:
-        bootstrap = RegistrationBootstrap.find_by_identifier(filing.temp_reg)
-
-        rv = AccountService.create_affiliation(
+    bootstrap = RegistrationBootstrap.find_by_identifier(filing.temp_reg)
+
+    rv = AccountService.create_affiliation(
+        account=bootstrap.account,
+        business_registration=business.identifier,
+        business_name=business.legal_name,
+        corp_type_code=business.legal_type
+    )
+
+    if rv not in (HTTPStatus.OK, HTTPStatus.CREATED):
+        deaffiliation = AccountService.delete_affiliation(bootstrap.account, business.identifier)
+    else:
+        # flip the registration
+        # recreate the bootstrap, but point to the new business in the name
+        old_bs_affiliation = AccountService.delete_affiliation(bootstrap.account, bootstrap.identifier)
+        new_bs_affiliation = AccountService.create_affiliation(
             account=bootstrap.account,
-            business_registration=business.identifier,
-            business_name=business.legal_name,
-            corp_type_code=business.legal_type
+            business_registration=bootstrap.identifier,
+            business_name=business.identifier,
+            corp_type_code='RTMP'
         )
+        reaffiliate = bool(new_bs_affiliation in (HTTPStatus.OK, HTTPStatus.CREATED)
+                           and old_bs_affiliation == HTTPStatus.OK)
 
-        if rv not in (HTTPStatus.OK, HTTPStatus.CREATED):
-            deaffiliation = AccountService.delete_affiliation(bootstrap.account, business.identifier)
-            sentry_sdk.capture_message(
-                f'Queue Error: Unable to affiliate business:{business.identifier} for filing:{filing.id}',
-                level='error'
-            )
-        else:
-            # flip the registration
-            # recreate the bootstrap, but point to the new business in the name
-            old_bs_affiliation = AccountService.delete_affiliation(bootstrap.account, bootstrap.identifier)
-            new_bs_affiliation = AccountService.create_affiliation(
-                account=bootstrap.account,
-                business_registration=bootstrap.identifier,
-                business_name=business.identifier,
-                corp_type_code='RTMP'
-            )
-            reaffiliate = bool(new_bs_affiliation in (HTTPStatus.OK, HTTPStatus.CREATED)
-                               and old_bs_affiliation == HTTPStatus.OK)
-
-        if rv not in (HTTPStatus.OK, HTTPStatus.CREATED) \
-                or ('deaffiliation' in locals() and deaffiliation != HTTPStatus.OK)\
-                or ('reaffiliate' in locals() and not reaffiliate):
-            raise QueueException
-    except Exception as err:  # pylint: disable=broad-except; note out any exception, but don't fail the call
-        sentry_sdk.capture_message(
-            f'Queue Error: Affiliation error for filing:{filing.id}, with err:{err}',
-            level='error'
-        )
+    if rv not in (HTTPStatus.OK, HTTPStatus.CREATED) \
+            or ('deaffiliation' in locals() and deaffiliation != HTTPStatus.OK)\
+            or ('reaffiliate' in locals() and not reaffiliate):
+        raise QueueException(f'Queue Error: Unable to affiliate business:{business.identifier} for filing:{filing.id}')
 
 
 def process(business: Business,  # pylint: disable=too-many-branches
@@ -143,6 +132,4 @@ def post_process(business: Business, filing: Filing):
             business,
             filing.json['filing']['registration']['contactPoint']
         ):
-            sentry_sdk.capture_message(
-                f'Queue Error: Update Business for filing:{filing.id}, error:{err}',
-                level='error')
+            raise QueueException(f'Queue Error: Update Business for filing:{filing.id}, error:{err}')
@@ -0,0 +1,99 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The side effects of a filing are written to the outbox with the filing, and carried out by the dispatcher.
+
+The dispatcher claims the due messages in batches, runs the handler for each one, and retries the ones that
+fail with an exponential backoff. A message that keeps failing is marked FAILED and reported to Sentry.
+"""
+import asyncio
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+from entity_queue_common.service_utils import logger
+from flask import Flask
+from legal_api.models import Business, Filing, OutboxMessage, db
+from sentry_sdk import capture_message
+
+
+Handler = Callable[[Optional[Business], Filing, Dict], None]
+
+
+def add_message(filing: Filing, business: Optional[Business], action: str, **payload):
+    """Add a side effect of the filing to the outbox, in the session of the filing."""
+    OutboxMessage(filing_id=filing.id,
+                  business_id=business.id if business else None,
+                  action=action,
+                  payload=payload).save_to_session()
+
+
+class OutboxDispatcher:
+    """Drain the outbox, running the handler registered for the action of each message."""
+
+    def __init__(self, flask_app: Flask, handlers: Dict[str, Handler]):
+        """Initialize the dispatcher."""
+        self.flask_app = flask_app
+        self.handlers = handlers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def wake(self):
+        """Have the dispatcher look for messages now, rather than at the next poll; safe to call from any thread."""
+        if self._loop and self._wake:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def dispatch_batch(self) -> int:
+        """Carry out one batch of due messages, and return the number of messages attempted."""
+        config = self.flask_app.config
+        with self.flask_app.app_context():
+            messages = OutboxMessage.claim_due(config.get('OUTBOX_BATCH_SIZE', 50),
+                                               timedelta(seconds=config.get('OUTBOX_LEASE_SECONDS', 300)))
+            db.session.commit()
+
+            for message in messages:
+                try:
+                    filing = Filing.find_by_id(message.filing_id)
+                    business = Business.find_by_internal_id(message.business_id) if message.business_id else None
+                    self.handlers[message.action](business, filing, message.payload or {})
+                    message.mark_processed()
+                except Exception as err:  # pylint: disable=broad-except; every failure is retried
+                    db.session.rollback()
+                    message.mark_failed(str(err),
+                                        config.get('OUTBOX_MAX_ATTEMPTS', 8),
+                                        timedelta(seconds=config.get('OUTBOX_BACKOFF_SECONDS', 30)))
+                    logger.warning('Outbox: %s failed for filing:%s, attempt:%s',
+                                   message.action, message.filing_id, message.attempts, exc_info=True)
+                    if message.status == OutboxMessage.Status.FAILED.value:
+                        capture_message(f'Queue Error: {message.action} failed for filing:{message.filing_id} '
+                                        f'after {message.attempts} attempts with error:{err}', level='error')
+                db.session.commit()
+            return len(messages)
+
+    async def run(self):
+        """Drain the outbox until cancelled, polling for new messages when it is empty."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        poll_interval = self.flask_app.config.get('OUTBOX_POLL_INTERVAL', 1)
+        while True:
+            try:
+                attempted = await self._loop.run_in_executor(None, self.dispatch_batch)
+            except Exception:  # pylint: disable=broad-except; keep the dispatcher alive, e.g. while the DB is down
+                logger.error('Outbox: unable to dispatch the outbox', exc_info=True)
+                attempted = 0
+            if attempted:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
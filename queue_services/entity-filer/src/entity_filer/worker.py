@@ -24,10 +24,18 @@ If these constraints change, the use of Flask-SQLAlchemy would need to change.
 Flask-SQLAlchemy currently allows the base model to be changed, or reworking
 the model to a standalone SQLAlchemy usage with an async engine would need
 to be pursued.
+
+With FILER_MAX_WORKERS above 1 the filings are processed concurrently instead:
+each filing runs on a worker thread, with its own app context and so its own
+DB session, and filings for the same business (or temp registration) run one
+at a time in the order they were received. The messages are acknowledged manually,
+each one once its filing has been processed, so a failed filing is redelivered.
 """
+import asyncio
 import json
 import os
 import uuid
+from http import HTTPStatus
 from typing import Dict
 
 import nats
@@ -38,6 +46,7 @@ from flask import Flask
 from legal_api import db
 from legal_api.core import Filing as FilingCore
 from legal_api.models import Business, Filing
+from legal_api.services import VersionedBusinessDetailsService
 from legal_api.services.bootstrap import AccountService
 from legal_api.utils.datetime import datetime
 from sentry_sdk import capture_message
@@ -65,6 +74,8 @@ from entity_filer.filing_processors import (
     transition,
 )
 from entity_filer.filing_processors.filing_components import name_request
+from entity_filer.outbox import OutboxDispatcher, add_message
+from entity_filer.worker_pool import PartitionedWorkerPool
 
 
 qsm = QueueServiceManager()  # pylint: disable=invalid-name
@@ -72,6 +83,9 @@ APP_CONFIG = config.get_named_config(os.getenv('DEPLOYMENT_ENV', 'production'))
 FLASK_APP = Flask(__name__)
 FLASK_APP.config.from_object(APP_CONFIG)
 db.init_app(FLASK_APP)
+worker_pool = None  # pylint: disable=invalid-name
+if APP_CONFIG.FILER_MAX_WORKERS > 1:
+    worker_pool = PartitionedWorkerPool(APP_CONFIG.FILER_MAX_WORKERS)  # pylint: disable=invalid-name
 
 
 def get_filing_types(legal_filings: dict):
@@ -88,36 +102,41 @@ def get_filing_types(legal_filings: dict):
     return filing_types
 
 
+def get_event_payload(business: Business, filing: Filing) -> Dict:
+    """Return the filing event that is published onto the NATS filing subject."""
+    payload = {
+        'specversion': '1.x-wip',
+        'type': 'bc.registry.business.' + filing.filing_type,
+        'source': ''.join([
+            APP_CONFIG.LEGAL_API_URL,
+            '/business/',
+            business.identifier,
+            '/filing/',
+            str(filing.id)]),
+        'id': str(uuid.uuid4()),
+        'time': datetime.utcnow().isoformat(),
+        'datacontenttype': 'application/json',
+        'identifier': business.identifier,
+        'data': {
+            'filing': {
+                'header': {'filingId': filing.id,
+                           'effectiveDate': filing.effective_date.isoformat()
+                           },
+                'business': {'identifier': business.identifier},
+                'legalFilings': get_filing_types(filing.filing_json)
+            }
+        }
+    }
+    if filing.temp_reg:
+        payload['tempidentifier'] = filing.temp_reg
+    return payload
+
+
 async def publish_event(business: Business, filing: Filing):
     """Publish the filing message onto the NATS filing subject."""
     try:
-        payload = {
-            'specversion': '1.x-wip',
-            'type': 'bc.registry.business.' + filing.filing_type,
-            'source': ''.join([
-                APP_CONFIG.LEGAL_API_URL,
-                '/business/',
-                business.identifier,
-                '/filing/',
-                str(filing.id)]),
-            'id': str(uuid.uuid4()),
-            'time': datetime.utcnow().isoformat(),
-            'datacontenttype': 'application/json',
-            'identifier': business.identifier,
-            'data': {
-                'filing': {
-                    'header': {'filingId': filing.id,
-                               'effectiveDate': filing.effective_date.isoformat()
-                               },
-                    'business': {'identifier': business.identifier},
-                    'legalFilings': get_filing_types(filing.filing_json)
-                }
-            }
-        }
-        if filing.temp_reg:
-            payload['tempidentifier'] = filing.temp_reg
         subject = APP_CONFIG.ENTITY_EVENT_PUBLISH_OPTIONS['subject']
-        await qsm.service.publish(subject, payload)
+        await qsm.service.publish(subject, get_event_payload(business, filing))
     except Exception as err:  # pylint: disable=broad-except; we don't want to fail out the filing, so ignore all.
         capture_message('Queue Publish Event Error: filing.id=' + str(filing.id) + str(err), level='error')
         logger.error('Queue Publish Event Error: filing.id=%s', filing.id, exc_info=True)
@@ -228,85 +247,151 @@ async def process_filing(filing_msg: Dict, flask_app: Flask):  # pylint: disable
 
             db.session.add(business)
             db.session.add(filing_submission)
-            db.session.commit()
-
-            # post filing changes to other services
-            if any('alteration' in x for x in legal_filings):
-                alteration.post_process(business, filing_submission, is_correction)
-                AccountService.update_entity(
-                    business_registration=business.identifier,
-                    business_name=business.legal_name,
-                    corp_type_code=business.legal_type
-                )
 
-            if any('changeOfRegistration' in x for x in legal_filings):
-                change_of_registration.post_process(business, filing_submission)
-                AccountService.update_entity(
-                    business_registration=business.identifier,
-                    business_name=business.legal_name,
-                    corp_type_code=business.legal_type
-                )
-
-            if any('incorporationApplication' in x for x in legal_filings):
-                if any('correction' in x for x in legal_filings):
-                    if name_request.has_new_nr_for_correction(filing_submission.filing_json):
-                        name_request.consume_nr(business, filing_submission)
-                else:
-                    filing_submission.business_id = business.id
-                    db.session.add(filing_submission)
-                    db.session.commit()
-                    incorporation_filing.update_affiliation(business, filing_submission)
-                    name_request.consume_nr(business, filing_submission)
-                    incorporation_filing.post_process(business, filing_submission)
-                    try:
-                        await publish_email_message(
-                            qsm, APP_CONFIG.EMAIL_PUBLISH_OPTIONS['subject'], filing_submission, 'mras')
-                    except Exception as err:  # pylint: disable=broad-except, unused-variable # noqa F841;
-                        # mark any failure for human review
-                        capture_message(
-                            f'Queue Error: Failed to place email for filing:{filing_submission.id}'
-                            f'on Queue with error:{err}',
-                            level='error'
-                        )
-
-            if any('registration' in x for x in legal_filings):
-                filing_submission.business_id = business.id
-                db.session.add(filing_submission)
-                db.session.commit()
-                registration.update_affiliation(business, filing_submission)
-                name_request.consume_nr(business, filing_submission, 'registration')
-                registration.post_process(business, filing_submission)
-
-            if any('changeOfName' in x for x in legal_filings):
-                change_of_name.post_process(business, filing_submission)
-
-            if any('conversion' in x for x in legal_filings):
-                filing_submission.business_id = business.id
-                db.session.add(filing_submission)
-                db.session.commit()
-                conversion.post_process(business, filing_submission)
+            # the side effects are committed with the filing and carried out by the outbox dispatcher
+            add_outbox_messages(business, filing_submission, legal_filings, is_correction)
+            db.session.commit()
 
             try:
-                await publish_email_message(
-                    qsm, APP_CONFIG.EMAIL_PUBLISH_OPTIONS['subject'], filing_submission, filing_submission.status)
+                # the filing is now immutable, so store the business revision snapshot for the filing outputs
+                if VersionedBusinessDetailsService.save_revision_snapshot(filing_submission.id):
+                    db.session.commit()
             except Exception as err:  # pylint: disable=broad-except, unused-variable # noqa F841;
-                # mark any failure for human review
+                # the snapshot can be backfilled, and is rebuilt from the versions tables until then
+                db.session.rollback()
                 capture_message(
-                    f'Queue Error: Failed to place email for filing:{filing_submission.id}'
-                    f'on Queue with error:{err}',
-                    level='error'
+                    f'Failed to store the revision snapshot for filing:{filing_submission.id} with error:{err}',
+                    level='warning'
                 )
 
-            try:
-                await publish_event(business, filing_submission)
-            except Exception as err:  # pylint: disable=broad-except, unused-variable # noqa F841;
-                # mark any failure for human review
-                print(err)
-                capture_message(
-                    f'Queue Error: Failed to publish event for filing:{filing_submission.id}'
-                    f'on Queue with error:{err}',
-                    level='error'
-                )
+            outbox_dispatcher.wake()
+
+
+def add_outbox_messages(business: Business, filing_submission: Filing, legal_filings: list, is_correction: bool):
+    """Add the changes to post to the other services, the emails and the event to the outbox, in order."""
+    if any(x in y for y in legal_filings for x in ('incorporationApplication', 'registration', 'conversion')) \
+            and not is_correction:
+        # a new business gets its id on flush
+        db.session.flush()
+        filing_submission.business_id = business.id
+
+    if any('alteration' in x for x in legal_filings):
+        add_message(filing_submission, business, POST_PROCESS, filingType='alteration', correction=is_correction)
+        add_message(filing_submission, business, UPDATE_ENTITY)
+
+    if any('changeOfRegistration' in x for x in legal_filings):
+        add_message(filing_submission, business, POST_PROCESS, filingType='changeOfRegistration')
+        add_message(filing_submission, business, UPDATE_ENTITY)
+
+    if any('incorporationApplication' in x for x in legal_filings):
+        if any('correction' in x for x in legal_filings):
+            if name_request.has_new_nr_for_correction(filing_submission.filing_json):
+                add_message(filing_submission, business, CONSUME_NR, filingType='incorporationApplication')
+        else:
+            add_message(filing_submission, business, UPDATE_AFFILIATION, filingType='incorporationApplication')
+            add_message(filing_submission, business, CONSUME_NR, filingType='incorporationApplication')
+            add_message(filing_submission, business, POST_PROCESS, filingType='incorporationApplication')
+            add_message(filing_submission, business, EMAIL, option='mras')
+
+    if any('registration' in x for x in legal_filings):
+        add_message(filing_submission, business, UPDATE_AFFILIATION, filingType='registration')
+        add_message(filing_submission, business, CONSUME_NR, filingType='registration')
+        add_message(filing_submission, business, POST_PROCESS, filingType='registration')
+
+    if any('changeOfName' in x for x in legal_filings):
+        add_message(filing_submission, business, POST_PROCESS, filingType='changeOfName')
+
+    if any('conversion' in x for x in legal_filings):
+        add_message(filing_submission, business, POST_PROCESS, filingType='conversion')
+
+    add_message(filing_submission, business, EMAIL, option=filing_submission.status)
+    add_message(filing_submission, business, EVENT)
+
+
+POST_PROCESSORS = {
+    'alteration': alteration,
+    'changeOfName': change_of_name,
+    'changeOfRegistration': change_of_registration,
+    'conversion': conversion,
+    'incorporationApplication': incorporation_filing,
+    'registration': registration,
+}
+
+
+def _post_process(business: Business, filing: Filing, payload: Dict):
+    processor = POST_PROCESSORS[payload['filingType']]
+    if 'correction' in payload:
+        processor.post_process(business, filing, payload['correction'])
+    else:
+        processor.post_process(business, filing)
+
+
+def _update_entity(business: Business, filing: Filing, payload: Dict):  # pylint: disable=unused-argument
+    rv = AccountService.update_entity(business_registration=business.identifier,
+                                      business_name=business.legal_name,
+                                      corp_type_code=business.legal_type)
+    if rv != HTTPStatus.OK:
+        raise QueueException(f'Unable to update the entity for {business.identifier}, status:{rv}')
+
+
+def _update_affiliation(business: Business, filing: Filing, payload: Dict):
+    POST_PROCESSORS[payload['filingType']].update_affiliation(business, filing)
+
+
+def _consume_nr(business: Business, filing: Filing, payload: Dict):
+    name_request.consume_nr(business, filing, payload['filingType'])
+
+
+def _send_email(business: Business, filing: Filing, payload: Dict):  # pylint: disable=unused-argument
+    # the dispatcher runs on a worker thread, the publish is handed over to the loop of the queue connection
+    asyncio.run(publish_email_message(qsm, APP_CONFIG.EMAIL_PUBLISH_OPTIONS['subject'], filing, payload['option']))
+
+
+def _publish_event(business: Business, filing: Filing, payload: Dict):  # pylint: disable=unused-argument
+    asyncio.run(qsm.service.publish(APP_CONFIG.ENTITY_EVENT_PUBLISH_OPTIONS['subject'],
+                                    get_event_payload(business, filing)))
+
+
+POST_PROCESS = 'post_process'
+UPDATE_ENTITY = 'update_entity'
+UPDATE_AFFILIATION = 'update_affiliation'
+CONSUME_NR = 'consume_nr'
+EMAIL = 'email'
+EVENT = 'event'
+
+outbox_dispatcher = OutboxDispatcher(FLASK_APP, {  # pylint: disable=invalid-name
+    POST_PROCESS: _post_process,
+    UPDATE_ENTITY: _update_entity,
+    UPDATE_AFFILIATION: _update_affiliation,
+    CONSUME_NR: _consume_nr,
+    EMAIL: _send_email,
+    EVENT: _publish_event,
+})
+
+
+def get_partition_key(filing_msg: Dict, flask_app: Flask) -> str:
+    """Return the key of the business the filing is for, filings with the same key are processed in order."""
+    with flask_app.app_context():
+        filing = Filing.find_by_id(filing_msg['filing']['id'])
+        if filing and filing.business_id:
+            return f'business:{filing.business_id}'
+        if filing and filing.temp_reg:
+            return f'temp_reg:{filing.temp_reg}'
+        return f'filing:{filing_msg["filing"]["id"]}'
+
+
+def process_filing_in_worker(filing_msg: Dict, flask_app: Flask):
+    """Process the filing on a worker thread, with an event loop of its own."""
+    asyncio.run(process_filing(filing_msg, flask_app))
+
+
+async def dispatch_filing(filing_msg: Dict, flask_app: Flask):
+    """Hand the filing over to the worker pool and wait for it to be processed.
+
+    Any error processing the filing is raised here, for the subscription handler to deal with.
+    """
+    task = await worker_pool.submit_in_order(get_partition_key, process_filing_in_worker, filing_msg, flask_app)
+    await task
 
 
 async def cb_subscription_handler(msg: nats.aio.client.Msg):
@@ -315,7 +400,10 @@ async def cb_subscription_handler(msg: nats.aio.client.Msg):
         logger.info('Received raw message seq:%s, data=  %s', msg.sequence, msg.data.decode())
         filing_msg = json.loads(msg.data.decode('utf-8'))
         logger.debug('Extracted filing msg: %s', filing_msg)
-        await process_filing(filing_msg, FLASK_APP)
+        if worker_pool:
+            await dispatch_filing(filing_msg, FLASK_APP)
+        else:
+            await process_filing(filing_msg, FLASK_APP)
     except OperationalError as err:
         logger.error('Queue Blocked - Database Issue: %s', json.dumps(filing_msg), exc_info=True)
         raise err  # We don't want to handle the error, as a DB down would drain the queue
@@ -0,0 +1,79 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A bounded pool of worker threads that serializes the work of each partition.
+
+Work for different partitions (businesses) runs in parallel on the worker threads, while work for the same
+partition runs strictly in the order it was submitted. Submitting waits while every worker is busy, so the
+queue subscription can't pull in more messages than the pool can handle.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class PartitionedWorkerPool:
+    """Run blocking callables on worker threads, one at a time per partition key."""
+
+    def __init__(self, max_workers: int):
+        """Initialize the pool; the asyncio primitives are created on the running loop when first used."""
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='filer')
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._order: Optional[asyncio.Lock] = None
+        self._tails: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, key: str, func: Callable, *args) -> asyncio.Task:
+        """Schedule func(*args) after the work already submitted for the key.
+
+        Waits until there is a free slot, then returns the task running the work.
+        """
+        if not self._slots:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        await self._slots.acquire()
+
+        previous = self._tails.get(key)
+        task = asyncio.ensure_future(self._run(key, previous, func, args))
+        self._tails[key] = task
+        return task
+
+    async def submit_in_order(self, get_key: Callable, func: Callable, *args) -> asyncio.Task:
+        """Schedule func(*args) under the key get_key(*args) returns, the key is looked up on a thread.
+
+        Calls are submitted one at a time, in the order they were made, so the work of a partition runs in that order.
+        """
+        if not self._order:
+            self._order = asyncio.Lock()
+        async with self._order:
+            key = await asyncio.get_running_loop().run_in_executor(None, get_key, *args)
+            return await self.submit(key, func, *args)
+
+    async def _run(self, key: str, previous: Optional[asyncio.Task], func: Callable, args):
+        try:
+            if previous:
+                # the outcome of the previous work is handled by whoever submitted it, only the order matters here
+                await asyncio.wait([previous])
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._slots.release()
+            if self._tails.get(key) is asyncio.current_task():
+                del self._tails[key]
+
+    async def join(self):
+        """Wait for all of the submitted work to finish."""
+        while self._tails:
+            await asyncio.wait(list(self._tails.values()))
+
+    def shutdown(self):
+        """Stop the worker threads once the submitted work is done."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,102 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput benchmark of the filer, replaying a message stream against a local NATS and Postgres.
+
+Run with RUN_FILER_BENCHMARK set. FILER_BENCHMARK_STREAM can point to a recorded stream, one filing message
+per line as put on the filer queue, for filings that are already in the database; it is replayed once with
+FILER_BENCHMARK_WORKERS workers (1 for the sequential baseline). Otherwise a stream of annual reports for
+FILER_BENCHMARK_BUSINESSES businesses is created and replayed both sequentially and concurrently.
+"""
+import asyncio
+import copy
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tests.pytest_marks import integration_benchmark
+
+from .utils import helper_add_filing_to_queue, subscribe_to_queue
+
+
+def _load_stream(app, db):  # pylint: disable=invalid-name
+    """Return the filing messages to replay."""
+    if stream := os.getenv('FILER_BENCHMARK_STREAM'):
+        with open(stream) as recorded:
+            return [json.loads(line) for line in recorded if line.strip()]
+
+    from registry_schemas.example_data import ANNUAL_REPORT
+    from tests.unit import create_business, create_filing
+
+    messages = []
+    with app.app_context():
+        for i in range(int(os.getenv('FILER_BENCHMARK_BUSINESSES', '50'))):
+            business = create_business(f'CP{9000000 + i}')
+            filing = create_filing(f'bench_{i}', copy.deepcopy(ANNUAL_REPORT), business.id)
+            messages.append({'filing': {'id': filing.id}})
+        db.session.commit()
+    return messages
+
+
+async def _replay(app, stan_client, messages, max_workers):
+    """Replay the messages through the filer and return the filings processed per second."""
+    from legal_api.models import Filing
+
+    from entity_filer import worker
+    from entity_filer.worker_pool import PartitionedWorkerPool
+
+    async def _detached_handler(msg):
+        # the filer acks manually with max_workers messages in flight, so don't hold the subscription
+        asyncio.ensure_future(worker.cb_subscription_handler(msg))
+
+    pool = PartitionedWorkerPool(max_workers) if max_workers > 1 else None
+    with patch.object(worker, 'worker_pool', pool), \
+            patch.object(worker, 'publish_email_message'), patch.object(worker, 'publish_event'):
+        handler = _detached_handler if pool else worker.cb_subscription_handler
+        subject = await subscribe_to_queue(stan_client, handler)
+        start = time.perf_counter()
+        for msg in messages:
+            await helper_add_filing_to_queue(stan_client, subject, filing_id=msg['filing']['id'])
+
+        ids = [msg['filing']['id'] for msg in messages]
+        while True:
+            with app.app_context():
+                if all(Filing.find_by_id(filing_id).transaction_id for filing_id in ids):
+                    break
+            await asyncio.sleep(0.1)
+        elapsed = time.perf_counter() - start
+    if pool:
+        pool.shutdown()
+    return len(messages) / elapsed
+
+
+@integration_benchmark
+@pytest.mark.asyncio
+async def test_filer_throughput(app, db, stan_server, entity_stan, benchmark_report):  # pylint: disable=invalid-name
+    """Report the filings per second processed sequentially and with the concurrent worker pool."""
+    max_workers = int(os.getenv('FILER_BENCHMARK_WORKERS', '8'))
+
+    if os.getenv('FILER_BENCHMARK_STREAM'):
+        throughput = await _replay(app, entity_stan, _load_stream(app, db), max_workers=max_workers)
+        benchmark_report(f'filer throughput: {max_workers} workers {throughput:.1f}/s')
+        assert throughput > 0
+        return
+
+    sequential = await _replay(app, entity_stan, _load_stream(app, db), max_workers=1)
+    concurrent = await _replay(app, entity_stan, _load_stream(app, db), max_workers=max_workers)
+
+    benchmark_report(f'filer throughput: sequential {sequential:.1f}/s, {max_workers} workers {concurrent:.1f}/s')
+    assert concurrent > 0 and sequential > 0
@@ -32,3 +32,6 @@ integration_namex_api = pytest.mark.skipif((os.getenv('RUN_NAMEX_API', False) is
                                            reason='NameX tests are only run when requested.')
 
 skip_in_pod = pytest.mark.skipif((os.getenv('POD_TESTING', False) is False), reason='Skip test when running in pod')
+
+integration_benchmark = pytest.mark.skipif((os.getenv('RUN_FILER_BENCHMARK', False) is False),
+                                           reason='Throughput benchmarks are only run when requested.')
@@ -92,9 +92,6 @@ async def test_worker_alteration(app, session, mocker, orig_legal_type, new_lega
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -136,9 +133,6 @@ async def test_alteration_legal_name(app, session, mocker, test_name, legal_name
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -183,9 +177,6 @@ async def test_worker_alteration_court_order(app, session, mocker):
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
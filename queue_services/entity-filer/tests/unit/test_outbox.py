@@ -0,0 +1,163 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Suite to ensure the side effects of a filing are written to the outbox and carried out."""
+import copy
+import random
+from http import HTTPStatus
+
+from legal_api.models import Filing, OutboxMessage, RegistrationBootstrap
+from legal_api.services.bootstrap import AccountService
+from registry_schemas.example_data import ALTERATION_FILING_TEMPLATE, ANNUAL_REPORT
+
+from entity_filer import outbox
+from entity_filer.outbox import OutboxDispatcher, add_message
+from entity_filer.worker import (
+    EMAIL,
+    EVENT,
+    POST_PROCESS,
+    UPDATE_AFFILIATION,
+    UPDATE_ENTITY,
+    outbox_dispatcher,
+    process_filing,
+)
+from tests.unit import create_business, create_filing
+
+
+def _filing(business, filing_json=ANNUAL_REPORT):
+    payment_id = str(random.SystemRandom().getrandbits(0x58))
+    return create_filing(payment_id, copy.deepcopy(filing_json), business_id=business.id)
+
+
+async def test_process_filing_writes_outbox(app, session):
+    """Assert that processing an AR writes the email and the event to the outbox, with the filing."""
+    business = create_business('CP1234567', legal_type='CP')
+    filing_id = _filing(business).id
+
+    await process_filing({'filing': {'id': filing_id}}, app)
+
+    messages = OutboxMessage.find_by_filing(filing_id)
+    assert [message.action for message in messages] == [EMAIL, EVENT]
+    assert messages[0].payload == {'option': Filing.find_by_id(filing_id).status}
+    assert all(message.business_id == business.id for message in messages)
+    assert all(message.status == OutboxMessage.Status.PENDING.value for message in messages)
+
+
+async def test_process_alteration_writes_outbox(app, session, mocker):
+    """Assert that the side effects of an alteration are written to the outbox in the order they are carried out."""
+    business = create_business('BC1234567', legal_type='BC')
+    filing_json = copy.deepcopy(ALTERATION_FILING_TEMPLATE)
+    filing_json['filing']['business']['legalType'] = 'BC'
+    filing_json['filing']['alteration']['business']['legalType'] = 'BEN'
+    filing_id = _filing(business, filing_json).id
+    mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
+    mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
+                 return_value=None)
+
+    await process_filing({'filing': {'id': filing_id}}, app)
+
+    messages = OutboxMessage.find_by_filing(filing_id)
+    assert [message.action for message in messages] == [POST_PROCESS, UPDATE_ENTITY, EMAIL, EVENT]
+    assert messages[0].payload == {'filingType': 'alteration', 'correction': False}
+
+
+def test_dispatch_batch(app, session):
+    """Assert that the due messages are carried out in order and marked processed."""
+    business = create_business('CP1234567', legal_type='CP')
+    filing = _filing(business)
+    add_message(filing, business, EMAIL, option='COMPLETED')
+    add_message(filing, business, EVENT)
+    session.commit()
+
+    calls = []
+    dispatcher = OutboxDispatcher(app, {
+        EMAIL: lambda b, f, payload: calls.append((EMAIL, b.id, f.id, payload)),
+        EVENT: lambda b, f, payload: calls.append((EVENT, b.id, f.id, payload)),
+    })
+
+    # only the oldest pending message of a filing is due
+    assert dispatcher.dispatch_batch() == 1
+    assert dispatcher.dispatch_batch() == 1
+    assert dispatcher.dispatch_batch() == 0
+
+    assert calls == [(EMAIL, business.id, filing.id, {'option': 'COMPLETED'}),
+                     (EVENT, business.id, filing.id, {})]
+    messages = OutboxMessage.find_by_filing(filing.id)
+    assert all(message.status == OutboxMessage.Status.PROCESSED.value for message in messages)
+    assert all(message.attempts == 1 for message in messages)
+
+
+def test_dispatch_batch_failure(app, session, mocker):
+    """Assert that a failed message is retried after a backoff, holds back the next one, and fails for good."""
+    business = create_business('CP1234567', legal_type='CP')
+    filing = _filing(business)
+    add_message(filing, business, EMAIL, option='COMPLETED')
+    add_message(filing, business, EVENT)
+    session.commit()
+    capture_message = mocker.patch.object(outbox, 'capture_message')
+
+    def fail(*args):
+        raise Exception('unavailable')
+
+    events = []
+    dispatcher = OutboxDispatcher(app, {EMAIL: fail, EVENT: lambda *args: events.append(args)})
+    app.config['OUTBOX_MAX_ATTEMPTS'], max_attempts = 2, app.config.get('OUTBOX_MAX_ATTEMPTS')
+    app.config['OUTBOX_BACKOFF_SECONDS'], backoff = 0, app.config.get('OUTBOX_BACKOFF_SECONDS')
+    try:
+        assert dispatcher.dispatch_batch() == 1
+        email = OutboxMessage.find_by_filing(filing.id)[0]
+        assert email.status == OutboxMessage.Status.PENDING.value
+        assert email.attempts == 1
+        assert email.last_error == 'unavailable'
+        assert not events
+        capture_message.assert_not_called()
+
+        assert dispatcher.dispatch_batch() == 1
+        assert OutboxMessage.find_by_filing(filing.id)[0].status == OutboxMessage.Status.FAILED.value
+        capture_message.assert_called_once()
+
+        # the failed message no longer holds back the event
+        assert dispatcher.dispatch_batch() == 1
+        assert len(events) == 1
+    finally:
+        app.config['OUTBOX_MAX_ATTEMPTS'] = max_attempts
+        app.config['OUTBOX_BACKOFF_SECONDS'] = backoff
+
+
+def test_dispatch_batch_retries_affiliation(app, session, mocker):
+    """Assert that an affiliation that fails is retried by the outbox, rather than only reported to Sentry."""
+    business = create_business('FM1234567', legal_type='SP')
+    filing = _filing(business)
+    add_message(filing, business, UPDATE_AFFILIATION, filingType='registration')
+    session.commit()
+    mocker.patch.object(RegistrationBootstrap, 'find_by_identifier',
+                        return_value=RegistrationBootstrap(identifier='Tb31yQIuBw', account=1234))
+    create_affiliation = mocker.patch.object(AccountService, 'create_affiliation',
+                                             side_effect=[HTTPStatus.BAD_REQUEST, HTTPStatus.OK, HTTPStatus.OK])
+    mocker.patch.object(AccountService, 'delete_affiliation', return_value=HTTPStatus.OK)
+
+    dispatcher = OutboxDispatcher(app, {UPDATE_AFFILIATION: outbox_dispatcher.handlers[UPDATE_AFFILIATION]})
+    app.config['OUTBOX_BACKOFF_SECONDS'], backoff = 0, app.config.get('OUTBOX_BACKOFF_SECONDS')
+    try:
+        assert dispatcher.dispatch_batch() == 1
+        message = OutboxMessage.find_by_filing(filing.id)[0]
+        assert message.status == OutboxMessage.Status.PENDING.value
+        assert message.last_error == f'Queue Error: Unable to affiliate business:FM1234567 for filing:{filing.id}'
+
+        assert dispatcher.dispatch_batch() == 1
+        message = OutboxMessage.find_by_filing(filing.id)[0]
+        assert message.status == OutboxMessage.Status.PROCESSED.value
+        assert message.attempts == 2
+        assert create_affiliation.call_count == 3
+    finally:
+        app.config['OUTBOX_BACKOFF_SECONDS'] = backoff
@@ -90,9 +90,6 @@ async def test_change_of_registration_legal_name(app, session, mocker, test_name
     filing_id = (create_filing(payment_id, filing, business_id=business_id)).id
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -154,9 +151,6 @@ async def test_change_of_registration_business_address(app, session, mocker, tes
     filing_id = (create_filing(payment_id, filing, business_id=business_id)).id
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -207,9 +201,6 @@ async def test_worker_change_of_registration_court_order(app, session, mocker, t
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -252,9 +243,6 @@ async def test_worker_proprietor_name_and_address_change(app, session, mocker):
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
@@ -325,9 +313,6 @@ async def test_worker_partner_name_and_address_change(app, session, mocker, test
 
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
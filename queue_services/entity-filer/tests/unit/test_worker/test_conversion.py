@@ -81,9 +81,6 @@ async def test_conversion(app, session, mocker, test_name, legal_name, new_legal
     filing_id = (create_filing(payment_id, filing, business_id=business_id)).id
     filing_msg = {'filing': {'id': filing_id}}
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.name_request.consume_nr', return_value=None)
     mocker.patch('entity_filer.filing_processors.filing_components.business_profile.update_business_profile',
                  return_value=None)
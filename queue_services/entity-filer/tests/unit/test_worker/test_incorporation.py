@@ -84,18 +84,13 @@ async def test_incorporation_filing(app, session, bootstrap):
     assert completing_party.appointment_date
 
 
-def test_update_affiliation_error(mocker):
-    """Assert that a message is posted to sentry if an error occurs."""
-    import sentry_sdk
+def test_update_affiliation_error():
+    """Assert that an affiliation error is raised, so the outbox retries it."""
     from entity_filer.filing_processors import incorporation_filing
     filing = Filing(id=1)
-    mocker.patch('sentry_sdk.capture_message')
-    incorporation_filing.update_affiliation(None, filing)
 
-    sentry_sdk.capture_message.assert_called_once_with(
-        f"Queue Error: Affiliation error for filing:{filing.id}, with err:'NoneType' object has no attribute 'account'",
-        level='error'
-    )
+    with pytest.raises(AttributeError, match="'NoneType' object has no attribute 'account'"):
+        incorporation_filing.update_affiliation(None, filing)
 
 @pytest.mark.skip("AttributeError: can't set attribute")
 @pytest.mark.asyncio
@@ -295,10 +295,6 @@ async def test_process_cod_mailing_address(app, session):
 
 async def test_process_combined_filing(app, session, mocker):
     """Assert that an AR filling can be applied to the model correctly."""
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
-
     # vars
     payment_id = str(random.SystemRandom().getrandbits(0x58))
     identifier = 'CP1234567'
@@ -397,10 +393,6 @@ async def test_process_filing_completed(app, session, mocker):
     payment_id = str(random.SystemRandom().getrandbits(0x58))
     identifier = 'CP1234567'
 
-    # mock out the email sender and event publishing
-    mocker.patch('entity_filer.worker.publish_email_message', return_value=None)
-    mocker.patch('entity_filer.worker.publish_event', return_value=None)
-
     # setup
     business = create_business(identifier, legal_type='CP')
     business_id = business.id
@@ -526,3 +518,27 @@ async def test_publish_event():
         }
 
     mock_publish.publish.assert_called_with('entity.events', payload)
+
+
+async def test_worker_pool_db_error_not_acked(mocker):
+    """Assert that a DB error processing a filing on the worker pool is raised, so the message isn't acked."""
+    import json
+    from sqlalchemy.exc import OperationalError
+    from entity_filer import worker
+    from entity_filer.worker_pool import PartitionedWorkerPool
+
+    async def db_down(filing_msg, flask_app):
+        raise OperationalError('select', {}, Exception('db down'))
+
+    class Msg():
+        sequence = 1
+        data = json.dumps({'filing': {'id': 1}}).encode('utf-8')
+
+    pool = PartitionedWorkerPool(max_workers=2)
+    mocker.patch.object(worker, 'worker_pool', pool)
+    mocker.patch.object(worker, 'get_partition_key', return_value='business:1')
+    mocker.patch.object(worker, 'process_filing', side_effect=db_down)
+
+    with pytest.raises(OperationalError):
+        await worker.cb_subscription_handler(Msg())
+    pool.shutdown()
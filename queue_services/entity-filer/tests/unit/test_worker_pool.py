@@ -0,0 +1,113 @@
+# Copyright © 2022 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Suite to ensure the partitioned worker pool is working as expected."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from entity_filer.worker_pool import PartitionedWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_same_partition_runs_in_order():
+    """Assert that the work for one partition runs one at a time, in the order it was submitted."""
+    pool = PartitionedWorkerPool(max_workers=4)
+    running = []
+    done = []
+    lock = threading.Lock()
+
+    def work(item):
+        with lock:
+            running.append(item)
+            assert len(running) == 1
+        time.sleep(0.01)
+        with lock:
+            running.remove(item)
+            done.append(item)
+
+    for item in range(8):
+        await pool.submit('business:1', work, item)
+    await pool.join()
+    pool.shutdown()
+
+    assert done == list(range(8))
+
+
+@pytest.mark.asyncio
+async def test_partitions_run_in_parallel():
+    """Assert that the work for different partitions runs concurrently, bounded by the pool size."""
+    pool = PartitionedWorkerPool(max_workers=4)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(_):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+
+    start = time.perf_counter()
+    for business_id in range(8):
+        await pool.submit(f'business:{business_id}', work, business_id)
+    await pool.join()
+    elapsed = time.perf_counter() - start
+    pool.shutdown()
+
+    assert max(peak) == 4
+    assert elapsed < 8 * 0.05
+
+
+@pytest.mark.asyncio
+async def test_failure_does_not_block_partition():
+    """Assert that a failed piece of work doesn't stop the next one for the same partition."""
+    pool = PartitionedWorkerPool(max_workers=2)
+    done = []
+
+    def fail():
+        raise ValueError('boom')
+
+    failed = await pool.submit('business:1', fail)
+    await pool.submit('business:1', done.append, 'next')
+    await pool.join()
+    pool.shutdown()
+
+    assert isinstance(failed.exception(), ValueError)
+    assert done == ['next']
+
+
+@pytest.mark.asyncio
+async def test_submit_in_order():
+    """Assert that work is submitted in call order, however long each key lookup takes."""
+    pool = PartitionedWorkerPool(max_workers=4)
+    done = []
+
+    def get_key(item, delay):
+        time.sleep(delay)
+        return 'business:1'
+
+    def work(item, _):
+        done.append(item)
+
+    calls = [asyncio.ensure_future(pool.submit_in_order(get_key, work, item, delay))
+             for item, delay in enumerate((0.05, 0.0, 0.02))]
+    await asyncio.gather(*calls)
+    await pool.join()
+    pool.shutdown()
+
+    assert done == [0, 1, 2]
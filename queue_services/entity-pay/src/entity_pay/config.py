@@ -90,7 +90,12 @@ class _Config():  # pylint: disable=too-few-public-methods
         'subject': os.getenv('NATS_SUBJECT', 'entity.filings'),
         'queue': os.getenv('NATS_QUEUE', 'filing-worker'),
         'durable_name': os.getenv('NATS_QUEUE', 'filing-worker') + '_durable',
+        # with manual acks up to max_inflight messages are handled at once, each one acked once it is handled
+        'manual_acks': os.getenv('NATS_MANUAL_ACKS', 'False').lower() == 'true',
+        'max_inflight': int(os.getenv('NATS_MAX_INFLIGHT', '1')),
+        'ack_wait': int(os.getenv('NATS_ACK_WAIT', '30')),
     }
+    NATS_DRAIN_TIMEOUT = int(os.getenv('NATS_DRAIN_TIMEOUT', '30'))
 
     FILER_PUBLISH_OPTIONS = {
         'subject': os.getenv('NATS_FILER_SUBJECT', 'entity.filing.filer'),